@@ -1,10 +1,20 @@
 import streamlit as st
 import pandas as pd
+import hashlib
+import io
 import sys
 import os
+import uuid
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from data_loader import load_connections
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.connection_query import ConnectionIndex
+from src.connection_store import ConnectionStore
+from src.data_loader import load_connection_sources
+from src.graph_builder import build_connection_graph
+from src.jobs import JobManager
+from src.network_metrics import compute_basic_metrics, get_top_connectors, detect_communities, compute_closeness_centrality
+from src.reach import compute_second_degree_reach
+from src.visualization import compute_layout, render_network, LARGE_GRAPH_NODES
 
 st.set_page_config(
     page_title="StrongTies: Professional Social Graph",
@@ -12,6 +22,304 @@ st.set_page_config(
     page_icon="🤝"
 )
 
+def upload_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest of an uploaded file's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+def group_digest(uploads: dict) -> str:
+    """Return a digest identifying a set of uploads by user id and content."""
+    h = hashlib.sha256()
+    for user, data in sorted(uploads.items()):
+        h.update(f"{user}:{upload_digest(data)};".encode("utf-8"))
+    return h.hexdigest()
+
+# Optional local SQLite store (see scripts/strongties.py store); saving to it is opt-in
+STORE_PATH = os.environ.get(
+    "STRONGTIES_DB",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "results", "strongties.db"))
+)
+
+def user_id_from_filename(filename: str) -> str:
+    """Infer a user identifier from an upload name, e.g. alice_connections.csv -> alice."""
+    if filename.endswith("_connections.csv"):
+        return filename.replace("_connections.csv", "")
+    return filename.replace(".csv", "")
+
+def unique_user_ids(filenames: list) -> list:
+    """
+    Infer one user identifier per upload, suffixing repeats (alice, alice_2, ...)
+    so files that map to the same identifier (alice.csv, alice_connections.csv)
+    don't overwrite each other.
+    """
+    user_ids = []
+    for filename in filenames:
+        base = user_id_from_filename(filename)
+        user_id, n = base, 1
+        while user_id in user_ids:
+            n += 1
+            user_id = f"{base}_{n}"
+        user_ids.append(user_id)
+    return user_ids
+
+# Each analysis stage is cached by the group digest (the underscore-prefixed
+# arguments are not hashed), so reruns and concurrent sessions reuse results
+# and uploads are read from memory, never from a shared temp file.
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_group(digest: str, _uploads: dict) -> pd.DataFrame:
+    """Load all uploaded files concurrently and merge them."""
+    sources = [(io.BytesIO(data), user) for user, data in sorted(_uploads.items())]
+    return load_connection_sources(sources)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_group_graph(digest: str, _df: pd.DataFrame):
+    """Build the merged group graph (shared read-only across sessions)."""
+    return build_connection_graph(_df, source_col="user_id", target_col="name")
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def group_metrics(digest: str, _G) -> dict:
+    return compute_basic_metrics(_G)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def group_reach(digest: str, _G, members: tuple) -> pd.DataFrame:
+    present = [m for m in members if m in _G]
+    return compute_second_degree_reach(_G, present)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def group_top_connectors(digest: str, _G, top_n: int = 10) -> pd.DataFrame:
+    return pd.DataFrame(get_top_connectors(_G, top_n=top_n), columns=["name", "degree"])
+
+# Slow stages (community detection, centrality, layout) run as background
+# jobs so widget changes never block on them. The manager is shared across
+# sessions and deduplicates jobs by (upload digest, stage), so a finished
+# result is reused by every rerun. Each session submits and cancels as an
+# owner of the job: Cancel hides the job in that session, and only stops it
+# once no other session is waiting for it.
+
+@st.cache_resource
+def job_manager() -> JobManager:
+    return JobManager(max_workers=2)
+
+# Community detection and centrality are library calls without cancellation
+# checks, so they run as process jobs that Cancel terminates; their results
+# are summarized for display when shown.
+
+def community_summary(communities: dict) -> pd.DataFrame:
+    return pd.DataFrame([
+        {"community_id": comm_id, "size": len(members), "members": ", ".join(sorted(members)[:5])}
+        for comm_id, members in sorted(communities.items(), key=lambda x: len(x[1]), reverse=True)
+    ])
+
+def top_central(closeness: dict, top_n: int = 10) -> pd.DataFrame:
+    ranked = sorted(closeness.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    return pd.DataFrame(ranked, columns=["name", "closeness"])
+
+def network_map_job(ctx, G) -> bytes:
+    ctx.update(0.1, "Computing layout...")
+    pos = compute_layout(G, method="multilevel" if G.number_of_nodes() > LARGE_GRAPH_NODES else "spring")
+    ctx.update(0.7, "Drawing network...")
+    fig = render_network(G, pos=pos, dpi=120)
+    ctx.check()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=120)
+    return buffer.getvalue()
+
+# stage -> (label, job function, run in a process, result formatter)
+BACKGROUND_STAGES = {
+    "communities": ("🧩 Communities", detect_communities, True, community_summary),
+    "centrality": ("🎯 Most Central Connections", compute_closeness_centrality, True, top_central),
+    "network_map": ("🗺️ Network Map", network_map_job, False, None)
+}
+
+def session_id() -> str:
+    return st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+def session_status(job_id: str):
+    """Job status as this session sees it: cancelled once it pressed Cancel."""
+    status = job_manager().status(job_id)
+    if job_id in st.session_state.setdefault("cancelled_jobs", set()):
+        return status._replace(state="cancelled", result=None)
+    return status
+
+def ensure_jobs(digest: str, G) -> dict:
+    """Return this session's job id per background stage, submitting missing ones."""
+    manager = job_manager()
+    session_jobs = st.session_state.setdefault("jobs", {})
+    job_ids = {}
+    for stage, (label, fn, use_process, _) in BACKGROUND_STAGES.items():
+        key = (digest, stage)
+        job_id = session_jobs.get(key)
+        if job_id is not None:
+            try:
+                manager.status(job_id)
+            except ValueError:
+                job_id = None  # evicted from the manager; run it again
+        if job_id is None:
+            job_id = manager.submit(fn, G, key=key, name=stage, use_process=use_process, owner=session_id())
+            session_jobs[key] = job_id
+        job_ids[stage] = job_id
+    return job_ids
+
+@st.fragment(run_every=1.0)
+def job_progress(job_ids: dict) -> None:
+    """Poll unfinished jobs; rerun the page once they have all finished."""
+    statuses = {stage: session_status(job_id) for stage, job_id in job_ids.items()}
+    if all(status.finished for status in statuses.values()):
+        st.rerun()
+    for stage, status in statuses.items():
+        if status.finished:
+            continue
+        label = BACKGROUND_STAGES[stage][0]
+        bar_col, button_col = st.columns([4, 1])
+        with bar_col:
+            st.progress(status.progress, text=f"{label}: {status.message or status.state} ({status.seconds:.0f}s)")
+        with button_col:
+            if st.button("Cancel", key=f"cancel_{status.job_id}"):
+                job_manager().cancel(status.job_id, owner=session_id())
+                st.session_state["cancelled_jobs"].add(status.job_id)
+
+def show_job_result(digest: str, stage: str, status) -> None:
+    """Render a finished job's result, or its error/cancellation with a restart button."""
+    if status.state == "done":
+        formatter = BACKGROUND_STAGES[stage][3]
+        result = formatter(status.result) if formatter else status.result
+        if isinstance(result, bytes):
+            st.image(result, use_container_width=True)
+        else:
+            st.dataframe(result, use_container_width=True, hide_index=True)
+        return
+    if status.state == "cancelled":
+        st.warning("Cancelled.")
+    else:
+        st.error(f"❌ {status.error}")
+    if st.button("Restart", key=f"restart_{stage}_{status.job_id}"):
+        st.session_state["jobs"].pop((digest, stage), None)
+        st.session_state["cancelled_jobs"].discard(status.job_id)
+        st.rerun()
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def connection_index(digest: str, _df: pd.DataFrame) -> ConnectionIndex:
+    """Prebuilt filter/sort indexes over the group's connections (shared read-only)."""
+    return ConnectionIndex(_df)
+
+@st.fragment
+def connection_table(digest: str, df: pd.DataFrame, page_size: int = 50) -> None:
+    """
+    Filterable, sortable, paged connection table. Queries run server-side and
+    only the visible page is sent to the browser; widget changes rerun just
+    this fragment.
+    """
+    index = connection_index(digest, df)
+    filter_col1, filter_col2, filter_col3 = st.columns(3)
+    with filter_col1:
+        users = st.multiselect("Member", options=index.values("user_id"), key=f"table_users_{digest}")
+    with filter_col2:
+        company = st.text_input("Company contains", key=f"table_company_{digest}")
+    with filter_col3:
+        position = st.text_input("Position contains", key=f"table_position_{digest}")
+    sort_col1, sort_col2, sort_col3 = st.columns([2, 1, 1])
+    with sort_col1:
+        sort_by = st.selectbox("Sort by", options=index.columns, key=f"table_sort_{digest}")
+    with sort_col2:
+        descending = st.checkbox("Descending", key=f"table_desc_{digest}")
+    with sort_col3:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key=f"table_page_{digest}")
+
+    result = index.query(
+        filters={"user_id": users},
+        contains={"company": company, "position": position},
+        sort_by=sort_by,
+        descending=descending,
+        page=page,
+        page_size=page_size
+    )
+    first = (result.page - 1) * page_size + 1 if result.total else 0
+    st.caption(
+        f"Showing {first}–{first + len(result.rows) - 1 if result.total else 0} of {result.total} "
+        f"matching connections • page {result.page} of {result.pages}"
+    )
+    st.dataframe(result.rows, use_container_width=True, hide_index=True)
+
+@st.cache_resource(show_spinner=False)
+def connection_store(path: str) -> ConnectionStore:
+    """One shared SQLite connection to the local store (queries are serialized)."""
+    return ConnectionStore(path)
+
+@st.fragment
+def store_search(page_size: int = 50) -> None:
+    """
+    Search the saved connection store by company, title words and member.
+    Queries use the store's indexes and full-text title index, so they run
+    in milliseconds without re-reading any CSVs.
+    """
+    store = connection_store(STORE_PATH)
+    search_col1, search_col2, search_col3 = st.columns(3)
+    with search_col1:
+        company = st.text_input("Company", key="store_company", help="Exact company name, e.g. Globex Inc")
+    with search_col2:
+        title = st.text_input("Title words", key="store_title", help="Words in the position title, e.g. product manager")
+    with search_col3:
+        member = st.text_input("Member", key="store_member")
+    filters = {"company": company, "title": title, "user_id": member.strip() or None}
+    total = store.count(**filters)
+    st.caption(f"{total} matching connections in {STORE_PATH}")
+    st.dataframe(store.query(**filters, limit=page_size), use_container_width=True, hide_index=True)
+
+def render_group_analysis(digest: str, uploads: dict, user_id: str) -> None:
+    """
+    Run the group analysis stage by stage, writing each result to the page as
+    soon as it is ready: rows loaded -> graph stats -> top connectors. Slower
+    stages (communities, centrality, network map) run as background jobs.
+    """
+    metric_col1, metric_col2, metric_col3 = st.columns(3)
+
+    with st.spinner(f"Loading {len(uploads)} file(s)..."):
+        df = load_group(digest, uploads)
+    st.success(f"✅ Loaded {len(df)} connections from {len(uploads)} file(s)!")
+    with metric_col1:
+        st.metric("Total Connections", len(df))
+
+    with st.spinner("Building your group's network graph..."):
+        G = build_group_graph(digest, df)
+        metrics = group_metrics(digest, G)
+    with metric_col2:
+        st.metric("Network Nodes", metrics["num_nodes"])
+    st.caption(
+        f"{metrics['num_edges']} edges • average degree {metrics['avg_degree']:.2f} • "
+        f"density {metrics['density']:.4f}"
+    )
+
+    with st.spinner("Finding introduction paths..."):
+        reach = group_reach(digest, G, tuple(sorted(uploads)))
+    with metric_col3:
+        own = reach[reach["user_id"] == user_id]
+        st.metric(
+            "Introduction Paths",
+            int(own["second_degree"].iloc[0]) if not own.empty else 0,
+            help="People you can reach through exactly one intermediary"
+        )
+
+    st.markdown("### 🔗 Top Connectors")
+    with st.spinner("Ranking connectors..."):
+        st.dataframe(group_top_connectors(digest, G), use_container_width=True, hide_index=True)
+
+    # Background stages: show finished results now, poll the rest
+    job_ids = ensure_jobs(digest, G)
+    statuses = {stage: session_status(job_id) for stage, job_id in job_ids.items()}
+    pending = {stage: job_ids[stage] for stage, status in statuses.items() if not status.finished}
+    if pending:
+        job_progress(pending)
+    for stage, status in statuses.items():
+        if status.finished:
+            st.markdown(f"### {BACKGROUND_STAGES[stage][0]}")
+            show_job_result(digest, stage, status)
+
+    st.markdown("### 📊 Your Group's Connections")
+    connection_table(digest, df)
+    if st.button("💾 Save to local store", help=f"Store these connections in {STORE_PATH} for fast searches"):
+        connection_store(STORE_PATH).load(df, source_digest=digest)
+        st.success(f"✅ Saved {len(df)} connections to {STORE_PATH}")
+
 def main():
     st.markdown(
         """
@@ -160,18 +468,18 @@ def main():
 
         user_id = None
         available_users = []
-
+        uploads = {}
         if uploaded_files:
             # Extract user identifiers from file name prefixes
-            for file in uploaded_files:
-                filename = file.name
-                if filename.endswith("_connections.csv"):
-                    prefix = filename.replace("_connections.csv", "")
-                    available_users.append(prefix)
-                elif filename.endswith(".csv"):
-                    prefix = filename.replace(".csv", "")
-                    available_users.append(prefix)
-            available_users = list(set(available_users))  # Remove duplicates
+            csv_files = [file for file in uploaded_files if file.name.endswith(".csv")]
+            for file, file_user in zip(csv_files, unique_user_ids([file.name for file in csv_files])):
+                if file_user != user_id_from_filename(file.name):
+                    st.warning(
+                        f"⚠️ {file.name} maps to the same identifier as another upload; "
+                        f"its connections are listed as '{file_user}'."
+                    )
+                uploads[file_user] = file.getvalue()
+            available_users = sorted(uploads)
 
             if available_users:
                 user_id = st.selectbox(
@@ -180,45 +488,22 @@ def main():
                     help="Select your identifier (from file name prefix) to analyze your network"
                 )
 
-        if uploaded_files and user_id:
+        if uploads and user_id:
             st.markdown("")  # spacing
+            digest = group_digest(uploads)
             if st.button("🚀 Analyze Network", use_container_width=True):
-                with st.spinner("Processing your network..."):
-                    try:
-                        # Find the file matching the selected user_id
-                        selected_file = None
-                        for file in uploaded_files:
-                            filename = file.name
-                            if filename.startswith(user_id):
-                                selected_file = file
-                                break
-                        if not selected_file:
-                            st.error("Could not find a file for the selected identifier.")
-                        else:
-                            temp_path = os.path.join("temp_uploaded.csv")
-                            with open(temp_path, "wb") as f:
-                                f.write(selected_file.getbuffer())
-                            df = load_connections(temp_path, user_id)
-
-                            st.success(f"✅ Successfully loaded {len(df)} connections for {user_id}!")
-
-                            # Display metrics
-                            metric_col1, metric_col2, metric_col3 = st.columns(3)
-                            with metric_col1:
-                                st.metric("Total Connections", len(df))
-                            with metric_col2:
-                                st.metric("Network Nodes", "Coming Soon")
-                            with metric_col3:
-                                st.metric("Introduction Paths", "Coming Soon")
-
-                            st.markdown("### 📊 Your Connections")
-                            st.dataframe(df, use_container_width=True, height=400)
-
-                            os.remove(temp_path)
-                    except Exception as e:
-                        st.error(f"❌ Error loading CSV: {e}")
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
+                st.session_state["analysis_key"] = digest
+
+            # Keep showing the last analysis across reruns while the uploads are unchanged
+            if st.session_state.get("analysis_key") == digest:
+                try:
+                    render_group_analysis(digest, uploads, user_id)
+                except Exception as e:
+                    st.error(f"❌ Error analyzing network: {e}")
+
+        if os.path.exists(STORE_PATH):
+            st.markdown("### 🗄️ Search Saved Connections")
+            store_search()
     
     with col2:
         with st.expander("🎯 How It Works", expanded=True):
@@ -241,8 +526,8 @@ def main():
                     <div style="font-weight: 600; margin-bottom: 0.5rem; color: #2d3748;">✨ Features</div>
                     <div class="feature-item">🔒 <strong>100% Private</strong> - All data stays local</div>
                     <div class="feature-item">🎯 <strong>Smart Analysis</strong> - Find the best paths</div>
-                    <div class="feature-item">📊 <strong>Visual Insights</strong> - Coming soon</div>
-                    <div class="feature-item">📈 <strong>Network Metrics</strong> - Coming soon</div>
+                    <div class="feature-item">📊 <strong>Visual Insights</strong> - Network map, communities and central connections</div>
+                    <div class="feature-item">📈 <strong>Network Metrics</strong> - Graph size, density, reach and top connectors</div>
                 </div>
                 """,
                 unsafe_allow_html=True
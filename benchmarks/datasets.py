@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+datasets.py
+
+Reproducible synthetic group datasets for the benchmark suite.
+
+A dataset is one connections CSV per member, named ``<user>_connections.csv``
+like real uploads, written by ``generate_group_dataset`` from a fixed seed
+so every run and every machine benchmarks identical inputs. Datasets are
+cached on disk by scale, seed and generator version and only generated once.
+
+Functions:
+    parse_scale(scale: str) -> int
+    users_for_rows(rows: int) -> int
+    generate_dataset(output_dir: str, rows: int, users: int = None, seed: int = 0, workers: int = None) -> dict
+    ensure_dataset(scale: str, cache_dir: str, seed: int = 0) -> str
+"""
+
+import json
+import os
+from typing import Dict, Optional
+import numpy as np
+from src.generate_sample_connections import generate_group_dataset
+
+SCALES = ("1k", "10k", "100k", "1m", "10m")
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+_CHUNK_ROWS = 500_000
+# Bump when the generator's output changes so stale cached datasets are not reused
+DATASET_VERSION = 2
+
+def parse_scale(scale: str) -> int:
+    """Convert a scale label such as "100k" or "1m" (or a plain integer) to a row count."""
+    label = str(scale).strip().lower()
+    if label[-1:] in _SUFFIXES:
+        return int(float(label[:-1]) * _SUFFIXES[label[-1]])
+    return int(label)
+
+def users_for_rows(rows: int) -> int:
+    """Default member count for a dataset size: ~10k rows per member, 2 to 100 members."""
+    return int(min(max(rows // 10_000, 2), 100))
+
+def generate_dataset(output_dir: str, rows: int, users: Optional[int] = None, seed: int = 0, workers: Optional[int] = None) -> Dict:
+    """
+    Write a synthetic group dataset with overlapping contacts across members.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory for the per-member CSVs.
+    rows : int
+        Total number of connection rows across members.
+    users : Optional[int]
+        Number of members (default: ``users_for_rows(rows)``).
+    seed : int
+        Random seed.
+    workers : Optional[int]
+        Generator worker processes (default: all cores).
+
+    Returns
+    -------
+    dict
+        Dataset description: rows, users, seed and file names.
+    """
+    users = users or users_for_rows(rows)
+    per_user = np.full(users, rows // users)
+    per_user[:rows % users] += 1
+    manifest = generate_group_dataset(
+        output_dir,
+        [f"user{u:03d}" for u in range(users)],
+        rows_per_user=per_user.tolist(),
+        overlap=0.2,
+        chunk_rows=_CHUNK_ROWS,
+        workers=workers,
+        seed=seed
+    )
+    return {
+        "rows": int(rows),
+        "users": int(users),
+        "seed": int(seed),
+        "files": [os.path.basename(path) for path in manifest["files"]]
+    }
+
+def ensure_dataset(scale: str, cache_dir: str, seed: int = 0) -> str:
+    """
+    Return the directory of the dataset for ``scale``, generating it on first use.
+
+    Parameters
+    ----------
+    scale : str
+        Scale label, e.g. "10k".
+    cache_dir : str
+        Root directory for cached datasets.
+    seed : int
+        Random seed.
+
+    Returns
+    -------
+    str
+        Directory containing the member CSVs.
+    """
+    rows = parse_scale(scale)
+    output_dir = os.path.join(cache_dir, f"{scale}-seed{seed}-v{DATASET_VERSION}")
+    meta_path = os.path.join(output_dir, "dataset.json")
+    if os.path.exists(meta_path):
+        return output_dir
+    meta = generate_dataset(output_dir, rows, seed=seed)
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    return output_dir
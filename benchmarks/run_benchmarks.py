@@ -0,0 +1,324 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+run_benchmarks.py
+
+Benchmarks the StrongTies hot paths on synthetic group datasets.
+
+For each scale the suite loads the dataset (ingestion, sanitization and
+normalization), builds the graph and the interned adjacency, runs each
+metric and computes a layout. Stage timings and peak memory come from the
+``src.profiling`` spans, so the benchmark measures exactly what ``--profile``
+reports. Each run is appended to a JSON history file and, if a baseline has
+been saved, compared against it stage by stage.
+
+Everything runs offline and on the CPU. Stages that are impractical at a
+scale (greedy community detection, full layout) are skipped above a node
+cap and recorded as skipped.
+
+Usage:
+    python benchmarks/run_benchmarks.py --scales 1k 10k 100k
+    python benchmarks/run_benchmarks.py --scales 1k 10k --save_baseline
+    python benchmarks/run_benchmarks.py --scales 1m 10m --fail_on_regression
+
+Functions:
+    benchmark_scale(scale: str, data_dir: str, repeat: int = 1, ...) -> dict
+    run_suite(scales: list, data_dir: str, repeat: int = 1, ...) -> dict
+    compare_runs(current: dict, baseline: dict, tolerance: float = 0.25, min_seconds: float = 0.05) -> pd.DataFrame
+"""
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+import pandas as pd
+
+from benchmarks.datasets import SCALES, ensure_dataset, parse_scale
+from src.data_loader import load_all_connections
+from src.graph_builder import build_adjacency, build_connection_graph
+from src.network_metrics import (
+    compute_basic_metrics, get_top_connectors, detect_communities,
+    compute_sampled_centrality
+)
+from src.profiling import disable_profiling, enable_profiling, summarize_trace
+from src.utils import configure_logging
+from src.visualization import compute_layout
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_DIR = os.path.join(BENCH_DIR, ".data")
+DEFAULT_HISTORY = os.path.join(BENCH_DIR, "results", "history.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "results", "baseline.json")
+
+# Spans reported per scale, in pipeline order
+STAGES = [
+    "load_all_connections", "sanitize_csv", "normalize_names", "clean_company_name",
+    "standardize_position_title", "build_connection_graph", "build_adjacency",
+    "compute_basic_metrics", "get_top_connectors", "compute_sampled_centrality",
+    "detect_communities", "compute_layout"
+]
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _profiled(fn: Callable) -> List[Dict]:
+    """Run ``fn`` with profiling enabled and return its per-stage summary rows."""
+    enable_profiling()
+    try:
+        fn()
+    finally:
+        disable_profiling()
+    return summarize_trace().to_dict(orient="records")
+
+def benchmark_scale(
+    scale: str,
+    data_dir: str,
+    repeat: int = 1,
+    seed: int = 0,
+    centrality_samples: int = 64,
+    max_community_nodes: int = 2_000,
+    max_layout_nodes: int = 200_000
+) -> Dict:
+    """
+    Benchmark every stage on one dataset scale.
+
+    Parameters
+    ----------
+    scale : str
+        Dataset scale label, e.g. "100k".
+    data_dir : str
+        Cache directory for generated datasets.
+    repeat : int
+        Number of runs; the fastest wall time per stage is kept.
+    seed : int
+        Dataset seed.
+    centrality_samples : int
+        BFS pivots for the sampled centrality estimates.
+    max_community_nodes : int
+        Skip community detection above this many nodes.
+    max_layout_nodes : int
+        Skip layout above this many nodes.
+
+    Returns
+    -------
+    dict
+        rows, users, nodes, edges, and per-stage wall_s, cpu_s and rss_peak_mb
+        (or ``{"skipped": reason}``).
+    """
+    dataset = ensure_dataset(scale, data_dir, seed=seed)
+    with open(os.path.join(dataset, "dataset.json")) as f:
+        meta = json.load(f)
+    stages: Dict[str, Dict] = {}
+    result = {"rows": meta["rows"], "users": meta["users"]}
+
+    for _ in range(max(repeat, 1)):
+        state = {}
+
+        def pipeline():
+            df = load_all_connections(dataset)
+            G = build_connection_graph(df, source_col="user_id", target_col="name")
+            state.update(nodes=G.number_of_nodes(), edges=G.number_of_edges())
+            build_adjacency(G)
+            compute_basic_metrics(G)
+            get_top_connectors(G)
+            compute_sampled_centrality(G, sample_size=centrality_samples)
+            if G.number_of_nodes() <= max_community_nodes:
+                detect_communities(G)
+            if G.number_of_nodes() <= max_layout_nodes:
+                compute_layout(G, method="multilevel", iterations=10)
+
+        for row in _profiled(pipeline):
+            if row["stage"] not in STAGES:
+                continue
+            best = stages.get(row["stage"])
+            if best is None or row["wall_s"] < best["wall_s"]:
+                stages[row["stage"]] = {
+                    "wall_s": round(row["wall_s"], 4),
+                    "cpu_s": round(row["cpu_s"], 4),
+                    "rss_peak_mb": row["rss_peak_mb"]
+                }
+        result.update(state)
+
+    if result["nodes"] > max_community_nodes:
+        stages["detect_communities"] = {"skipped": f"more than {max_community_nodes} nodes"}
+    if result["nodes"] > max_layout_nodes:
+        stages["compute_layout"] = {"skipped": f"more than {max_layout_nodes} nodes"}
+    result["stages"] = {stage: stages[stage] for stage in STAGES if stage in stages}
+    return result
+
+def run_suite(scales: Sequence[str], data_dir: str, repeat: int = 1, seed: int = 0, **options) -> Dict:
+    """
+    Benchmark several scales and return one history record.
+
+    Parameters
+    ----------
+    scales : Sequence[str]
+        Scale labels, smallest first.
+    data_dir : str
+        Cache directory for generated datasets.
+    repeat : int
+        Runs per scale.
+    seed : int
+        Dataset seed.
+    **options
+        Passed to ``benchmark_scale``.
+
+    Returns
+    -------
+    dict
+        Run metadata (time, commit, machine) and per-scale results.
+    """
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "scales": {}
+    }
+    for scale in sorted(scales, key=parse_scale):
+        print(f"Benchmarking {scale} rows...")
+        record["scales"][scale] = benchmark_scale(scale, data_dir, repeat=repeat, seed=seed, **options)
+    return record
+
+def compare_runs(current: Dict, baseline: Dict, tolerance: float = 0.25, min_seconds: float = 0.05) -> pd.DataFrame:
+    """
+    Compare a run against a baseline, stage by stage.
+
+    Parameters
+    ----------
+    current : dict
+        Record from ``run_suite``.
+    baseline : dict
+        Earlier record to compare against.
+    tolerance : float
+        Relative slowdown (e.g. 0.25 = 25%) beyond which a stage is a regression.
+    min_seconds : float
+        Absolute slowdowns below this are ignored as noise.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (scale, stage) present in both runs, with baseline and
+        current wall time, ratio and status ("ok", "regression", "improved").
+    """
+    rows = []
+    for scale, result in current["scales"].items():
+        base_stages = baseline.get("scales", {}).get(scale, {}).get("stages", {})
+        for stage, timing in result["stages"].items():
+            base = base_stages.get(stage, {})
+            if "wall_s" not in timing or "wall_s" not in base:
+                continue
+            ratio = timing["wall_s"] / base["wall_s"] if base["wall_s"] > 0 else float("inf")
+            delta = timing["wall_s"] - base["wall_s"]
+            status = "ok"
+            if ratio > 1 + tolerance and delta > min_seconds:
+                status = "regression"
+            elif ratio < 1 - tolerance and -delta > min_seconds:
+                status = "improved"
+            rows.append({
+                "scale": scale,
+                "stage": stage,
+                "baseline_s": base["wall_s"],
+                "current_s": timing["wall_s"],
+                "ratio": round(ratio, 3),
+                "status": status
+            })
+    return pd.DataFrame(rows, columns=["scale", "stage", "baseline_s", "current_s", "ratio", "status"])
+
+def _load_json(path: str, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+def _write_json(path: str, data) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+def main(
+    scales: Sequence[str],
+    data_dir: str = DEFAULT_DATA_DIR,
+    history_path: str = DEFAULT_HISTORY,
+    baseline_path: str = DEFAULT_BASELINE,
+    repeat: int = 1,
+    seed: int = 0,
+    save_baseline: bool = False,
+    tolerance: float = 0.25,
+    **options
+) -> int:
+    """
+    Run the suite, append to the history file and report against the baseline.
+
+    Returns
+    -------
+    int
+        Number of regressions found.
+    """
+    record = run_suite(scales, data_dir, repeat=repeat, seed=seed, **options)
+    history = _load_json(history_path, [])
+    history.append(record)
+    _write_json(history_path, history)
+    print(f"Results appended to {history_path}")
+
+    for scale, result in record["scales"].items():
+        print(f"\n{scale}: {result['rows']} rows, {result['users']} users, {result['nodes']} nodes, {result['edges']} edges")
+        table = pd.DataFrame([{"stage": stage, **timing} for stage, timing in result["stages"].items()])
+        print(table.to_string(index=False))
+
+    regressions = 0
+    baseline = _load_json(baseline_path, None)
+    if baseline is not None:
+        report = compare_runs(record, baseline, tolerance=tolerance)
+        regressions = int((report["status"] == "regression").sum())
+        print(f"\nComparison against baseline {baseline_path} (commit {baseline.get('commit')}):")
+        print(report.to_string(index=False) if not report.empty else "No overlapping stages.")
+        print(f"{regressions} regression(s) beyond {tolerance:.0%}")
+    if save_baseline:
+        _write_json(baseline_path, record)
+        print(f"Baseline saved to {baseline_path}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark StrongTies on synthetic datasets."
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        default=["1k", "10k", "100k"],
+        help=f"Dataset scales in rows, e.g. {' '.join(SCALES)}"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scale (fastest is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Dataset seed")
+    parser.add_argument("--data_dir", type=str, default=DEFAULT_DATA_DIR, help="Cache directory for generated datasets")
+    parser.add_argument("--history", type=str, default=DEFAULT_HISTORY, help="JSON history file to append to")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save_baseline", action="store_true", help="Save this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Relative slowdown reported as a regression")
+    parser.add_argument("--centrality_samples", type=int, default=64, help="BFS pivots for centrality estimates")
+    parser.add_argument("--max_community_nodes", type=int, default=2_000, help="Skip community detection above this size")
+    parser.add_argument("--max_layout_nodes", type=int, default=200_000, help="Skip layout above this size")
+    parser.add_argument("--fail_on_regression", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+    configure_logging()
+    regressions = main(
+        args.scales, args.data_dir, args.history, args.baseline, repeat=args.repeat, seed=args.seed,
+        save_baseline=args.save_baseline, tolerance=args.tolerance,
+        centrality_samples=args.centrality_samples, max_community_nodes=args.max_community_nodes,
+        max_layout_nodes=args.max_layout_nodes
+    )
+    sys.exit(1 if regressions and args.fail_on_regression else 0)
@@ -3,16 +3,28 @@
 import sys
 import os
 import argparse
+import tempfile
+from typing import Optional
 import networkx as nx
 
 # Add the project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.company_aliases import load_company_aliases
 from src.target_preferences import TargetPreferences
-from src.data_loader import load_all_connections
-from src.graph_builder import build_connection_graph
+from src.data_loader import load_all_connections, load_connections_partitioned
+from src.graph_builder import build_connection_graph, build_graph_from_chunks
+from src.memory_budget import MemoryBudget
+from src.profiling import disable_profiling, enable_profiling, span, write_trace
+from src.utils import configure_logging
 
-def main(data_dir: str, output_path: str, targets_path: str = None) -> None:
+def main(
+    data_dir: str,
+    output_path: str,
+    targets_path: str = None,
+    memory_limit: str = None,
+    alias_threshold: Optional[float] = 0.75
+) -> None:
     """
     Construct a professional social graph from user connection data and save as GraphML.
 
@@ -24,13 +36,27 @@ def main(data_dir: str, output_path: str, targets_path: str = None) -> None:
         Path to save the output GraphML file.
     targets_path : str, optional
         Path to JSON file with target companies and roles.
+    memory_limit : str, optional
+        Memory budget such as "2GB"; connections are then loaded in
+        partitions that spill to Parquet, and the graph is built from them.
+    alias_threshold : Optional[float]
+        Similarity at which company name variants are merged (see
+        ``load_company_aliases``); None keeps company names as cleaned.
 
     Returns
     -------
     None
     """
-    df = load_all_connections(data_dir)
+    aliases = None
+    if alias_threshold is not None:
+        aliases = load_company_aliases(data_dir, cache_path=aliases_cache_path(output_path), threshold=alias_threshold)
+    if memory_limit:
+        return _main_partitioned(data_dir, output_path, targets_path, MemoryBudget(memory_limit), aliases)
+    df = load_all_connections(data_dir, aliases=aliases)
     G = build_connection_graph(df, source_col="user_id", target_col="name")
+    if not df.empty:
+        # Flag group members so analysis can tell them apart from their contacts
+        nx.set_node_attributes(G, {str(user): True for user in df["user_id"].unique()}, "is_member")
 
     # Load target preferences if provided
     target_prefs = None
@@ -39,22 +65,73 @@ def main(data_dir: str, output_path: str, targets_path: str = None) -> None:
         with open(targets_path, "r") as f:
             prefs = json.load(f)
         target_prefs = TargetPreferences(prefs.get("companies", []), prefs.get("roles", []))
+        matcher = target_prefs.compile(aliases)
 
-        # Annotate nodes with target match info
-        for node, data in G.nodes(data=True):
-            if target_prefs.matches(data):
-                G.nodes[node]["is_target"] = True
-            else:
-                G.nodes[node]["is_target"] = False
+        # Annotate nodes with target match info, matching all connections at once
+        with span("annotate_targets", rows=len(df), nodes=G.number_of_nodes()):
+            target_names = set()
+            if not df.empty:
+                target_names = set(df.loc[matcher.match_frame(df), "name"].astype(str))
+            node_matches = matcher.match_nodes(G)
+            nx.set_node_attributes(
+                G,
+                {node: bool(hit) or node in target_names for node, hit in zip(G.nodes(), node_matches)},
+                "is_target"
+            )
 
     print(f"Graph has {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.")
+    write_graph(G, output_path)
 
+def aliases_cache_path(output_path: str) -> str:
+    """Company alias map cache, next to the pipeline cache in the output's directory."""
+    return os.path.join(os.path.dirname(os.path.abspath(output_path)), ".cache", "company_aliases.json")
+
+def _main_partitioned(data_dir: str, output_path: str, targets_path: str, budget: MemoryBudget, aliases) -> None:
+    """Build the graph like ``main`` without holding all connections in memory at once."""
+    matcher = None
+    if targets_path and os.path.exists(targets_path):
+        import json
+        with open(targets_path, "r") as f:
+            prefs = json.load(f)
+        matcher = TargetPreferences(prefs.get("companies", []), prefs.get("roles", [])).compile(aliases)
+
+    with tempfile.TemporaryDirectory(prefix="strongties-spill-") as spill_dir:
+        with budget.track("load_connections"):
+            frame = load_connections_partitioned(data_dir, spill_dir, budget, aliases=aliases)
+        print(f"Loaded {frame.rows} connections ({len(frame.paths)} partitions spilled to disk)")
+
+        members, target_names = set(), set()
+        def chunks():
+            for chunk in frame.chunks():
+                members.update(chunk["user_id"].unique())
+                if matcher:
+                    target_names.update(chunk.loc[matcher.match_frame(chunk), "name"].astype(str))
+                yield chunk
+        with budget.track("build_graph"):
+            G = build_graph_from_chunks(chunks(), source_col="user_id", target_col="name")
+            nx.set_node_attributes(G, {str(user): True for user in members}, "is_member")
+            if matcher:
+                nx.set_node_attributes(
+                    G,
+                    {node: bool(hit) or node in target_names for node, hit in zip(G.nodes(), matcher.match_nodes(G))},
+                    "is_target"
+                )
+
+    print(f"Graph has {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.")
+    with budget.track("write_graph"):
+        write_graph(G, output_path)
+    for stage, peak_mb in budget.peaks().items():
+        print(f"  {stage}: peak {peak_mb:.1f} MB (budget {budget.limit / 2**20:.0f} MB)")
+
+def write_graph(G: nx.Graph, output_path: str) -> None:
+    """Write the graph as GraphML, creating the results directory if needed."""
     # Ensure the results directory exists
     results_dir = os.path.dirname(output_path)
     if results_dir and not os.path.exists(results_dir):
         os.makedirs(results_dir, exist_ok=True)
 
-    nx.write_graphml(G, output_path)
+    with span("write_graphml", nodes=G.number_of_nodes(), edges=G.number_of_edges()):
+        nx.write_graphml(G, output_path)
     print(f"Graph saved to {output_path}")
 
 if __name__ == "__main__":
@@ -79,5 +156,42 @@ if __name__ == "__main__":
         default=None,
         help="Path to JSON file with target companies and roles"
     )
+    parser.add_argument(
+        "--memory_limit",
+        type=str,
+        default=None,
+        help="Memory budget, e.g. 2GB: load in partitions that spill to Parquet and report peak memory"
+    )
+    parser.add_argument(
+        "--alias_threshold",
+        type=float,
+        default=0.75,
+        help="Character n-gram similarity at which company name variants are merged (1.0: suffix stripping only)"
+    )
+    parser.add_argument(
+        "--no_aliases",
+        action="store_true",
+        help="Do not merge company name variants"
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="results/profile/graph_construction.json",
+        default=None,
+        help="Record stage timings and memory; write a JSON trace (default path if no value) and print a summary"
+    )
     args = parser.parse_args()
-    main(args.data_dir, args.output, args.targets)
\ No newline at end of file
+    configure_logging()
+    if args.profile:
+        enable_profiling()
+    with span("graph_construction"):
+        main(
+            args.data_dir, args.output, args.targets, args.memory_limit,
+            alias_threshold=None if args.no_aliases else args.alias_threshold
+        )
+    if args.profile:
+        disable_profiling()
+        summary = write_trace(args.profile)
+        print(f"\nProfile ({args.profile}):")
+        print(summary.to_string(index=False))
\ No newline at end of file
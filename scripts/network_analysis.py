@@ -5,13 +5,28 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import argparse
-import pandas as pd
 import networkx as nx
 from src.target_preferences import TargetPreferences
-
-from src.network_metrics import compute_basic_metrics, get_top_connectors, detect_communities
-
-def main(graph_path: str, output_dir: str, targets_path: str = None) -> None:
+from src.intro_scoring import IntroductionScorer, FEATURES
+
+from src.network_metrics import (
+    compute_basic_metrics, get_top_connectors, detect_communities,
+    compute_sampled_centrality
+)
+from src.profiling import disable_profiling, enable_profiling, span, write_trace
+from src.reports import write_reports
+from src.utils import configure_logging
+
+def main(
+    graph_path: str,
+    output_dir: str,
+    targets_path: str = None,
+    centrality_samples: int = 256,
+    workers: int = 1,
+    score_weights: dict = None,
+    top_k: int = 50,
+    node_csv: bool = False
+) -> None:
     """
     Analyze a professional social network graph and output metrics, top connectors, and community assignments.
 
@@ -23,6 +38,16 @@ def main(graph_path: str, output_dir: str, targets_path: str = None) -> None:
         Directory to save output reports.
     targets_path : str
         Path to JSON file with target companies and roles.
+    centrality_samples : int
+        Number of BFS pivots for the closeness/harmonic estimates.
+    workers : int
+        Number of worker processes for the centrality estimates.
+    score_weights : dict
+        Weight per introduction-score feature (default: DEFAULT_WEIGHTS).
+    top_k : int
+        Number of candidates to write to the introduction score report.
+    node_csv : bool
+        Also write the per-node table as CSV (it is always written as Parquet).
 
     Returns
     -------
@@ -30,7 +55,9 @@ def main(graph_path: str, output_dir: str, targets_path: str = None) -> None:
     """
     # Load the graph
     print(f"Loading graph from {graph_path}...")
-    G = nx.read_graphml(graph_path)
+    with span("read_graphml") as stage:
+        G = nx.read_graphml(graph_path)
+        stage.set(nodes=G.number_of_nodes(), edges=G.number_of_edges())
     print(f"Loaded graph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.")
 
     # Ensure output directory exists
@@ -52,75 +79,73 @@ def main(graph_path: str, output_dir: str, targets_path: str = None) -> None:
     print(f"Average degree: {metrics['avg_degree']:.2f}")
     print(f"Network density: {metrics['density']:.4f}")
 
-    # Save basic metrics
-    metrics_df = pd.DataFrame([metrics])
-    metrics_path = os.path.join(output_dir, "network_metrics.csv")
-    metrics_df.to_csv(metrics_path, index=False)
-    print(f"Basic metrics saved to {metrics_path}")
-
     # Get top connectors
     print("\nIdentifying top connectors...")
     top_connectors = get_top_connectors(G, top_n=20)
-    connectors_df = pd.DataFrame(top_connectors, columns=["name", "degree"])
-    connectors_path = os.path.join(output_dir, "top_connectors.csv")
-    connectors_df.to_csv(connectors_path, index=False)
-    print(f"Top 20 connectors saved to {connectors_path}")
     print("\nTop 10 connectors:")
     for name, degree in top_connectors[:10]:
         print(f"  {name}: {degree} connections")
 
+    # Estimate closeness and harmonic centrality
+    print(f"\nEstimating closeness and harmonic centrality ({centrality_samples} samples, {workers} worker(s))...")
+    closeness, harmonic = compute_sampled_centrality(G, sample_size=centrality_samples, workers=workers)
+    print("\nTop 5 by closeness:")
+    for name, score in sorted(closeness.items(), key=lambda x: x[1], reverse=True)[:5]:
+        print(f"  {name}: {score:.4f} (degree {G.degree(name)})")
+
     # Detect communities
     print("\nDetecting communities...")
     communities = detect_communities(G)
     print(f"Found {len(communities)} communities")
 
-    # Save community information
-    community_data = []
-    for comm_id, members in communities.items():
-        for member in members:
-            community_data.append({"community_id": comm_id, "name": member})
-
-    communities_df = pd.DataFrame(community_data)
-    communities_path = os.path.join(output_dir, "communities.csv")
-    communities_df.to_csv(communities_path, index=False)
-    print(f"Community assignments saved to {communities_path}")
-
     # Print community summary
     print("\nCommunity summary:")
     for comm_id, members in sorted(communities.items(), key=lambda x: len(x[1]), reverse=True)[:5]:
         print(f"  Community {comm_id}: {len(members)} members")
 
+    # Match every node against the targets in one pass; nodes flagged by
+    # graph_construction.py (is_target) also count
+    target_flags = {}
+    if target_prefs:
+        matcher = target_prefs.compile()
+        target_flags = {
+            node: bool(hit) or bool(data.get("is_target", False))
+            for (node, data), hit in zip(G.nodes(data=True), matcher.match_nodes(G))
+        }
+        nx.set_node_attributes(G, target_flags, "is_target")
+
     # Report target matches
     if target_prefs:
         print("\nConnections matching target companies/roles:")
-        target_nodes = []
-        for node, data in G.nodes(data=True):
-            if target_prefs.matches(data):
-                target_nodes.append(node)
+        target_nodes = [node for node in G.nodes() if target_flags[node]]
         if target_nodes:
             print(f"  {len(target_nodes)} connections")
             for node in target_nodes[:10]:
                 print(f"  {node} ({G.nodes[node].get('company', '')}, {G.nodes[node].get('role', '')})")
 
-    # Identify connectors to targets
-    if target_prefs:
-        print("\nRanking connectors by target relevance...")
-        connector_target_matches = []
-        for name, degree in top_connectors:
-            node_data = G.nodes[name]
-            matches_target = target_prefs.matches(node_data)
-            connector_target_matches.append({
-                "name": name,
-                "degree": degree,
-                "matches_target": matches_target,
-                "company": node_data.get("company", ""),
-                "role": node_data.get("role", "")
-            })
-        # Save connectors with target relevance
-        target_connectors_df = pd.DataFrame(connector_target_matches)
-        target_connectors_path = os.path.join(output_dir, "target_connectors.csv")
-        target_connectors_df.to_csv(target_connectors_path, index=False)
-        print(f"Connector relevance to targets saved to {target_connectors_path}")
+    # Write the per-node table and the summary reports in one pass
+    print("\nWriting reports...")
+    report_paths = write_reports(
+        G, output_dir, metrics,
+        communities=communities,
+        centrality={"closeness": closeness, "harmonic": harmonic},
+        top_n=20,
+        csv=node_csv
+    )
+    for name, path in report_paths.items():
+        print(f"  {name}: {path}")
+
+    # Rank every node as a candidate introducer
+    print("\nScoring introduction candidates...")
+    members = [node for node, data in G.nodes(data=True) if data.get("is_member", False)]
+    targets = [node for node, hit in target_flags.items() if hit]
+    scorer = IntroductionScorer(G, members=members, targets=targets, centrality=closeness)
+    ranking = scorer.rank(score_weights, top_k=top_k)
+    ranking_path = os.path.join(output_dir, "introduction_scores.csv")
+    ranking.to_csv(ranking_path, index=False)
+    print(f"Top {len(ranking)} introduction candidates saved to {ranking_path}")
+    for row in ranking.head(5).itertuples():
+        print(f"  {row.name}: {row.score:.3f}")
 
     print(f"\nAnalysis complete. All results saved to {output_dir}")
 
@@ -146,5 +171,57 @@ if __name__ == "__main__":
         default=None,
         help="Path to JSON file with target companies and roles"
     )
+    parser.add_argument(
+        "--centrality_samples",
+        type=int,
+        default=256,
+        help="Number of BFS samples for closeness/harmonic centrality"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for centrality estimation"
+    )
+    parser.add_argument(
+        "--weights",
+        type=str,
+        default=None,
+        help=f"Introduction score weights, e.g. \"target_reach=0.5,degree=0.2\" (features: {', '.join(FEATURES)})"
+    )
+    parser.add_argument(
+        "--top_k",
+        type=int,
+        default=50,
+        help="Number of introduction candidates to report"
+    )
+    parser.add_argument(
+        "--node_csv",
+        action="store_true",
+        help="Also write the per-node table (nodes.parquet) as nodes.csv"
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="results/profile/network_analysis.json",
+        default=None,
+        help="Record stage timings and memory; write a JSON trace (default path if no value) and print a summary"
+    )
     args = parser.parse_args()
-    main(args.graph, args.output_dir, args.targets)
\ No newline at end of file
+    configure_logging()
+    weights = None
+    if args.weights:
+        weights = {key.strip(): float(value) for key, value in (item.split("=") for item in args.weights.split(","))}
+    if args.profile:
+        enable_profiling()
+    with span("network_analysis"):
+        main(
+            args.graph, args.output_dir, args.targets, args.centrality_samples, args.workers,
+            score_weights=weights, top_k=args.top_k, node_csv=args.node_csv
+        )
+    if args.profile:
+        disable_profiling()
+        summary = write_trace(args.profile)
+        print(f"\nProfile ({args.profile}):")
+        print(summary.to_string(index=False))
\ No newline at end of file
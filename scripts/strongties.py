@@ -0,0 +1,395 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import time
+from src.connection_store import ConnectionStore, build_connection_store
+from src.data_loader import load_all_connections
+from src.intro_scoring import FEATURES
+from src.member_overlap import MemberOverlapIndex, choose_bands, jaccard_error_bound
+from src.pipeline import run_strongties
+from src.profiling import disable_profiling, enable_profiling, span, write_trace
+from src.utils import configure_logging
+
+STAGES = ("ingest", "aliases", "sanitize", "graph", "metrics", "reports", "figures")
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Run the full pipeline, skipping stages whose inputs and settings are unchanged.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed ``run`` arguments.
+
+    Returns
+    -------
+    None
+    """
+    targets = None
+    if args.targets and os.path.exists(args.targets):
+        with open(args.targets, "r") as f:
+            prefs = json.load(f)
+        targets = {"companies": prefs.get("companies", []), "roles": prefs.get("roles", [])}
+    weights = None
+    if args.weights:
+        weights = {key.strip(): float(value) for key, value in (item.split("=") for item in args.weights.split(","))}
+
+    results = run_strongties(
+        args.data_dir,
+        args.output_dir,
+        cache_dir=args.cache_dir,
+        until=args.until,
+        force=args.force,
+        memory_limit=args.memory_limit,
+        targets=targets,
+        centrality_samples=args.centrality_samples,
+        workers=args.workers,
+        score_weights=weights,
+        top_k=args.top_k,
+        node_csv=args.node_csv,
+        figure_formats=args.formats,
+        dpi=args.dpi,
+        company_alias_threshold=None if args.no_aliases else args.alias_threshold
+    )
+    for result in results.values():
+        peak = f"  peak {result.peak_mb:8.1f} MB" if result.peak_mb is not None else ""
+        print(f"  {result.name:<9} {result.status:<6} {result.seconds:8.2f}s{peak}  [{result.key}]")
+    print(f"\nResults saved to {args.output_dir}")
+
+def overlap(args: argparse.Namespace) -> None:
+    """
+    Report member pairs whose contact lists overlap the most.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed ``overlap`` arguments.
+
+    Returns
+    -------
+    None
+    """
+    index = MemberOverlapIndex(num_perm=args.num_perm, seed=args.seed, keep_contacts=args.exact)
+    load_all_connections(args.data_dir, overlap=index)
+    bands = args.bands or choose_bands(args.num_perm, args.threshold)[0]
+    bound = jaccard_error_bound(args.num_perm)
+    print(f"{len(index.members)} members, {args.num_perm} hash functions, {bands} bands; "
+          f"estimates are within +/-{bound:.3f} at 95% confidence")
+    pairs = index.overlapping_pairs(threshold=args.threshold, bands=bands, exact=args.exact)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    pairs.to_csv(args.output, index=False)
+    for row in pairs.head(10).itertuples():
+        shared = f", {row.shared_contacts} shared" if args.exact else ""
+        print(f"  {row.user_a} / {row.user_b}: {row.jaccard_estimate:.3f} [{row.jaccard_low:.3f}, {row.jaccard_high:.3f}]{shared}")
+    print(f"\n{len(pairs)} pairs saved to {args.output}")
+
+def store(args: argparse.Namespace) -> None:
+    """
+    Build (or refresh) the SQLite connection store from the connection CSVs.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed ``store`` arguments.
+
+    Returns
+    -------
+    None
+    """
+    start = time.perf_counter()
+    alias_threshold = None if args.no_aliases else args.alias_threshold
+    with build_connection_store(args.data_dir, args.db, rebuild=args.rebuild, alias_threshold=alias_threshold) as connections:
+        print(f"{connections.count()} connections in {args.db} ({time.perf_counter() - start:.2f}s)")
+
+def query(args: argparse.Namespace) -> None:
+    """
+    Query the SQLite connection store.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed ``query`` arguments.
+
+    Returns
+    -------
+    None
+    """
+    if not os.path.exists(args.db):
+        raise ValueError(f"No connection store at {args.db}; build it with `strongties.py store`")
+    filters = {"company": args.company, "position": args.position, "title": args.title, "user_id": args.user, "name": args.name}
+    with ConnectionStore(args.db) as connections:
+        start = time.perf_counter()
+        rows = connections.query(**filters, limit=args.limit)
+        total = connections.count(**filters)
+        elapsed = (time.perf_counter() - start) * 1000
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        rows.to_csv(args.output, index=False)
+    print(rows.to_string(index=False) if not rows.empty else "No matching connections.")
+    print(f"\n{len(rows)} of {total} matching connections ({elapsed:.1f} ms)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="StrongTies command line."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser(
+        "run",
+        help="Run ingest -> sanitize -> graph -> metrics -> reports/figures, reusing cached stages"
+    )
+    run_parser.add_argument(
+        "--data_dir",
+        type=str,
+        default="data",
+        help="Directory containing connection CSV files"
+    )
+    run_parser.add_argument(
+        "--output_dir",
+        type=str,
+        default="results",
+        help="Directory for reports/ and figures/"
+    )
+    run_parser.add_argument(
+        "--cache_dir",
+        type=str,
+        default=None,
+        help="Stage cache directory (default: <output_dir>/.cache)"
+    )
+    run_parser.add_argument(
+        "--targets",
+        type=str,
+        default=None,
+        help="Path to JSON file with target companies and roles"
+    )
+    run_parser.add_argument(
+        "--centrality_samples",
+        type=int,
+        default=256,
+        help="Number of BFS samples for closeness/harmonic centrality"
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for centrality estimation"
+    )
+    run_parser.add_argument(
+        "--weights",
+        type=str,
+        default=None,
+        help=f"Introduction score weights, e.g. \"target_reach=0.5,degree=0.2\" (features: {', '.join(FEATURES)})"
+    )
+    run_parser.add_argument(
+        "--top_k",
+        type=int,
+        default=50,
+        help="Number of introduction candidates to report"
+    )
+    run_parser.add_argument(
+        "--node_csv",
+        action="store_true",
+        help="Also write the per-node table (nodes.parquet) as nodes.csv"
+    )
+    run_parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=["png"],
+        help="Figure formats, e.g. png svg"
+    )
+    run_parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Figure resolution"
+    )
+    run_parser.add_argument(
+        "--memory_limit",
+        type=str,
+        default=None,
+        help="Memory budget, e.g. 2GB: ingest in partitions, spill to Parquet and report peak memory per stage"
+    )
+    run_parser.add_argument(
+        "--until",
+        choices=STAGES,
+        default=None,
+        help="Stop after this stage"
+    )
+    run_parser.add_argument(
+        "--force",
+        nargs="+",
+        choices=STAGES,
+        default=[],
+        help="Rerun these stages (and their dependents) even if cached"
+    )
+    run_parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="results/profile/strongties_run.json",
+        default=None,
+        help="Record stage timings and memory; write a JSON trace (default path if no value) and print a summary"
+    )
+    overlap_parser = commands.add_parser(
+        "overlap",
+        help="Find member pairs with overlapping networks (MinHash + LSH)"
+    )
+    overlap_parser.add_argument(
+        "--data_dir",
+        type=str,
+        default="data",
+        help="Directory containing connection CSV files"
+    )
+    overlap_parser.add_argument(
+        "--output",
+        type=str,
+        default="results/reports/member_overlap.csv",
+        help="Output CSV of overlapping member pairs"
+    )
+    overlap_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.3,
+        help="Minimum Jaccard similarity of two members' contacts"
+    )
+    overlap_parser.add_argument(
+        "--num_perm",
+        type=int,
+        default=128,
+        help="MinHash signature length (more is slower but more accurate)"
+    )
+    overlap_parser.add_argument(
+        "--bands",
+        type=int,
+        default=None,
+        help="LSH bands (default: chosen from the threshold)"
+    )
+    overlap_parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Verify candidate pairs with exact Jaccard and shared contact counts"
+    )
+    overlap_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Hash seed"
+    )
+    overlap_parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="results/profile/strongties_overlap.json",
+        default=None,
+        help="Record stage timings and memory; write a JSON trace (default path if no value) and print a summary"
+    )
+    store_parser = commands.add_parser(
+        "store",
+        help="Build the SQLite connection store for fast repeat queries"
+    )
+    store_parser.add_argument(
+        "--data_dir",
+        type=str,
+        default="data",
+        help="Directory containing connection CSV files"
+    )
+    store_parser.add_argument(
+        "--db",
+        type=str,
+        default="results/strongties.db",
+        help="SQLite database file"
+    )
+    store_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild even if the connection CSVs are unchanged"
+    )
+    for subparser in (run_parser, store_parser):
+        subparser.add_argument(
+            "--alias_threshold",
+            type=float,
+            default=0.75,
+            help="Character n-gram similarity at which company name variants are merged (1.0: suffix stripping only)"
+        )
+        subparser.add_argument(
+            "--no_aliases",
+            action="store_true",
+            help="Do not merge company name variants"
+        )
+    query_parser = commands.add_parser(
+        "query",
+        help="Query the SQLite connection store, e.g. --company Globex --title manager"
+    )
+    query_parser.add_argument(
+        "--db",
+        type=str,
+        default="results/strongties.db",
+        help="SQLite database file"
+    )
+    query_parser.add_argument(
+        "--company",
+        type=str,
+        default=None,
+        help="Company name (normalized, exact match)"
+    )
+    query_parser.add_argument(
+        "--position",
+        type=str,
+        default=None,
+        help="Full position title (normalized, exact match)"
+    )
+    query_parser.add_argument(
+        "--title",
+        type=str,
+        default=None,
+        help="Words to search for in position titles (full-text)"
+    )
+    query_parser.add_argument(
+        "--user",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Only connections of these members"
+    )
+    query_parser.add_argument(
+        "--name",
+        type=str,
+        default=None,
+        help="Part of a connection's name"
+    )
+    query_parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Maximum rows to show"
+    )
+    query_parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Also save the rows to this CSV"
+    )
+    for subparser in (store_parser, query_parser):
+        subparser.add_argument(
+            "--profile",
+            type=str,
+            nargs="?",
+            const=f"results/profile/strongties_{subparser.prog.split()[-1]}.json",
+            default=None,
+            help="Record stage timings and memory; write a JSON trace (default path if no value) and print a summary"
+        )
+    args = parser.parse_args()
+    configure_logging()
+    if args.profile:
+        enable_profiling()
+    with span(f"strongties_{args.command}"):
+        {"run": run, "overlap": overlap, "store": store, "query": query}[args.command](args)
+    if args.profile:
+        disable_profiling()
+        summary = write_trace(args.profile)
+        print(f"\nProfile ({args.profile}):")
+        print(summary.to_string(index=False))
@@ -2,9 +2,62 @@
 """StrongTies core package"""
 __version__ = "0.1.0"
 
-from .data_loader import load_connections, load_all_connections
-from .graph_builder import build_connection_graph
-from .network_metrics import compute_basic_metrics, get_top_connectors, detect_communities
-from .visualization import plot_network, plot_communities
-from .privacy_sanitizer import sanitize_csv, validate_csv_columns
-from .utils import ensure_dir, save_dataframe, clean_company_name, standardize_position_title, generate_node_id
\ No newline at end of file
+# Public names are resolved lazily (PEP 562) so that importing one submodule,
+# e.g. ``src.privacy_sanitizer``, does not pay for matplotlib, networkx or
+# scipy. Each name maps to the submodule that defines it.
+import importlib
+
+_EXPORTS = {
+    "load_connections": "data_loader",
+    "load_all_connections": "data_loader",
+    "load_connections_partitioned": "data_loader",
+    "build_connection_graph": "graph_builder",
+    "build_graph_from_chunks": "graph_builder",
+    "build_adjacency": "graph_builder",
+    "graph_fingerprint": "graph_builder",
+    "compute_basic_metrics": "network_metrics",
+    "get_top_connectors": "network_metrics",
+    "detect_communities": "network_metrics",
+    "compute_harmonic_centrality": "network_metrics",
+    "compute_closeness_centrality": "network_metrics",
+    "compute_sampled_centrality": "network_metrics",
+    "compute_second_degree_reach": "reach",
+    "get_second_degree_contacts": "reach",
+    "compute_company_reach": "reach",
+    "find_k_shortest_paths": "intro_paths",
+    "find_disjoint_paths": "intro_paths",
+    "find_disjoint_paths_many": "intro_paths",
+    "IntroPathFinder": "intro_paths",
+    "SharedAdjacency": "shared_graph",
+    "IntroductionScorer": "intro_scoring",
+    "DEFAULT_WEIGHTS": "intro_scoring",
+    "plot_network": "visualization",
+    "plot_communities": "visualization",
+    "render_network": "visualization",
+    "compute_layout": "visualization",
+    "multilevel_layout": "visualization",
+    "LayoutStore": "visualization",
+    "CompanyAliases": "company_aliases",
+    "strip_company_suffixes": "company_aliases",
+    "load_company_aliases": "company_aliases",
+    "sanitize_csv": "privacy_sanitizer",
+    "validate_csv_columns": "privacy_sanitizer",
+    "ensure_dir": "utils",
+    "save_dataframe": "utils",
+    "clean_company_name": "utils",
+    "standardize_position_title": "utils",
+    "generate_node_id": "utils",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
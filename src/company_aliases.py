@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+company_aliases.py
+
+Canonical company names, so "Acme Corp", "Acme Corporation" and "ACME Inc."
+count as one company and the target "Globex" matches "Globex Inc".
+
+Names are first normalized with ``clean_company_name`` and stripped of
+legal-form suffixes ("inc", "corp", "llc", ...) and a leading "the". The
+distinct stripped names are then clustered by the Jaccard similarity of
+their character n-grams, among names that start with the same characters
+(typos rarely hit the first letters, and this keeps "Costa and Sons" apart
+from "Acosta and Sons"). Candidate pairs come from an inverted n-gram index
+with prefix filtering: each name is indexed only under its rarest n-grams,
+enough that any pair at or above the threshold must share one of them, so
+near-duplicates are found without comparing every pair of names. Each
+cluster's canonical name is its most frequent member.
+
+The resulting alias -> canonical map is applied once per distinct value
+during ingestion and can be cached as JSON next to a digest of the CSVs it
+was built from.
+
+Functions:
+    strip_company_suffixes(name: str) -> str
+    company_ngrams(name: str, n: int = 3) -> Set[str]
+    build_alias_map(companies: Iterable[str], threshold: float = 0.75, n: int = 3) -> Dict[str, str]
+    load_company_aliases(data_dir: str, cache_path: str = None, threshold: float = 0.75) -> CompanyAliases
+
+Classes:
+    CompanyAliases
+"""
+
+import json
+import logging
+import math
+import os
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+import pandas as pd
+from src.utils import clean_company_name
+
+logger = logging.getLogger("strongties")
+
+ALIASES_VERSION = "1"
+
+# Legal forms dropped from the end of a name (after punctuation is removed)
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company", "cos", "companies",
+    "llc", "llp", "lp", "ltd", "limited", "plc", "pllc", "gmbh", "ag", "sa", "sas",
+    "srl", "spa", "bv", "nv", "ab", "oy", "as", "pty", "pte", "kk", "kg"
+})
+
+def strip_company_suffixes(name: str) -> str:
+    """
+    Normalize a company name with ``clean_company_name`` and drop trailing
+    legal-form suffixes and a leading "the", keeping at least one word,
+    e.g. "The Acme Co., Inc." -> "acme".
+    """
+    words = clean_company_name(name).split()
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+def company_ngrams(name: str, n: int = 3) -> Set[str]:
+    """Character n-grams of a name padded with one space on each side."""
+    padded = f" {name} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+def _company_counts(companies: Iterable[str]) -> pd.Series:
+    """Occurrences of each non-empty cleaned company name."""
+    raw = pd.Series(companies, dtype=object).dropna().value_counts()
+    counts = pd.Series(raw.to_numpy(), index=raw.index.map(clean_company_name)).groupby(level=0).sum()
+    return counts[counts.index != ""]
+
+def build_alias_map(companies: Iterable[str], threshold: float = 0.75, n: int = 3) -> Dict[str, str]:
+    """
+    Cluster company names into canonical names.
+
+    Parameters
+    ----------
+    companies : Iterable[str]
+        Company names as they occur (repeats count towards choosing the
+        canonical name); raw or already cleaned.
+    threshold : float
+        Minimum n-gram Jaccard similarity of two suffix-stripped names (with
+        the same first n-gram) to merge them; 1.0 merges only names equal
+        after suffix stripping.
+    n : int
+        n-gram length.
+
+    Returns
+    -------
+    Dict[str, str]
+        Cleaned name (and suffix-stripped name) -> canonical name, for every
+        name whose canonical form differs.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    counts = _company_counts(companies)
+    if counts.empty:
+        return {}
+    names = counts.index.to_numpy(dtype=object)
+    codes, keys = pd.factorize(pd.Series([strip_company_suffixes(name) for name in names], dtype=object))
+    key_counts = np.bincount(codes, weights=counts.to_numpy(), minlength=len(keys))
+
+    parent = np.arange(len(keys))
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    if threshold < 1:
+        grams = [company_ngrams(key, n) for key in keys]
+        # Blocking: names are only compared with names that start the same way
+        heads = [f" {key}"[:n] for key in keys]
+        frequency = Counter(gram for key_grams in grams for gram in key_grams)
+        index: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        start: Dict[Tuple[str, str], int] = defaultdict(int)
+        # Smaller names first: name B only pairs with earlier names A where
+        # |A| >= threshold * |B|, so each posting list is trimmed from the front.
+        # Probing the first |B| - ceil(t|B|) + 1 grams while indexing only the
+        # first |A| - ceil(2t/(1+t)|A|) + 1 still finds every pair (PPJoin).
+        index_fraction = 2 * threshold / (1 + threshold)
+        for i in sorted(range(len(keys)), key=lambda i: len(grams[i])):
+            size = len(grams[i])
+            ordered = sorted(grams[i], key=lambda gram: (frequency[gram], gram))
+            candidates = set()
+            for gram in ordered[:size - math.ceil(threshold * size) + 1]:
+                entry = (heads[i], gram)
+                postings = index[entry]
+                while start[entry] < len(postings) and len(grams[postings[start[entry]]]) < threshold * size:
+                    start[entry] += 1
+                candidates.update(postings[start[entry]:])
+            for gram in ordered[:size - math.ceil(index_fraction * size) + 1]:
+                index[heads[i], gram].append(i)
+            for j in candidates:
+                shared = len(grams[i] & grams[j])
+                if shared / (size + len(grams[j]) - shared) >= threshold:
+                    parent[find(i)] = find(j)
+
+    roots = np.array([find(i) for i in range(len(keys))])
+    # Canonical name per cluster: most frequent, then shortest, then alphabetical
+    canonical: Dict[int, int] = {}
+    for i in sorted(range(len(keys)), key=lambda i: (-key_counts[i], len(keys[i]), keys[i])):
+        canonical.setdefault(roots[i], i)
+    aliases = {}
+    for i, key in enumerate(keys):
+        target = keys[canonical[roots[i]]]
+        if key != target:
+            aliases[key] = target
+    for name, code in zip(names, codes):
+        target = keys[canonical[roots[code]]]
+        if name != target:
+            aliases[name] = target
+    return aliases
+
+class CompanyAliases:
+    """
+    Alias -> canonical company name map.
+
+    Parameters
+    ----------
+    aliases : Optional[Dict[str, str]]
+        Cleaned (or suffix-stripped) name to canonical name, as from ``build_alias_map``.
+
+    Methods
+    -------
+    fit(companies: Iterable[str], threshold: float = 0.75, n: int = 3) -> CompanyAliases
+        Build the map from observed company names.
+    canonicalize(name: str) -> str
+        Canonical name of one company; unseen names are only suffix-stripped.
+    apply(values: pd.Series) -> pd.Series
+        Canonical names for a column, computed once per distinct value.
+    save(path: str, **meta)
+        Write the map (and metadata) as JSON.
+    load(path: str) -> CompanyAliases
+        Read a map written by ``save``.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self.aliases = dict(aliases or {})
+        self.meta: Dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self.aliases)
+
+    @classmethod
+    def fit(cls, companies: Iterable[str], threshold: float = 0.75, n: int = 3) -> "CompanyAliases":
+        return cls(build_alias_map(companies, threshold=threshold, n=n))
+
+    def canonicalize(self, name: str) -> str:
+        cleaned = clean_company_name(name)
+        if cleaned in self.aliases:
+            return self.aliases[cleaned]
+        key = strip_company_suffixes(cleaned)
+        return self.aliases.get(key, key)
+
+    def apply(self, values: pd.Series) -> pd.Series:
+        """
+        Canonicalize a column of company names.
+
+        Parameters
+        ----------
+        values : pd.Series
+            Company names (raw or cleaned).
+
+        Returns
+        -------
+        pd.Series
+            Canonical names with the same index and name; missing values stay missing.
+        """
+        values = pd.Series(values)
+        codes, uniques = pd.factorize(values)
+        canonical = np.array([self.canonicalize(value) for value in uniques] + [None], dtype=object)
+        result = pd.Series(canonical[codes], index=values.index, name=values.name, dtype=object)
+        return result.where(codes >= 0, values)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"alias": list(self.aliases), "canonical": list(self.aliases.values())}, dtype=object)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "CompanyAliases":
+        return cls(dict(zip(frame["alias"], frame["canonical"])))
+
+    def save(self, path: str, **meta) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.meta = {"version": ALIASES_VERSION, **meta}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({**self.meta, "aliases": self.aliases}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CompanyAliases":
+        with open(path, "r") as f:
+            data = json.load(f)
+        aliases = cls(data.pop("aliases"))
+        aliases.meta = data
+        return aliases
+
+def load_company_aliases(data_dir: str, cache_path: Optional[str] = None, threshold: float = 0.75) -> CompanyAliases:
+    """
+    Build the alias map for the connection CSVs in a directory, reusing a
+    cached map if the CSVs and threshold are unchanged.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing connection CSV files.
+    cache_path : Optional[str]
+        JSON file to reuse and refresh (no caching if None).
+    threshold : float
+        Similarity threshold passed to ``build_alias_map``.
+
+    Returns
+    -------
+    CompanyAliases
+    """
+    from src.data_loader import list_connection_files
+    from src.pipeline import source_digest
+    paths = [path for path, _ in list_connection_files(data_dir)]
+    digest = source_digest(paths)
+    if cache_path and os.path.exists(cache_path):
+        cached = CompanyAliases.load(cache_path)
+        if cached.meta == {"version": ALIASES_VERSION, "source_digest": digest, "threshold": threshold}:
+            logger.info(f"Reusing company aliases from {cache_path}")
+            return cached
+    # Only the Company column is needed to fit the map
+    companies = [pd.read_csv(path, usecols=["Company"], skipinitialspace=True)["Company"] for path in paths]
+    aliases = CompanyAliases.fit(pd.concat(companies, ignore_index=True) if companies else [], threshold=threshold)
+    logger.info(f"Built {len(aliases)} company aliases from {len(paths)} file(s)")
+    if cache_path:
+        aliases.save(cache_path, source_digest=digest, threshold=threshold)
+    return aliases
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     aliases = CompanyAliases.fit(["Acme Corp", "Acme Corporation", "ACME Inc.", "Globex Inc", "Globex"])
+#     print(aliases.aliases)
+#     print(aliases.canonicalize("The Globex Company"))
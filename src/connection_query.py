@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+connection_query.py
+
+Server-side filtering, sorting and paging over a loaded connections frame.
+
+Every queryable column is factorized once into integer codes with sorted
+uniques, so filters are evaluated on the (small) set of unique values and
+broadcast to rows through a lookup table, and the codes themselves give
+the sort order. A query only materializes the rows of the requested page,
+so the cost of displaying a result does not grow with the frame.
+
+Classes:
+    ConnectionIndex
+    QueryResult
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+INDEXED_COLUMNS = ("user_id", "company", "position", "name")
+
+class QueryResult(NamedTuple):
+    """
+    One page of a query.
+
+    Attributes
+    ----------
+    rows : pd.DataFrame
+        Rows on the requested page.
+    total : int
+        Number of rows matching the filters.
+    page : int
+        Page number (1-based), clamped to the available pages.
+    pages : int
+        Number of pages (at least 1).
+    """
+    rows: pd.DataFrame
+    total: int
+    page: int
+    pages: int
+
+class ConnectionIndex:
+    """
+    Prebuilt indexes over a connections frame for paged queries.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Connections frame, e.g. from ``load_all_connections``.
+    prebuild : Sequence[str]
+        Columns indexed up front (others are indexed on first use).
+
+    Methods
+    -------
+    values(column: str) -> List[str]
+        Sorted distinct values of a column, e.g. for filter widgets.
+    mask(filters: dict = None, contains: dict = None) -> np.ndarray
+        Boolean row mask for the given filters.
+    query(filters: dict = None, contains: dict = None, sort_by: str = None, descending: bool = False, page: int = 1, page_size: int = 50) -> QueryResult
+        One page of filtered, sorted rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, prebuild: Sequence[str] = INDEXED_COLUMNS):
+        self.frame = df.reset_index(drop=True)
+        self.columns = list(self.frame.columns)
+        self._codes: Dict[str, np.ndarray] = {}
+        self._uniques: Dict[str, pd.Index] = {}
+        self._lower: Dict[str, pd.Index] = {}
+        self._orders: Dict[tuple, np.ndarray] = {}
+        for column in prebuild:
+            if column in self.frame.columns:
+                self._factorize(column)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _factorize(self, column: str) -> None:
+        """Build codes and sorted uniques for a column on first use."""
+        if column in self._codes:
+            return
+        if column not in self.frame.columns:
+            raise ValueError(f"Unknown column: {column}")
+        codes, uniques = pd.factorize(self.frame[column].fillna("").astype(str), sort=True)
+        self._codes[column] = codes.astype(np.int32)
+        self._uniques[column] = pd.Index(uniques)
+        self._lower[column] = pd.Index(uniques).str.lower()
+
+    def values(self, column: str) -> List[str]:
+        """Return the sorted distinct values of ``column``."""
+        self._factorize(column)
+        return [value for value in self._uniques[column] if value]
+
+    def mask(
+        self,
+        filters: Optional[Dict[str, Sequence[str]]] = None,
+        contains: Optional[Dict[str, str]] = None
+    ) -> np.ndarray:
+        """
+        Build a boolean row mask.
+
+        Parameters
+        ----------
+        filters : Optional[Dict[str, Sequence[str]]]
+            Column to accepted values (exact match); empty selections are ignored.
+        contains : Optional[Dict[str, str]]
+            Column to case-insensitive substring; empty strings are ignored.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask aligned with ``frame`` rows.
+        """
+        keep = np.ones(len(self.frame), dtype=bool)
+        for column, accepted in (filters or {}).items():
+            if not accepted:
+                continue
+            self._factorize(column)
+            hits = self._uniques[column].isin([str(v) for v in accepted])
+            keep &= np.asarray(hits)[self._codes[column]]
+        for column, text in (contains or {}).items():
+            if not text:
+                continue
+            self._factorize(column)
+            hits = self._lower[column].str.contains(text.lower(), regex=False)
+            keep &= np.asarray(hits)[self._codes[column]]
+        return keep
+
+    def _order(self, column: str, descending: bool) -> np.ndarray:
+        """Row order sorted by ``column`` (stable), cached per direction."""
+        key = (column, descending)
+        if key not in self._orders:
+            self._factorize(column)
+            codes = self._codes[column]
+            self._orders[key] = np.argsort(-codes if descending else codes, kind="stable")
+        return self._orders[key]
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Sequence[str]]] = None,
+        contains: Optional[Dict[str, str]] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        page: int = 1,
+        page_size: int = 50
+    ) -> QueryResult:
+        """
+        Return one page of filtered, sorted rows.
+
+        Parameters
+        ----------
+        filters : Optional[Dict[str, Sequence[str]]]
+            Exact-match filters, see ``mask``.
+        contains : Optional[Dict[str, str]]
+            Substring filters, see ``mask``.
+        sort_by : Optional[str]
+            Column to sort by (default: original row order).
+        descending : bool
+            Sort in descending order.
+        page : int
+            1-based page number; out-of-range pages are clamped.
+        page_size : int
+            Rows per page.
+
+        Returns
+        -------
+        QueryResult
+            The page's rows plus total match and page counts.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        keep = self.mask(filters, contains)
+        if sort_by is None:
+            selected = np.flatnonzero(keep)
+        else:
+            order = self._order(sort_by, descending)
+            selected = order[keep[order]]
+        total = int(len(selected))
+        pages = max((total + page_size - 1) // page_size, 1)
+        page = min(max(int(page), 1), pages)
+        start = (page - 1) * page_size
+        rows = self.frame.iloc[selected[start:start + page_size]]
+        return QueryResult(rows, total, page, pages)
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader
+#     df = data_loader.load_all_connections("../data")
+#     index = ConnectionIndex(df)
+#     result = index.query(filters={"user_id": ["alice"]}, contains={"company": "globex"}, sort_by="name")
+#     print(f"{result.total} matches, page {result.page}/{result.pages}")
+#     print(result.rows)
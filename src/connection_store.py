@@ -0,0 +1,331 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+connection_store.py
+
+An optional persistent SQLite store of a group's connections.
+
+The store holds the output of ``load_all_connections`` in one table with
+indexes on the normalized company, position and user_id columns, plus an
+FTS5 full-text index over position titles. It is loaded in bulk inside a
+single transaction (indexes are created after the rows are in), and it
+remembers a digest of the source CSVs so it is only rebuilt when they
+change. Queries then take milliseconds without reloading any CSVs, e.g.
+"contacts at Globex with a manager title":
+
+    store.query(company="Globex", title="manager")
+
+Query values are normalized with the same rules as ingestion
+(``clean_company_name``, ``standardize_position_title``). A store built
+with a company alias map keeps the map, so a query for "Acme Corporation"
+finds connections stored under the canonical "acme".
+
+Functions:
+    build_connection_store(data_dir: str, db_path: str, rebuild: bool = False, alias_threshold: float = 0.75) -> ConnectionStore
+
+Classes:
+    ConnectionStore
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Optional, Sequence, Union
+import pandas as pd
+from src.company_aliases import CompanyAliases
+from src.utils import clean_company_name, standardize_position_title
+
+logger = logging.getLogger("strongties")
+
+SCHEMA_VERSION = "1"
+COLUMNS = ("user_id", "name", "company", "position")
+_INDEXES = {
+    "idx_connections_company": "connections(company, position)",
+    "idx_connections_position": "connections(position)",
+    "idx_connections_user": "connections(user_id)"
+}
+
+class ConnectionStore:
+    """
+    SQLite-backed connection store.
+
+    Parameters
+    ----------
+    path : str
+        Database file (created if missing); ":memory:" for a temporary store.
+
+    Methods
+    -------
+    load(df: pd.DataFrame, source_digest: str = None, aliases: CompanyAliases = None, batch_rows: int = 50000, meta: dict = None) -> int
+        Replace the stored connections with ``df`` in one transaction.
+    query(company=None, position=None, title=None, user_id=None, name=None, limit=None, offset=0) -> pd.DataFrame
+        Matching connections.
+    count(...) -> int
+        Number of matching connections.
+    get_meta(key: str) -> Optional[str]
+        Stored metadata such as the source digest.
+    close()
+        Close the database connection.
+    """
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        # Autocommit mode: transactions are opened explicitly around bulk loads
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS connections (
+                    id INTEGER PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    name TEXT,
+                    company TEXT,
+                    position TEXT
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS positions_fts USING fts5(
+                    position, content='connections', content_rowid='id'
+                );
+                """
+            )
+            self._create_indexes()
+        self.aliases = self._stored_aliases()
+
+    def _stored_aliases(self) -> Optional[CompanyAliases]:
+        stored = self.get_meta("company_aliases")
+        return CompanyAliases(json.loads(stored)) if stored else None
+
+    def _create_indexes(self) -> None:
+        for name, target in _INDEXES.items():
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> "ConnectionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def load(
+        self,
+        df: pd.DataFrame,
+        source_digest: Optional[str] = None,
+        aliases: Optional[CompanyAliases] = None,
+        batch_rows: int = 50_000,
+        meta: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Replace the stored connections with ``df``.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Connections with user_id, name, company and position columns
+            (as returned by ``load_all_connections``).
+        source_digest : Optional[str]
+            Digest of the source files, stored to skip identical rebuilds.
+        aliases : Optional[CompanyAliases]
+            Alias map ``df`` was canonicalized with; company queries then
+            go through it too.
+        batch_rows : int
+            Rows per ``executemany`` batch.
+        meta : Optional[Dict[str, str]]
+            Extra metadata stored in the same transaction as the rows.
+
+        Returns
+        -------
+        int
+            Number of rows stored.
+        """
+        missing = [col for col in COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"Connections are missing columns: {missing}")
+        frame = df[list(COLUMNS)].astype(object).where(df[list(COLUMNS)].notna(), None)
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Dropping the indexes first makes the insert a plain append
+                for name in _INDEXES:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+                self.conn.execute("DELETE FROM connections")
+                insert = f"INSERT INTO connections ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?)"
+                for start in range(0, len(frame), batch_rows):
+                    self.conn.executemany(insert, frame.iloc[start:start + batch_rows].itertuples(index=False, name=None))
+                self._create_indexes()
+                self.conn.execute("INSERT INTO positions_fts(positions_fts) VALUES ('rebuild')")
+                meta = {
+                    **(meta or {}),
+                    "schema_version": SCHEMA_VERSION,
+                    "rows": str(len(frame)),
+                    "source_digest": source_digest or "",
+                    "company_aliases": json.dumps(aliases.aliases) if aliases is not None else ""
+                }
+                self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("ANALYZE")
+        self.aliases = aliases
+        logger.info(f"Stored {len(frame)} connections in {self.path}")
+        return len(frame)
+
+    @staticmethod
+    def _fts_query(title: str) -> Optional[str]:
+        """Turn free text into an FTS5 query that requires every word (as a prefix)."""
+        words = re.findall(r"\w+", standardize_position_title(title))
+        return " ".join(f'"{word}"*' for word in words) or None
+
+    def _where(
+        self,
+        company: Optional[str] = None,
+        position: Optional[str] = None,
+        title: Optional[str] = None,
+        user_id: Union[str, Sequence[str], None] = None,
+        name: Optional[str] = None
+    ):
+        clauses, params = [], []
+        if company:
+            clauses.append("c.company = ?")
+            params.append(self.aliases.canonicalize(company) if self.aliases is not None else clean_company_name(company))
+        if position:
+            clauses.append("c.position = ?")
+            params.append(standardize_position_title(position))
+        if title:
+            fts = self._fts_query(title)
+            if fts:
+                clauses.append("c.id IN (SELECT rowid FROM positions_fts WHERE positions_fts MATCH ?)")
+                params.append(fts)
+        if user_id:
+            users = [user_id] if isinstance(user_id, str) else list(user_id)
+            clauses.append(f"c.user_id IN ({', '.join('?' * len(users))})")
+            params.extend(users)
+        if name:
+            # Escape LIKE wildcards so a name is always matched literally
+            clauses.append("c.name LIKE ? ESCAPE '\\'")
+            params.append("%" + re.sub(r"([\\%_])", r"\\\1", name.strip().lower()) + "%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        company: Optional[str] = None,
+        position: Optional[str] = None,
+        title: Optional[str] = None,
+        user_id: Union[str, Sequence[str], None] = None,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> pd.DataFrame:
+        """
+        Find connections; all given filters must match.
+
+        Parameters
+        ----------
+        company : Optional[str]
+            Company name (normalized before an exact, indexed match).
+        position : Optional[str]
+            Full position title (normalized before an exact, indexed match).
+        title : Optional[str]
+            Words that must all appear in the position title (full-text search).
+        user_id : Union[str, Sequence[str], None]
+            Member(s) whose connections to return.
+        name : Optional[str]
+            Substring of the connection's name.
+        limit : Optional[int]
+            Maximum rows to return.
+        offset : int
+            Rows to skip (for paging).
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns user_id, name, company, position, in insertion order.
+        """
+        where, params = self._where(company, position, title, user_id, name)
+        sql = f"SELECT c.user_id, c.name, c.company, c.position FROM connections c{where} ORDER BY c.id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def count(self, **filters) -> int:
+        """Number of connections matching the ``query`` filters."""
+        where, params = self._where(**filters)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM connections c{where}", params).fetchone()[0]
+
+def build_connection_store(
+    data_dir: str,
+    db_path: str,
+    rebuild: bool = False,
+    alias_threshold: Optional[float] = 0.75
+) -> ConnectionStore:
+    """
+    Open the store for a data directory, (re)building it if the CSVs changed.
+    Company names are stored canonicalized (see ``load_company_aliases``); the
+    alias map is cached in ``.cache/company_aliases.json`` next to the store.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing connection CSV files.
+    db_path : str
+        SQLite database file.
+    rebuild : bool
+        Rebuild even if the stored source digest matches. A store written
+        with a different ``SCHEMA_VERSION`` or alias threshold is always
+        rebuilt.
+    alias_threshold : Optional[float]
+        Similarity at which company name variants are merged; None keeps
+        company names as cleaned.
+
+    Returns
+    -------
+    ConnectionStore
+        The open, up-to-date store.
+    """
+    from src.company_aliases import load_company_aliases
+    from src.data_loader import list_connection_files, load_all_connections
+    from src.pipeline import source_digest
+    digest = source_digest([path for path, _ in list_connection_files(data_dir)])
+    store = ConnectionStore(db_path)
+    threshold = "" if alias_threshold is None else repr(float(alias_threshold))
+    stale = (
+        store.get_meta("schema_version") != SCHEMA_VERSION
+        or store.get_meta("source_digest") != digest
+        or store.get_meta("alias_threshold") != threshold
+    )
+    if rebuild or stale:
+        aliases = None
+        if alias_threshold is not None:
+            cache_path = os.path.join(os.path.dirname(os.path.abspath(db_path)), ".cache", "company_aliases.json")
+            aliases = load_company_aliases(data_dir, cache_path=cache_path, threshold=alias_threshold)
+        store.load(
+            load_all_connections(data_dir, aliases=aliases), source_digest=digest, aliases=aliases,
+            meta={"alias_threshold": threshold}
+        )
+    else:
+        logger.info(f"Connection store {db_path} is up to date")
+    return store
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     store = build_connection_store("../data", "../results/strongties.db")
+#     print(store.query(company="Globex", title="manager"))
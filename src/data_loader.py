@@ -7,14 +7,28 @@ Loads and preprocesses LinkedIn-style connection CSVs for StrongTies.
 
 Functions:
     is_safe_path(base_dir: str, path: str) -> bool
-    load_connections(csv_path: str, user_id: str, base_dir: str = None) -> pd.DataFrame
-    load_all_connections(data_dir: str) -> pd.DataFrame
+    read_connections(csv_path: Union[str, IO], base_dir: str = None) -> pd.DataFrame
+    clean_connections(df: pd.DataFrame, user_id: str, hash_ids: bool = False, obfuscate_names: bool = False, aliases: CompanyAliases = None) -> pd.DataFrame
+    load_connections(csv_path: Union[str, IO], user_id: str, base_dir: str = None) -> pd.DataFrame
+    combine_connections(dfs: list) -> pd.DataFrame
+    load_connection_sources(sources: list, base_dir: str = None, max_workers: int = None) -> pd.DataFrame
+    list_connection_files(data_dir: str) -> list
+    load_all_connections(data_dir: str, overlap: MemberOverlapIndex = None, aliases: CompanyAliases = None) -> pd.DataFrame
+    load_connections_partitioned(data_dir: str, spill_dir: str, budget: MemoryBudget = None, ...) -> SpillFrame
+    read_partitions(data_dir: str, chunk_rows: int) -> Iterator
+    clean_partitions(partitions: Iterable, frame: SpillFrame, hash_ids: bool = False, obfuscate_names: bool = False) -> SpillFrame
 """
 
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
 import pandas as pd
+from src.company_aliases import CompanyAliases
+from src.member_overlap import MemberOverlapIndex
+from src.memory_budget import MemoryBudget, SpillFrame
 from src.privacy_sanitizer import sanitize_csv, validate_csv_columns
+from src.profiling import span, traced
 from src.utils import clean_company_name, standardize_position_title, ensure_dir
 import logging
 
@@ -28,53 +42,81 @@ def is_safe_path(base_dir: str, path: str) -> bool:
     abs_path = os.path.abspath(path)
     return abs_path.startswith(abs_base)
 
-def load_connections(
-    csv_path: str,
-    user_id: str,
-    base_dir: Optional[str] = None,
-    hash_ids: bool = False,
-    obfuscate_names: bool = False
-) -> pd.DataFrame:
+def read_connections(csv_path: Union[str, IO], base_dir: Optional[str] = None) -> pd.DataFrame:
     """
-    Load a single connections CSV file, with path validation, privacy sanitization, and user tagging.
+    Read a connections CSV and validate its columns, without cleaning it.
 
     Parameters
     ----------
-    csv_path : str
-        Path to the CSV file.
-    user_id : str
-        Identifier for the user whose connections are in the CSV.
+    csv_path : Union[str, IO]
+        Path to the CSV file, or a file-like object (e.g. an in-memory upload).
     base_dir : Optional[str]
-        Base directory to validate the path against.
-    hash_ids : bool, optional
-        If True, hash identifiers for anonymization.
-    obfuscate_names : bool, optional
-        If True, replace names with synthetic placeholders.
+        Base directory to validate the path against (ignored for file-like objects).
 
     Returns
     -------
     pd.DataFrame
-        DataFrame containing the sanitized connections data, with a user_id column.
+        Raw DataFrame with the original column names.
     """
-    if base_dir and not is_safe_path(base_dir, csv_path):
+    if base_dir and isinstance(csv_path, str) and not is_safe_path(base_dir, csv_path):
         logger.error(f"Unsafe path detected: {csv_path}")
         raise ValueError(f"Unsafe path detected: {csv_path}")
     df = pd.read_csv(csv_path, skipinitialspace=True)
+    _check_columns(df.columns.tolist())
+    return df
+
+def _check_columns(columns: List[str]) -> None:
+    """Raise ValueError unless a connections CSV has the required, allowed columns."""
     required_columns = ["First Name", "Last Name", "Company", "Position"]
-    missing = [col for col in required_columns if col not in df.columns]
+    missing = [col for col in required_columns if col not in columns]
     if missing:
         logger.error(f"CSV missing required columns: {missing}")
         raise ValueError(f"CSV missing required columns: {missing}")
-    if not validate_csv_columns(df.columns.tolist()):
-        logger.error(f"CSV columns invalid: {df.columns.tolist()}")
-        raise ValueError(f"CSV columns invalid: {df.columns.tolist()}")
+    if not validate_csv_columns(columns):
+        logger.error(f"CSV columns invalid: {columns}")
+        raise ValueError(f"CSV columns invalid: {columns}")
+
+def clean_connections(
+    df: pd.DataFrame,
+    user_id: str,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    aliases: Optional[CompanyAliases] = None
+) -> pd.DataFrame:
+    """
+    Sanitize, normalize and tag a raw connections frame from ``read_connections``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw connections with the original column names.
+    user_id : str
+        Identifier for the user whose connections these are.
+    hash_ids : bool, optional
+        If True, hash identifiers for anonymization.
+    obfuscate_names : bool, optional
+        If True, replace names with synthetic placeholders.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns name, company, position, user_id (plus hash_id if requested).
+    """
     df = sanitize_csv(df, hash_ids=hash_ids, obfuscate_names=obfuscate_names)
-    df = df.drop_duplicates()
+    # Own the deduplicated frame so the column updates below never write through to the input
+    df = df.drop_duplicates().copy()
     # Standardize company and position columns
     if "Company" in df.columns:
-        df["Company"] = df["Company"].apply(clean_company_name)
+        with span("clean_company_name", rows=len(df)):
+            df["Company"] = df["Company"].apply(clean_company_name)
+        if aliases is not None:
+            with span("canonicalize_companies", rows=len(df)):
+                df["Company"] = aliases.apply(df["Company"])
     if "Position" in df.columns:
-        df["Position"] = df["Position"].apply(standardize_position_title)
+        with span("standardize_position_title", rows=len(df)):
+            df["Position"] = df["Position"].apply(standardize_position_title)
     # Concatenate First Name and Last Name into a single 'Name' column
     if "First Name" in df.columns and "Last Name" in df.columns:
         df["Name"] = (
@@ -90,50 +132,301 @@ def load_connections(
     df.columns = [col.lower() for col in df.columns]
     return df
 
-def load_all_connections(
-    data_dir: str,
+@traced()
+def load_connections(
+    csv_path: Union[str, IO],
+    user_id: str,
+    base_dir: Optional[str] = None,
     hash_ids: bool = False,
-    obfuscate_names: bool = False
+    obfuscate_names: bool = False,
+    aliases: Optional[CompanyAliases] = None
 ) -> pd.DataFrame:
     """
-    Load and concatenate all connection CSVs in a directory, tagging each with its user.
+    Load a single connections CSV file, with path validation, privacy sanitization, and user tagging.
 
     Parameters
     ----------
-    data_dir : str
-        Directory containing CSV files.
+    csv_path : Union[str, IO]
+        Path to the CSV file, or a file-like object (e.g. an in-memory upload).
+    user_id : str
+        Identifier for the user whose connections are in the CSV.
+    base_dir : Optional[str]
+        Base directory to validate the path against (ignored for file-like objects).
     hash_ids : bool, optional
         If True, hash identifiers for anonymization.
     obfuscate_names : bool, optional
         If True, replace names with synthetic placeholders.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names.
 
     Returns
     -------
     pd.DataFrame
-        Combined DataFrame of all connections, with user_id column.
+        DataFrame containing the sanitized connections data, with a user_id column.
+    """
+    df = read_connections(csv_path, base_dir)
+    return clean_connections(df, user_id, hash_ids=hash_ids, obfuscate_names=obfuscate_names, aliases=aliases)
+
+def combine_connections(dfs: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-user connection frames, dropping duplicate connections
+    (same name, company and position).
+    """
+    if not dfs:
+        return pd.DataFrame()
+    combined_df = pd.concat(dfs, ignore_index=True)
+    # Drop duplicates based on connection fields only
+    dedup_cols = [col for col in ["name", "company", "position"] if col in combined_df.columns]
+    return combined_df.drop_duplicates(subset=dedup_cols)
+
+@traced()
+def load_connection_sources(
+    sources: Sequence[Tuple[Union[str, IO], str]],
+    base_dir: Optional[str] = None,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    max_workers: Optional[int] = None,
+    overlap: Optional[MemberOverlapIndex] = None,
+    aliases: Optional[CompanyAliases] = None
+) -> pd.DataFrame:
+    """
+    Load several connection files concurrently and combine them.
+
+    Parameters
+    ----------
+    sources : Sequence[Tuple[Union[str, IO], str]]
+        (path or file-like object, user_id) pairs.
+    base_dir : Optional[str]
+        Base directory to validate paths against.
+    hash_ids : bool, optional
+        If True, hash identifiers for anonymization.
+    obfuscate_names : bool, optional
+        If True, replace names with synthetic placeholders.
+    max_workers : Optional[int]
+        Number of loader threads (default: one per source, up to 8).
+    overlap : Optional[MemberOverlapIndex]
+        If given, each user's contacts are added to it before duplicates
+        across users are dropped.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names
+        (before duplicates are dropped).
+
+    Returns
+    -------
+    pd.DataFrame
+        Combined DataFrame of all connections in source order, with duplicate
+        connections (same name, company and position) dropped.
+    """
+    if not sources:
+        return pd.DataFrame()
+    def load(source: Tuple[Union[str, IO], str]) -> pd.DataFrame:
+        csv_path, user_id = source
+        df = load_connections(csv_path, user_id, base_dir, hash_ids=hash_ids, obfuscate_names=obfuscate_names, aliases=aliases)
+        if overlap is not None:
+            overlap.add(user_id, df["name"])
+        return df
+    workers = max_workers or min(len(sources), 8)
+    if workers == 1:
+        dfs: List[pd.DataFrame] = [load(source) for source in sources]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            dfs = list(pool.map(load, sources))
+    return combine_connections(dfs)
+
+def list_connection_files(data_dir: str) -> List[Tuple[str, str]]:
+    """
+    List the connection CSVs in a directory with the user id inferred from
+    each file name, e.g. "alice_connections.csv" -> "alice".
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        (absolute path, user_id) pairs sorted by file name.
     """
     abs_data_dir = os.path.abspath(data_dir)
     ensure_dir(abs_data_dir)
     csv_files = [
         os.path.join(abs_data_dir, f)
-        for f in os.listdir(abs_data_dir)
+        for f in sorted(os.listdir(abs_data_dir))
         if f.endswith('.csv')
     ]
     safe_csv_files = [f for f in csv_files if is_safe_path(abs_data_dir, f)]
-    dfs: List[pd.DataFrame] = []
-    for f in safe_csv_files:
-        # Infer user_id from filename, e.g., "alice_connections.csv" -> "alice"
-        basename = os.path.basename(f)
-        user_id = basename.split('_')[0]
-        dfs.append(load_connections(f, user_id, abs_data_dir, hash_ids=hash_ids, obfuscate_names=obfuscate_names))
-    if dfs:
-        combined_df = pd.concat(dfs, ignore_index=True)
-        # Drop duplicates based on connection fields only
-        dedup_cols = [col for col in ["name", "company", "position"] if col in combined_df.columns]
-        combined_df = combined_df.drop_duplicates(subset=dedup_cols)
-        return combined_df
-    else:
-        return pd.DataFrame()
+    return [(f, os.path.basename(f).split('_')[0]) for f in safe_csv_files]
+
+@traced()
+def load_all_connections(
+    data_dir: str,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    overlap: Optional[MemberOverlapIndex] = None,
+    aliases: Optional[CompanyAliases] = None
+) -> pd.DataFrame:
+    """
+    Load and concatenate all connection CSVs in a directory, tagging each with its user.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing CSV files.
+    hash_ids : bool, optional
+        If True, hash identifiers for anonymization.
+    obfuscate_names : bool, optional
+        If True, replace names with synthetic placeholders.
+    overlap : Optional[MemberOverlapIndex]
+        If given, collects a MinHash signature of each user's contacts.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names
+        (see ``load_company_aliases``).
+
+    Returns
+    -------
+    pd.DataFrame
+        Combined DataFrame of all connections, with user_id column.
+    """
+    sources = list_connection_files(data_dir)
+    return load_connection_sources(
+        sources, os.path.abspath(data_dir), hash_ids=hash_ids, obfuscate_names=obfuscate_names, overlap=overlap,
+        aliases=aliases
+    )
+
+def _connection_keys(df: pd.DataFrame) -> np.ndarray:
+    """64-bit hash of each row's name, company and position (the combine_connections duplicate key)."""
+    dedup_cols = [col for col in ["name", "company", "position"] if col in df.columns]
+    return pd.util.hash_pandas_object(df[dedup_cols], index=False).to_numpy()
+
+class _KeyRuns:
+    """
+    Set of 64-bit keys held as sorted runs. A new run is merged with the
+    previous ones while they are no longer than it (like carries in a binary
+    counter), so there are O(log n) runs and adding n keys costs O(n log n)
+    in total instead of re-sorting everything seen for every partition.
+    """
+
+    def __init__(self):
+        self.runs: List[np.ndarray] = []
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(keys), dtype=bool)
+        for run in self.runs:
+            i = np.minimum(np.searchsorted(run, keys), len(run) - 1)
+            found |= run[i] == keys
+        return found
+
+    def add(self, keys: np.ndarray) -> None:
+        run = np.unique(keys)
+        if len(run) == 0:
+            return
+        while self.runs and len(self.runs[-1]) <= len(run):
+            run = np.union1d(self.runs.pop(), run)
+        self.runs.append(run)
+
+@traced()
+def load_connections_partitioned(
+    data_dir: str,
+    spill_dir: str,
+    budget: Optional[MemoryBudget] = None,
+    chunk_rows: Optional[int] = None,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    overlap: Optional[MemberOverlapIndex] = None,
+    aliases: Optional[CompanyAliases] = None
+) -> SpillFrame:
+    """
+    Load all connection CSVs in a directory partition by partition, within a memory budget.
+
+    Each file is read ``chunk_rows`` rows at a time and cleaned like
+    ``load_connections``. Duplicate connections across partitions and users
+    are dropped as in ``load_all_connections``, tracked by a 64-bit hash per
+    kept row (8 bytes of memory per connection). Cleaned partitions are
+    spilled to Parquet in ``spill_dir`` whenever the budget is hit, so the
+    combined frame never has to fit in memory at once.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing CSV files.
+    spill_dir : str
+        Directory for spilled Parquet partitions.
+    budget : Optional[MemoryBudget]
+        Memory budget; without one, partitions stay in memory.
+    chunk_rows : Optional[int]
+        Rows per partition (default: sized from the budget, or 100,000).
+    hash_ids : bool, optional
+        If True, hash identifiers for anonymization.
+    obfuscate_names : bool, optional
+        If True, replace names with synthetic placeholders.
+    overlap : Optional[MemberOverlapIndex]
+        If given, collects a MinHash signature of each user's contacts.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names.
+
+    Returns
+    -------
+    SpillFrame
+        The combined connections, in memory and/or on disk.
+    """
+    chunk_rows = chunk_rows or (budget.chunk_rows() if budget else 100_000)
+    frame = SpillFrame(spill_dir, budget, prefix="connections")
+    return clean_partitions(
+        read_partitions(data_dir, chunk_rows), frame, hash_ids=hash_ids, obfuscate_names=obfuscate_names, overlap=overlap,
+        aliases=aliases
+    )
+
+def read_partitions(data_dir: str, chunk_rows: int) -> Iterator[Tuple[pd.DataFrame, str]]:
+    """
+    Yield (raw partition, user_id) pairs for every connection CSV in a
+    directory, ``chunk_rows`` rows at a time. Each partition keeps its row
+    numbers within the file as its index.
+    """
+    for csv_path, user_id in list_connection_files(data_dir):
+        for raw in pd.read_csv(csv_path, skipinitialspace=True, chunksize=chunk_rows):
+            _check_columns(raw.columns.tolist())
+            yield raw, user_id
+
+def clean_partitions(
+    partitions: Iterable[Tuple[pd.DataFrame, str]],
+    frame: SpillFrame,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    overlap: Optional[MemberOverlapIndex] = None,
+    aliases: Optional[CompanyAliases] = None
+) -> SpillFrame:
+    """
+    Clean raw partitions and append their new connections to ``frame``.
+
+    Parameters
+    ----------
+    partitions : Iterable[Tuple[pd.DataFrame, str]]
+        (raw partition, user_id) pairs in file order, as from ``read_partitions``.
+    frame : SpillFrame
+        Destination for the cleaned rows.
+    hash_ids : bool, optional
+        If True, hash identifiers for anonymization.
+    obfuscate_names : bool, optional
+        If True, replace names with synthetic placeholders.
+    overlap : Optional[MemberOverlapIndex]
+        If given, each partition's contacts are added to it before duplicates are dropped.
+    aliases : Optional[CompanyAliases]
+        If given, company names are replaced by their canonical names.
+
+    Returns
+    -------
+    SpillFrame
+        ``frame``, holding each connection (name, company, position) once.
+    """
+    seen = _KeyRuns()
+    for raw, user_id in partitions:
+        df = clean_connections(raw, user_id, hash_ids=hash_ids, obfuscate_names=obfuscate_names, aliases=aliases)
+        if obfuscate_names:
+            # Number placeholders by row within the file, as a whole-file load would
+            df["name"] = "person" + (df.index + 1).astype(str) + " demo"
+        if overlap is not None:
+            overlap.add(user_id, df["name"])
+        keys = _connection_keys(df)
+        fresh = ~pd.Series(keys).duplicated().to_numpy() & ~seen.contains(keys)
+        seen.add(keys[fresh])
+        frame.append(df[fresh])
+    return frame
 
 # Example usage (uncomment for script use):
 # if __name__ == "__main__":
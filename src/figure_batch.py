@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+figure_batch.py
+
+Renders many network figures in parallel worker processes.
+
+Each job is rendered headless with ``render_network`` (Agg canvas, no
+``plt.show``), layouts are shared through an on-disk ``LayoutStore`` so
+repeated refreshes skip layout, and a ``manifest.json`` lists every output.
+
+Functions:
+    member_figure_jobs(G: nx.Graph, members: list, radius: int = 1, formats: tuple = ("png",)) -> list
+    render_figures(jobs: list, output_dir: str, workers: int = None, cache_dir: str = None, dpi: int = 150) -> list
+
+Classes:
+    FigureJob
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import networkx as nx
+from src.network_metrics import detect_communities
+from src.utils import ensure_dir
+from src.visualization import LayoutStore, render_network
+
+logger = logging.getLogger("strongties")
+
+FIGURE_KINDS = ("network", "communities")
+
+class FigureJob(NamedTuple):
+    """
+    One figure to render.
+
+    Attributes
+    ----------
+    name : str
+        Job name, used as the output file prefix.
+    graph : nx.Graph
+        Graph (or ego-graph) to draw.
+    kind : str
+        "network" or "communities".
+    formats : Tuple[str, ...]
+        Output formats, e.g. ("png", "svg").
+    layout : Optional[str]
+        Layout method for ``compute_layout`` (default chosen by graph size).
+    communities : Optional[Dict[int, list]]
+        Community assignment for "communities" figures; detected if omitted.
+    title : Optional[str]
+        Figure title.
+    label_top_k : int
+        Number of nodes to label.
+    """
+    name: str
+    graph: nx.Graph
+    kind: str = "network"
+    formats: Tuple[str, ...] = ("png",)
+    layout: Optional[str] = None
+    communities: Optional[Dict[int, list]] = None
+    title: Optional[str] = None
+    label_top_k: int = 20
+
+def member_figure_jobs(
+    G: nx.Graph,
+    members: Sequence[str],
+    radius: int = 1,
+    formats: Tuple[str, ...] = ("png",),
+    kinds: Tuple[str, ...] = FIGURE_KINDS
+) -> List[FigureJob]:
+    """
+    Build network and community figure jobs for each member's ego-graph.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Full connection graph.
+    members : Sequence[str]
+        Members to draw ego-graphs for; members missing from ``G`` are skipped.
+    radius : int
+        Ego-graph radius in hops.
+    formats : Tuple[str, ...]
+        Output formats for every job.
+    kinds : Tuple[str, ...]
+        Figure kinds to generate per member.
+
+    Returns
+    -------
+    list of FigureJob
+        Jobs in member order.
+    """
+    jobs = []
+    for member in members:
+        if member not in G:
+            logger.warning(f"Skipping figures for {member}: not in graph")
+            continue
+        ego = nx.ego_graph(G, member, radius=radius)
+        for kind in kinds:
+            title = f"{member}: {'Network Communities' if kind == 'communities' else 'Professional Social Network'}"
+            jobs.append(FigureJob(name=str(member), graph=ego, kind=kind, formats=tuple(formats), title=title))
+    return jobs
+
+def _safe_name(name: str) -> str:
+    """Make a job name safe to use as a file name."""
+    return re.sub(r"[^\w.-]+", "_", name).strip("._") or "figure"
+
+def _init_worker() -> None:
+    """Force the non-interactive Agg backend in worker processes."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+def _render_job(job: FigureJob, output_dir: str, cache_dir: Optional[str], dpi: int) -> Dict:
+    """Render one job to every requested format and return its manifest entry."""
+    start = time.perf_counter()
+    entry = {
+        "name": job.name,
+        "kind": job.kind,
+        "nodes": job.graph.number_of_nodes(),
+        "edges": job.graph.number_of_edges(),
+        "files": []
+    }
+    try:
+        if job.kind not in FIGURE_KINDS:
+            raise ValueError(f"Unknown figure kind: {job.kind}")
+        communities = None
+        if job.kind == "communities":
+            communities = job.communities if job.communities is not None else detect_communities(job.graph)
+        title = job.title or ("Network Communities" if communities is not None else "Professional Social Network")
+        fig = render_network(
+            job.graph,
+            store=LayoutStore(cache_dir=cache_dir),
+            layout=job.layout,
+            communities=communities,
+            label_top_k=job.label_top_k,
+            title=title,
+            dpi=dpi
+        )
+        base = f"{_safe_name(job.name)}_{job.kind}"
+        for fmt in job.formats:
+            path = os.path.join(output_dir, f"{base}.{fmt}")
+            fig.savefig(path, dpi=dpi)
+            entry["files"].append(path)
+        entry["status"] = "ok"
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+    entry["seconds"] = round(time.perf_counter() - start, 4)
+    return entry
+
+def render_figures(
+    jobs: Sequence[FigureJob],
+    output_dir: str,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    dpi: int = 150
+) -> List[Dict]:
+    """
+    Render figure jobs in a process pool and write a manifest.
+
+    Parameters
+    ----------
+    jobs : Sequence[FigureJob]
+        Figures to render.
+    output_dir : str
+        Directory for figures and ``manifest.json``.
+    workers : Optional[int]
+        Number of worker processes (default: all cores); 1 renders in-process.
+    cache_dir : Optional[str]
+        Directory for the shared on-disk layout cache (default: ``<output_dir>/.layouts``).
+    dpi : int
+        Output resolution.
+
+    Returns
+    -------
+    list of dict
+        Manifest entries in job order, with name, kind, nodes, edges, files,
+        status, seconds and, on failure, error.
+    """
+    ensure_dir(output_dir)
+    cache_dir = cache_dir or os.path.join(output_dir, ".layouts")
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, max(len(jobs), 1))
+
+    if workers == 1:
+        manifest = [_render_job(job, output_dir, cache_dir, dpi) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_render_job, job, output_dir, cache_dir, dpi) for job in jobs]
+            manifest = [future.result() for future in futures]
+
+    for entry in manifest:
+        if entry["status"] != "ok":
+            logger.error(f"Figure {entry['name']} ({entry['kind']}) failed: {entry['error']}")
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    with open(manifest_path, "w") as f:
+        json.dump({"figures": manifest}, f, indent=2)
+    logger.info(f"Rendered {sum(e['status'] == 'ok' for e in manifest)}/{len(manifest)} figures to {output_dir}")
+    return manifest
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder
+#     df = data_loader.load_all_connections("../data")
+#     G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     jobs = member_figure_jobs(G, df["user_id"].unique(), formats=("png", "svg"))
+#     render_figures(jobs, "../results/figures/members")
@@ -3,7 +3,7 @@
 """
 generate_sample_connections.py
 ---------------------------------
-Generates two synthetic CSV files representing LinkedIn-style connection data.
+Generates synthetic CSV files representing LinkedIn-style connection data.
 Each CSV contains:
     - First Name
     - Last Name
@@ -13,15 +13,140 @@ Each CSV contains:
 This script uses the 'faker' library to generate realistic but fictional data.
 All data is non-personal and for demonstration or testing only.
 
-Output:
+The default demo writes two small files for alice and bob around a curated
+set of shared people and companies (Alex Morgan at Acme Corp, Globex Inc,
+Initech, ...), which ``data/targets.json`` and the docs refer to.
+
+Larger group datasets are generated with ``generate_group_dataset``.
+Name, company and title pools are built with Faker once; rows are then
+produced by sampling pool indices with NumPy, so generation cost does not
+depend on Faker. Company sizes follow a power law, a configurable share of
+every member's contacts comes from a pool of people shared by the group,
+files are written in chunks, and members are generated in parallel worker
+processes. Output is reproducible for a given seed regardless of the
+number of workers.
+
+Functions:
+    build_pools(seed: int = 42, num_first_names: int = 2000, num_last_names: int = 2000, num_companies: int = 2000) -> ConnectionPools
+    generate_synthetic_connections(num_rows: int, shared_names: list, shared_companies: list, shared_positions: list, unique_seed: int, total_unique_names: int = 40) -> pd.DataFrame
+    generate_group_dataset(output_dir: str, users: list, rows_per_user: int = 10000, overlap: float = 0.2, ...) -> dict
+    write_demo_dataset(output_dir: str = "data", rows_per_user: int = 50) -> list
+
+Output (default demo):
     data/alice_connections.csv
     data/bob_connections.csv
 """
 
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+import numpy as np
 import pandas as pd
 from faker import Faker
-import random
+
+COLUMNS = ["First Name", "Last Name", "Company", "Position"]
+
+BASE_POSITIONS = [
+    "Data Scientist", "Software Engineer", "Product Manager",
+    "Analyst", "Consultant", "Designer", "Marketing Specialist",
+    "Sales Executive", "Project Coordinator", "Operations Manager"
+]
+_SENIORITY = ["", "Senior ", "Lead ", "Principal ", "Junior "]
+
+# Curated overlap for the default alice/bob demo
+DEMO_SHARED_NAMES = [
+    ("Alex", "Morgan"),
+    ("Jordan", "Lee"),
+    ("Taylor", "Kim"),
+    ("Casey", "Patel"),
+    ("Morgan", "Smith")
+]
+DEMO_SHARED_COMPANIES = ["Acme Corp", "Globex Inc", "Initech", "Umbrella LLC", "Stark Industries"]
+DEMO_SHARED_POSITIONS = ["Product Manager", "Software Engineer", "Consultant"]
+DEMO_SEEDS = {"alice": 42, "bob": 99}
+
+class ConnectionPools(NamedTuple):
+    """
+    Value pools that synthetic rows are sampled from.
+
+    Attributes
+    ----------
+    first_names, last_names, companies, positions : np.ndarray
+        Distinct values (object arrays).
+    company_cdf : np.ndarray
+        Cumulative company probabilities; company ``i`` has weight ``(i + 1) ** -alpha``.
+    """
+    first_names: np.ndarray
+    last_names: np.ndarray
+    companies: np.ndarray
+    positions: np.ndarray
+    company_cdf: np.ndarray
+
+def _unique_values(generate, count: int, attempts: int = 5) -> np.ndarray:
+    """Draw up to ``count`` distinct values from a Faker generator function."""
+    values = {}
+    for _ in range(attempts):
+        for _ in range(count - len(values)):
+            values.setdefault(generate(), None)
+        if len(values) >= count:
+            break
+    return np.asarray(list(values), dtype=object)
+
+def build_pools(
+    seed: int = 42,
+    num_first_names: int = 2000,
+    num_last_names: int = 2000,
+    num_companies: int = 2000,
+    company_alpha: float = 1.1
+) -> ConnectionPools:
+    """
+    Build name, company and position pools once with Faker.
+
+    Parameters
+    ----------
+    seed : int
+        Faker seed.
+    num_first_names, num_last_names, num_companies : int
+        Target pool sizes (Faker may provide fewer distinct values).
+    company_alpha : float
+        Power-law exponent for company sizes; larger means more concentrated.
+
+    Returns
+    -------
+    ConnectionPools
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    companies = _unique_values(fake.company, num_companies)
+    weights = np.arange(1, len(companies) + 1, dtype=float) ** -company_alpha
+    positions = np.asarray([level + title for title in BASE_POSITIONS for level in _SENIORITY], dtype=object)
+    return ConnectionPools(
+        first_names=_unique_values(fake.first_name, num_first_names),
+        last_names=_unique_values(fake.last_name, num_last_names),
+        companies=companies,
+        positions=positions,
+        company_cdf=np.cumsum(weights / weights.sum())
+    )
+
+def _sample_people(pools: ConnectionPools, rng: np.random.Generator, count: int) -> np.ndarray:
+    """Sample ``count`` people as an (count, 4) array of pool indices."""
+    companies = np.searchsorted(pools.company_cdf, rng.random(count), side="right")
+    return np.column_stack([
+        rng.integers(0, len(pools.first_names), count),
+        rng.integers(0, len(pools.last_names), count),
+        np.minimum(companies, len(pools.companies) - 1),
+        rng.integers(0, len(pools.positions), count)
+    ])
+
+def _people_frame(pools: ConnectionPools, people: np.ndarray) -> pd.DataFrame:
+    """Turn pool indices into a connections frame."""
+    return pd.DataFrame({
+        "First Name": pools.first_names[people[:, 0]],
+        "Last Name": pools.last_names[people[:, 1]],
+        "Company": pools.companies[people[:, 2]],
+        "Position": pools.positions[people[:, 3]]
+    })
 
 def generate_synthetic_connections(
     num_rows: int,
@@ -34,9 +159,9 @@ def generate_synthetic_connections(
     """
     Generate a synthetic dataset of professional connections with intentional overlap.
     """
-    random.seed(unique_seed)
-    Faker.seed(unique_seed)
+    rng = np.random.default_rng(unique_seed)
     fake = Faker()
+    fake.seed_instance(unique_seed)
 
     # Generate unique names
     unique_names = [
@@ -45,78 +170,197 @@ def generate_synthetic_connections(
     ]
 
     # Combine shared and unique names
-    all_names = shared_names + unique_names
-    companies = shared_companies + [fake.company() for _ in range(25)]
-    positions = shared_positions + [
-        "Data Scientist", "Software Engineer", "Product Manager",
-        "Analyst", "Consultant", "Designer", "Marketing Specialist",
-        "Sales Executive", "Project Coordinator", "Operations Manager"
-    ]
+    all_names = np.asarray(shared_names + unique_names, dtype=object)
+    companies = np.asarray(shared_companies + [fake.company() for _ in range(25)], dtype=object)
+    positions = np.asarray(shared_positions + BASE_POSITIONS, dtype=object)
+    shared_companies = np.asarray(shared_companies, dtype=object)
+    shared_positions = np.asarray(shared_positions, dtype=object)
 
-    data = []
-    # Ensure shared names are present
-    for first_name, last_name in shared_names:
-        company = random.choice(shared_companies)
-        position = random.choice(shared_positions)
-        data.append({
-            "First Name": first_name,
-            "Last Name": last_name,
-            "Company": company,
-            "Position": position
-        })
-
-    # Fill out the rest with random names/companies/positions
-    while len(data) < num_rows:
-        first_name, last_name = random.choice(all_names)
-        company = random.choice(companies)
-        position = random.choice(positions)
-        data.append({
-            "First Name": first_name,
-            "Last Name": last_name,
-            "Company": company,
-            "Position": position
-        })
-    return pd.DataFrame(data)
-
-def main():
-    os.makedirs("data", exist_ok=True)
-
-    # Define shared entities for overlap
-    shared_names = [
-        ("Alex", "Morgan"),
-        ("Jordan", "Lee"),
-        ("Taylor", "Kim"),
-        ("Casey", "Patel"),
-        ("Morgan", "Smith")
-    ]
-    shared_companies = [
-        "Acme Corp", "Globex Inc", "Initech", "Umbrella LLC", "Stark Industries"
-    ]
-    shared_positions = [
-        "Product Manager", "Software Engineer", "Consultant"
-    ]
+    # Shared names come first, then random names/companies/positions fill the rest
+    shared = len(shared_names)
+    rest = max(num_rows - shared, 0)
+    names = np.concatenate([np.arange(shared), rng.integers(0, len(all_names), rest)])
+    return pd.DataFrame({
+        "First Name": all_names[names, 0],
+        "Last Name": all_names[names, 1],
+        "Company": np.concatenate([
+            shared_companies[rng.integers(0, len(shared_companies), shared)],
+            companies[rng.integers(0, len(companies), rest)]
+        ]),
+        "Position": np.concatenate([
+            shared_positions[rng.integers(0, len(shared_positions), shared)],
+            positions[rng.integers(0, len(positions), rest)]
+        ])
+    })
 
-    df1 = generate_synthetic_connections(
-        num_rows=50,
-        shared_names=shared_names,
-        shared_companies=shared_companies,
-        shared_positions=shared_positions,
-        unique_seed=42
-    )
-    df2 = generate_synthetic_connections(
-        num_rows=50,
-        shared_names=shared_names,
-        shared_companies=shared_companies,
-        shared_positions=shared_positions,
-        unique_seed=99
-    )
+_WORKER_STATE: Dict = {}
+
+def _init_worker(pools: ConnectionPools, shared_people: np.ndarray) -> None:
+    """Receive the pools once per worker process instead of once per task."""
+    _WORKER_STATE["pools"] = pools
+    _WORKER_STATE["shared_people"] = shared_people
+
+def _write_user(
+    path: str,
+    rows: int,
+    overlap: float,
+    chunk_rows: int,
+    seed: np.random.SeedSequence,
+    pools: Optional[ConnectionPools] = None,
+    shared_people: Optional[np.ndarray] = None
+) -> int:
+    """Generate one member's connections and stream them to ``path`` in chunks."""
+    pools = pools if pools is not None else _WORKER_STATE["pools"]
+    shared_people = shared_people if shared_people is not None else _WORKER_STATE["shared_people"]
+    rng = np.random.default_rng(seed)
+    # Shared contacts are distinct people from the group pool; the rest are private
+    num_shared = min(int(round(rows * overlap)), len(shared_people))
+    shared_rows = rng.permutation(len(shared_people))[:num_shared]
+    order = rng.permutation(rows)  # interleave shared and private contacts
+    written = 0
+    for start in range(0, rows, chunk_rows):
+        positions = order[start:start + chunk_rows]
+        is_shared = positions < num_shared
+        people = np.empty((len(positions), 4), dtype=np.int64)
+        people[is_shared] = shared_people[shared_rows[positions[is_shared]]]
+        people[~is_shared] = _sample_people(pools, rng, int((~is_shared).sum()))
+        _people_frame(pools, people).to_csv(path, index=False, mode="w" if start == 0 else "a", header=start == 0)
+        written += len(positions)
+    if rows == 0:
+        pd.DataFrame(columns=COLUMNS).to_csv(path, index=False)
+    return written
 
-    df1.to_csv("data/alice_connections.csv", index=False)
-    df2.to_csv("data/bob_connections.csv", index=False)
+def generate_group_dataset(
+    output_dir: str,
+    users: Sequence[str],
+    rows_per_user: Union[int, Sequence[int]] = 10_000,
+    overlap: float = 0.2,
+    shared_people: Optional[int] = None,
+    pools: Optional[ConnectionPools] = None,
+    company_alpha: float = 1.1,
+    chunk_rows: int = 100_000,
+    workers: Optional[int] = None,
+    seed: int = 42
+) -> Dict:
+    """
+    Write one ``<user>_connections.csv`` per member, with overlapping contacts.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory for the CSVs.
+    users : Sequence[str]
+        Member identifiers (no underscores; the loader splits file names on them).
+    rows_per_user : Union[int, Sequence[int]]
+        Rows per member, or one count per member.
+    overlap : float
+        Share of each member's contacts drawn from the group's shared people, in [0, 1].
+    shared_people : Optional[int]
+        Size of the shared pool (default: the mean rows per member).
+    pools : Optional[ConnectionPools]
+        Value pools (default: ``build_pools(seed, company_alpha=company_alpha)``).
+    company_alpha : float
+        Power-law exponent for company sizes when building pools.
+    chunk_rows : int
+        Rows generated and written per chunk.
+    workers : Optional[int]
+        Worker processes (default: all cores, at most one per member); 1 runs in-process.
+    seed : int
+        Random seed; output does not depend on ``workers``.
+
+    Returns
+    -------
+    dict
+        users, rows per member, overlap, seed and file paths.
+    """
+    if not 0 <= overlap <= 1:
+        raise ValueError("overlap must be between 0 and 1")
+    bad = [user for user in users if "_" in user or not user]
+    if bad:
+        raise ValueError(f"User identifiers must be non-empty and contain no underscores: {bad}")
+    os.makedirs(output_dir, exist_ok=True)
+    counts = [int(rows_per_user)] * len(users) if isinstance(rows_per_user, (int, np.integer)) else [int(c) for c in rows_per_user]
+    if len(counts) != len(users):
+        raise ValueError("rows_per_user must be an int or have one entry per user")
+
+    pools = pools or build_pools(seed, company_alpha=company_alpha)
+    root = np.random.SeedSequence(seed)
+    pool_seed, *user_seeds = root.spawn(len(users) + 1)
+    shared_size = shared_people if shared_people is not None else max(int(np.mean(counts)) if counts else 0, 1)
+    group_people = _sample_people(pools, np.random.default_rng(pool_seed), shared_size)
+
+    paths = [os.path.join(output_dir, f"{user}_connections.csv") for user in users]
+    workers = min(workers or os.cpu_count() or 1, max(len(users), 1))
+    if workers == 1:
+        for path, count, user_seed in zip(paths, counts, user_seeds):
+            _write_user(path, count, overlap, chunk_rows, user_seed, pools, group_people)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pools, group_people)) as pool:
+            futures = [
+                pool.submit(_write_user, path, count, overlap, chunk_rows, user_seed)
+                for path, count, user_seed in zip(paths, counts, user_seeds)
+            ]
+            for future in futures:
+                future.result()
+    return {
+        "users": list(users),
+        "rows_per_user": counts,
+        "overlap": overlap,
+        "shared_people": shared_size,
+        "seed": seed,
+        "files": paths
+    }
+
+def write_demo_dataset(output_dir: str = "data", rows_per_user: int = 50) -> List[str]:
+    """Write the curated alice/bob demo files and return their paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for user, seed in DEMO_SEEDS.items():
+        df = generate_synthetic_connections(
+            num_rows=rows_per_user,
+            shared_names=DEMO_SHARED_NAMES,
+            shared_companies=DEMO_SHARED_COMPANIES,
+            shared_positions=DEMO_SHARED_POSITIONS,
+            unique_seed=seed
+        )
+        path = os.path.join(output_dir, f"{user}_connections.csv")
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+def main(
+    output_dir: str = "data",
+    users: Optional[Sequence[str]] = None,
+    rows_per_user: int = 50,
+    overlap: float = 0.2,
+    workers: Optional[int] = None,
+    seed: int = 42
+):
+    if users is None:
+        paths = write_demo_dataset(output_dir, rows_per_user)
+    else:
+        paths = generate_group_dataset(
+            output_dir, users, rows_per_user=rows_per_user, overlap=overlap, workers=workers, seed=seed
+        )["files"]
 
     print("✅ Synthetic connection files created with intentional overlap:")
-    print(" - data/alice_connections.csv")
-    print(" - data/bob_connections.csv")
+    for path in paths:
+        print(f" - {path}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic LinkedIn-style connection CSVs."
+    )
+    parser.add_argument("--output_dir", type=str, default="data", help="Directory for the CSVs")
+    parser.add_argument("--users", nargs="+", default=None, help="Member identifiers (default: the curated alice/bob demo)")
+    parser.add_argument("--num_users", type=int, default=None, help="Generate this many members named user000, user001, ...")
+    parser.add_argument("--rows", type=int, default=50, help="Rows per member")
+    parser.add_argument("--overlap", type=float, default=0.2, help="Share of contacts drawn from the group's shared pool (not used by the demo)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+    if args.num_users:
+        users = [f"user{i:03d}" for i in range(args.num_users)]
+    else:
+        users = args.users
+    main(args.output_dir, users, args.rows, args.overlap, args.workers, args.seed)
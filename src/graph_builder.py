@@ -7,12 +7,40 @@ Constructs a professional social graph from connection data.
 
 Functions:
     build_connection_graph(df: pd.DataFrame) -> nx.Graph
+    build_graph_from_chunks(chunks: Iterable[pd.DataFrame], source_col: str = "user_id", target_col: str = "name") -> nx.Graph
+    build_adjacency(G: nx.Graph) -> InternedAdjacency
+    graph_fingerprint(G: nx.Graph) -> str
 """
 
-from typing import Optional
+import hashlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
 import pandas as pd
 import networkx as nx
+import scipy.sparse as sp
+from src.profiling import traced
 
+class InternedAdjacency(NamedTuple):
+    """
+    Integer-interned, CSR-encoded adjacency of a connection graph.
+
+    Attributes
+    ----------
+    nodes : List[str]
+        Node labels; position ``i`` holds the label of node id ``i``.
+    index : Dict[str, int]
+        Mapping from node label to node id.
+    matrix : sp.csr_array
+        Symmetric n x n adjacency matrix with 1 for every edge.
+    fingerprint : str
+        Content fingerprint of the graph the adjacency was built from.
+    """
+    nodes: List[str]
+    index: Dict[str, int]
+    matrix: sp.csr_array
+    fingerprint: str
+
+@traced()
 def build_connection_graph(df: pd.DataFrame, source_col: Optional[str] = None, target_col: Optional[str] = None) -> nx.Graph:
     """
     Build an undirected graph from a DataFrame of connections.
@@ -51,6 +79,103 @@ def build_connection_graph(df: pd.DataFrame, source_col: Optional[str] = None, t
             G.add_edge(str(source), str(target))
     return G
 
+@traced()
+def build_graph_from_chunks(
+    chunks: Iterable[pd.DataFrame],
+    source_col: str = "user_id",
+    target_col: str = "name"
+) -> nx.Graph:
+    """
+    Build an undirected graph from connection data delivered in chunks,
+    e.g. Parquet partitions read back one at a time, so the full edge list
+    never has to be in memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Frames with at least the source and target columns.
+    source_col : str
+        Name of the column representing the source node.
+    target_col : str
+        Name of the column representing the target node.
+
+    Returns
+    -------
+    nx.Graph
+        The same graph ``build_connection_graph`` builds from the concatenated chunks.
+    """
+    G = nx.Graph()
+    for chunk in chunks:
+        valid = chunk[source_col].notna() & chunk[target_col].notna()
+        G.add_edges_from(zip(chunk.loc[valid, source_col].astype(str), chunk.loc[valid, target_col].astype(str)))
+    return G
+
+def _interned_edges(G: nx.Graph) -> Tuple[List[str], np.ndarray]:
+    """Return node labels and an (m, 2) array of edge endpoints as node ids."""
+    index = {node: i for i, node in enumerate(G.nodes())}
+    num_edges = G.number_of_edges()
+    pairs = np.fromiter(
+        (index[node] for edge in G.edges() for node in edge), dtype=np.int64, count=2 * num_edges
+    ).reshape(num_edges, 2)
+    return [str(node) for node in index], pairs
+
+def _fingerprint(nodes: List[str], pairs: np.ndarray) -> str:
+    """Order-independent digest of interned nodes and edges."""
+    node_hashes = pd.util.hash_array(np.asarray(nodes, dtype=object))
+    ends = node_hashes[pairs] if len(pairs) else np.empty((0, 2), dtype=np.uint64)
+    lo, hi = ends.min(axis=1), ends.max(axis=1)
+    edge_hashes = pd.util.hash_array(lo * np.uint64(0x9E3779B97F4A7C15) + hi)
+    digest = hashlib.sha256()
+    for hashes in (node_hashes, edge_hashes):
+        digest.update(np.uint64(len(hashes)).tobytes())
+        digest.update(np.sum(hashes, dtype=np.uint64).tobytes())
+        digest.update(np.bitwise_xor.reduce(hashes, initial=np.uint64(0)).tobytes())
+    return digest.hexdigest()
+
+@traced()
+def build_adjacency(G: nx.Graph) -> InternedAdjacency:
+    """
+    Intern node labels to integer ids and encode the graph as a sparse CSR matrix.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+
+    Returns
+    -------
+    InternedAdjacency
+        Node list, label-to-id index, adjacency matrix and graph fingerprint.
+    """
+    nodes, pairs = _interned_edges(G)
+    n = len(nodes)
+    loops = pairs[:, 0] == pairs[:, 1]
+    rows = np.concatenate([pairs[:, 0], pairs[~loops, 1]])
+    cols = np.concatenate([pairs[:, 1], pairs[~loops, 0]])
+    matrix = sp.csr_array(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n, n)
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    index = {node: i for i, node in enumerate(nodes)}
+    return InternedAdjacency(nodes, index, matrix, _fingerprint(nodes, pairs))
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """
+    Compute an order-independent content fingerprint of a graph's nodes and edges.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever a node or edge is added or removed.
+    """
+    return _fingerprint(*_interned_edges(G))
+
 # Example usage (uncomment for script use):
 # if __name__ == "__main__":
 #     import data_loader
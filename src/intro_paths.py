@@ -0,0 +1,328 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+intro_paths.py
+
+Finds alternative introduction paths between two people in a connection graph.
+
+Paths are generated shortest-first and generation stops as soon as ``k`` paths
+are found or the next path would exceed the hop limit. Node-disjoint paths are
+found greedily: each new route is the shortest one avoiding every intermediary
+already used, so alternatives go through different people. Disjoint-path
+queries run as breadth-first searches over the interned CSR adjacency;
+batches of them can also run in worker processes that share it through
+shared memory.
+
+Functions:
+    find_k_shortest_paths(G: nx.Graph, source: str, target: str, k: int = 3, max_hops: int = 4) -> list
+    find_disjoint_paths(G: nx.Graph, source: str, target: str, k: int = 3, max_hops: int = 4, adjacency: InternedAdjacency = None) -> list
+    find_disjoint_paths_many(G: nx.Graph, pairs: list, k: int = 3, max_hops: int = 4, workers: int = 1, adjacency: InternedAdjacency = None) -> dict
+
+Classes:
+    IntroPathFinder
+"""
+
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import networkx as nx
+import scipy.sparse as sp
+from src.graph_builder import InternedAdjacency, build_adjacency
+from src.shared_graph import SharedAdjacency, worker_matrix
+
+def _check_nodes(G: nx.Graph, source: str, target: str) -> None:
+    """Raise ValueError if either endpoint is missing from the graph."""
+    missing = [node for node in (source, target) if node not in G]
+    if missing:
+        raise ValueError(f"Nodes not found in graph: {missing}")
+
+def find_k_shortest_paths(
+    G: nx.Graph,
+    source: str,
+    target: str,
+    k: int = 3,
+    max_hops: int = 4
+) -> List[List[str]]:
+    """
+    Find up to ``k`` shortest simple paths between two nodes.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    source : str
+        Start node.
+    target : str
+        End node.
+    k : int
+        Maximum number of paths to return.
+    max_hops : int
+        Maximum number of edges in a path.
+
+    Returns
+    -------
+    list of lists
+        Paths as node lists, shortest first. Empty if no path within the hop limit.
+    """
+    _check_nodes(G, source, target)
+    if source == target or k <= 0:
+        return []
+    paths = []
+    try:
+        for path in islice(nx.shortest_simple_paths(G, source, target), k):
+            # Paths are generated in order of length: stop at the first one too long
+            if len(path) - 1 > max_hops:
+                break
+            paths.append(path)
+    except nx.NetworkXNoPath:
+        return []
+    return paths
+
+def find_disjoint_paths(
+    G: nx.Graph,
+    source: str,
+    target: str,
+    k: int = 3,
+    max_hops: int = 4,
+    adjacency: Optional[InternedAdjacency] = None
+) -> List[List[str]]:
+    """
+    Find up to ``k`` paths between two nodes that share no intermediaries.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    source : str
+        Start node.
+    target : str
+        End node.
+    k : int
+        Maximum number of paths to return.
+    max_hops : int
+        Maximum number of edges in a path.
+    adjacency : Optional[InternedAdjacency]
+        Precomputed adjacency for ``G``; built on the fly if omitted.
+
+    Returns
+    -------
+    list of lists
+        Node-disjoint paths as node lists, shortest first.
+    """
+    _check_nodes(G, source, target)
+    if source == target or k <= 0:
+        return []
+    adjacency = adjacency or build_adjacency(G)
+    paths = _csr_disjoint_paths(adjacency.matrix, adjacency.index[str(source)], adjacency.index[str(target)], k, max_hops)
+    return [[adjacency.nodes[i] for i in path] for path in paths]
+
+def _csr_shortest_path(
+    A: sp.csr_array,
+    source: int,
+    target: int,
+    blocked: set,
+    skip_direct: bool,
+    max_hops: int
+) -> Optional[List[int]]:
+    """
+    Breadth-first search over a CSR adjacency avoiding ``blocked`` nodes (and
+    the direct source-target edge if ``skip_direct``). Returns a shortest path
+    of node ids, or None if there is none within ``max_hops`` edges.
+    """
+    indptr, indices = A.indptr, A.indices
+    parent = {source: source}
+    frontier = [source]
+    for _ in range(max_hops):
+        next_frontier = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]].tolist():
+                if v in parent or v in blocked or (skip_direct and u == source and v == target):
+                    continue
+                parent[v] = u
+                if v == target:
+                    path = [v]
+                    while path[-1] != source:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                next_frontier.append(v)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return None
+
+def _csr_disjoint_paths(A: sp.csr_array, source: int, target: int, k: int, max_hops: int) -> List[List[int]]:
+    """
+    Greedy node-disjoint paths on node ids of a CSR adjacency: each path is
+    the shortest one avoiding every intermediary already used (and the direct
+    edge once it has been used).
+    """
+    if source == target or k <= 0:
+        return []
+    used = set()
+    direct_used = False
+    paths = []
+    while len(paths) < k:
+        path = _csr_shortest_path(A, source, target, used, direct_used, max_hops)
+        if path is None:
+            break
+        paths.append(path)
+        if len(path) == 2:
+            direct_used = True
+        used.update(path[1:-1])
+    return paths
+
+def _disjoint_paths_batch(A: sp.csr_array, pairs: np.ndarray, k: int, max_hops: int) -> List[List[List[int]]]:
+    return [_csr_disjoint_paths(A, int(s), int(t), k, max_hops) for s, t in pairs]
+
+def _worker_disjoint_paths(pairs: np.ndarray, k: int, max_hops: int) -> List[List[List[int]]]:
+    return _disjoint_paths_batch(worker_matrix(), pairs, k, max_hops)
+
+def find_disjoint_paths_many(
+    G: nx.Graph,
+    pairs: Sequence[Tuple[str, str]],
+    k: int = 3,
+    max_hops: int = 4,
+    workers: int = 1,
+    adjacency: Optional[InternedAdjacency] = None
+) -> Dict[Tuple[str, str], List[List[str]]]:
+    """
+    Find node-disjoint introduction paths for many (source, target) pairs.
+
+    Each pair gets exactly the paths ``find_disjoint_paths`` returns for it
+    (both run the same search over the interned adjacency); this only
+    amortizes building the adjacency and can spread pairs across processes.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    pairs : Sequence[Tuple[str, str]]
+        (source, target) node pairs.
+    k : int
+        Maximum number of paths per pair.
+    max_hops : int
+        Maximum number of edges in a path.
+    workers : int
+        Number of worker processes sharing the pairs; they read the adjacency
+        from shared memory.
+    adjacency : Optional[InternedAdjacency]
+        Precomputed adjacency for ``G``; built on the fly if omitted.
+
+    Returns
+    -------
+    dict
+        Mapping from (source, target) to its node-disjoint paths, shortest first.
+    """
+    adjacency = adjacency or build_adjacency(G)
+    pairs = [(str(source), str(target)) for source, target in pairs]
+    missing = sorted({node for pair in pairs for node in pair if node not in adjacency.index})
+    if missing:
+        raise ValueError(f"Nodes not found in graph: {missing}")
+    if not pairs:
+        return {}
+    ids = np.asarray([(adjacency.index[s], adjacency.index[t]) for s, t in pairs], dtype=np.int64)
+    if workers > 1 and len(ids) > 1:
+        chunks = [c for c in np.array_split(ids, workers) if len(c)]
+        task = partial(_worker_disjoint_paths, k=k, max_hops=max_hops)
+        with SharedAdjacency(adjacency) as shared, shared.pool(len(chunks)) as pool:
+            results = [paths for part in pool.map(task, chunks) for paths in part]
+    else:
+        results = _disjoint_paths_batch(adjacency.matrix, ids, k, max_hops)
+    nodes = adjacency.nodes
+    return {pair: [[nodes[i] for i in path] for path in paths] for pair, paths in zip(pairs, results)}
+
+class IntroPathFinder:
+    """
+    Caches alternative introduction paths for a graph so results can be paged.
+
+    Results are cached per (source, target, k, max_hops); a request for fewer
+    paths than a cached entry is served from that entry. Node and edge counts
+    are checked on every query (cheap enough for paging through cached
+    results) and the cache is cleared when they change; call ``invalidate()``
+    after edits that keep both counts equal.
+
+    Attributes
+    ----------
+    G : nx.Graph
+        The graph being queried.
+    max_hops : int
+        Default maximum number of edges in a path.
+    cache_size : int
+        Maximum number of cached queries.
+
+    Methods
+    -------
+    k_shortest_paths(source: str, target: str, k: int = 3, max_hops: int = None) -> list
+        Shortest simple paths, cached.
+    disjoint_paths(source: str, target: str, k: int = 3, max_hops: int = None) -> list
+        Node-disjoint paths, cached.
+    invalidate() -> None
+        Clear the cache after editing the graph.
+    """
+
+    def __init__(self, G: nx.Graph, max_hops: int = 4, cache_size: int = 256):
+        self.G = G
+        self.max_hops = max_hops
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, Tuple[int, List[List[str]]]]" = OrderedDict()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Clear cached paths and record the current state of the graph."""
+        self._cache.clear()
+        self._adjacency = None
+        self._counts = self._graph_counts()
+
+    def _graph_counts(self) -> Tuple[int, int]:
+        return self.G.number_of_nodes(), self.G.number_of_edges()
+
+    def _check_graph(self) -> None:
+        """Drop the cache if nodes or edges were added or removed since it was filled."""
+        if self._graph_counts() != self._counts:
+            self.invalidate()
+
+    def _disjoint(self, G: nx.Graph, source: str, target: str, k: int, max_hops: int) -> List[List[str]]:
+        """``find_disjoint_paths`` reusing one adjacency until the graph changes."""
+        if self._adjacency is None:
+            self._adjacency = build_adjacency(G)
+        return find_disjoint_paths(G, source, target, k=k, max_hops=max_hops, adjacency=self._adjacency)
+
+    def _query(self, kind: str, finder, source: str, target: str, k: int, max_hops: Optional[int]) -> List[List[str]]:
+        self._check_graph()
+        max_hops = self.max_hops if max_hops is None else max_hops
+        key = (kind, source, target, max_hops)
+        cached = self._cache.get(key)
+        # A cached entry covers this request if it asked for at least k paths
+        # or was exhausted before reaching its own k
+        if cached is not None and (cached[0] >= k or len(cached[1]) < cached[0]):
+            self._cache.move_to_end(key)
+            return [list(path) for path in cached[1][:k]]
+        paths = finder(self.G, source, target, k=k, max_hops=max_hops)
+        self._cache[key] = (k, paths)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return [list(path) for path in paths]
+
+    def k_shortest_paths(self, source: str, target: str, k: int = 3, max_hops: Optional[int] = None) -> List[List[str]]:
+        """Return up to ``k`` shortest simple paths; see ``find_k_shortest_paths``."""
+        return self._query("shortest", find_k_shortest_paths, source, target, k, max_hops)
+
+    def disjoint_paths(self, source: str, target: str, k: int = 3, max_hops: Optional[int] = None) -> List[List[str]]:
+        """Return up to ``k`` node-disjoint paths; see ``find_disjoint_paths``."""
+        return self._query("disjoint", self._disjoint, source, target, k, max_hops)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the number of cached queries and the cache capacity."""
+        return {"entries": len(self._cache), "cache_size": self.cache_size}
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder
+#     df = data_loader.load_all_connections("../data")
+#     G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     finder = IntroPathFinder(G, max_hops=4)
+#     print(finder.k_shortest_paths("alice", "bob", k=5))
+#     print(finder.disjoint_paths("alice", "bob", k=3))
@@ -0,0 +1,423 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+jobs.py
+
+Background jobs for long-running analysis steps.
+
+A ``JobManager`` runs functions on a thread pool (or, for picklable CPU-bound
+work, in child processes) so an interactive front end can keep responding
+while community detection, centrality or layout run. Jobs are addressed by an
+id and deduplicated by a caller-supplied key: submitting the same key again
+returns the existing job until it has finished, so finished results are
+reused across reruns and a job is never run twice at once.
+
+Thread jobs receive a ``JobContext`` as their first argument to report
+progress and check for cancellation. Their cancellation is cooperative: a
+running job stops at its next ``ctx.check()`` or ``ctx.update()``. Process
+jobs run in a child process of their own, which is terminated on
+cancellation, so library code without cancellation checks can still be
+stopped. A job that has not started yet is dropped from the queue.
+
+Callers sharing a manager (e.g. the sessions of a web app) can pass an
+``owner`` when submitting and cancelling. A deduplicated job then records
+every owner that asked for it, and cancelling on behalf of one owner only
+withdraws that owner's interest: the job is stopped once no owner is left.
+
+Classes:
+    JobManager
+    JobContext
+    JobStatus
+    JobCancelled
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional
+
+logger = logging.getLogger("strongties")
+
+PENDING, RUNNING, DONE, FAILED, CANCELLED = "pending", "running", "done", "failed", "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+# Seconds between cancellation checks while waiting for a process job
+_POLL_INTERVAL = 0.1
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled."""
+
+class JobStatus(NamedTuple):
+    """
+    Snapshot of a job.
+
+    Attributes
+    ----------
+    job_id : str
+        Job identifier.
+    name : str
+        Human-readable job name.
+    state : str
+        One of "pending", "running", "done", "failed", "cancelled".
+    progress : float
+        Completion fraction in [0, 1].
+    message : str
+        Latest progress message.
+    result : Any
+        Return value once the job is done, else None.
+    error : Optional[str]
+        Error message if the job failed.
+    seconds : float
+        Run time so far (or total run time once finished).
+    """
+    job_id: str
+    name: str
+    state: str
+    progress: float
+    message: str
+    result: Any
+    error: Optional[str]
+    seconds: float
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+class JobContext:
+    """
+    Handle passed to thread jobs for progress reporting and cancellation.
+
+    Methods
+    -------
+    update(progress: float, message: str = None)
+        Record progress and raise ``JobCancelled`` if the job was cancelled.
+    check()
+        Raise ``JobCancelled`` if the job was cancelled.
+    """
+
+    def __init__(self, job: "_Job"):
+        self._job = job
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_event.is_set()
+
+    def check(self) -> None:
+        if self.cancelled:
+            raise JobCancelled(self._job.job_id)
+
+    def update(self, progress: float, message: Optional[str] = None) -> None:
+        with self._job.lock:
+            self._job.progress = min(max(float(progress), 0.0), 1.0)
+            if message is not None:
+                self._job.message = message
+        self.check()
+
+def _process_entry(conn, fn: Callable, args: tuple, kwargs: dict) -> None:
+    """Child-process entry point: send back (True, result) or (False, error)."""
+    try:
+        outcome = (True, fn(*args, **kwargs))
+    except BaseException as error:
+        outcome = (False, f"{type(error).__name__}: {error}")
+    try:
+        conn.send(outcome)
+    finally:
+        conn.close()
+
+class _Job:
+    """Mutable job record owned by a ``JobManager``."""
+
+    def __init__(self, job_id: str, name: str, key: Hashable):
+        self.job_id = job_id
+        self.name = name
+        self.key = key
+        self.owners = set()
+        self.state = PENDING
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.started = None
+        self.ended = None
+        self.future: Optional[Future] = None
+        self.cancel_event = threading.Event()
+        self.finished_event = threading.Event()
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> JobStatus:
+        with self.lock:
+            if self.started is None:
+                seconds = 0.0
+            else:
+                seconds = (self.ended or time.perf_counter()) - self.started
+            return JobStatus(
+                self.job_id, self.name, self.state, self.progress, self.message,
+                self.result, self.error, round(seconds, 3)
+            )
+
+class JobManager:
+    """
+    Runs and tracks background jobs.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of jobs run at once (thread jobs and process jobs together).
+    max_finished : int
+        Number of finished jobs kept for result reuse; the oldest are evicted first.
+    mp_context : optional
+        ``multiprocessing`` context for process jobs (default: the platform default).
+
+    Methods
+    -------
+    submit(fn: Callable, *args, key: Hashable = None, name: str = None, use_process: bool = False, owner: Hashable = None, **kwargs) -> str
+        Start a job (or return the id of an existing job with the same key).
+    status(job_id: str) -> JobStatus
+        Snapshot of a job.
+    result(job_id: str, timeout: float = None) -> Any
+        Wait for a job and return its result.
+    cancel(job_id: str, owner: Hashable = None) -> bool
+        Request cancellation (or withdraw one owner's interest).
+    find(key: Hashable) -> Optional[str]
+        Id of the job submitted under a key.
+    jobs() -> List[JobStatus]
+        Snapshots of all tracked jobs, oldest first.
+    shutdown(cancel: bool = True)
+        Cancel outstanding jobs and stop the pool.
+    """
+
+    def __init__(self, max_workers: int = 2, max_finished: int = 64, mp_context: Any = None):
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self._mp_context = mp_context or multiprocessing.get_context()
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="strongties-job")
+        self._jobs: "OrderedDict[str, _Job]" = OrderedDict()
+        self._keys: Dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        key: Optional[Hashable] = None,
+        name: Optional[str] = None,
+        use_process: bool = False,
+        owner: Optional[Hashable] = None,
+        **kwargs
+    ) -> str:
+        """
+        Start a job.
+
+        Parameters
+        ----------
+        fn : Callable
+            Thread jobs are called as ``fn(ctx, *args, **kwargs)``; process jobs
+            as ``fn(*args, **kwargs)``; their result must be picklable, and
+            so must ``fn`` and its arguments under the spawn and forkserver
+            start methods. Process jobs only report progress 0 or 1.
+        key : Optional[Hashable]
+            Deduplication key. If a job with this key exists and did not end
+            cancelled or failed, its id is returned instead of starting a new
+            one; this includes a job whose cancellation was requested but
+            which is still stopping.
+        name : Optional[str]
+            Human-readable name (default: the function name).
+        use_process : bool
+            Run in a child process, terminated if the job is cancelled.
+        owner : Optional[Hashable]
+            Caller on whose behalf the job runs; added to the owners of an
+            existing job with the same key.
+
+        Returns
+        -------
+        str
+            Job id.
+        """
+        with self._lock:
+            if key is not None and key in self._keys:
+                existing = self._jobs.get(self._keys[key])
+                if existing is not None and existing.state not in (FAILED, CANCELLED):
+                    if owner is not None:
+                        with existing.lock:
+                            existing.owners.add(owner)
+                    self._jobs.move_to_end(existing.job_id)
+                    return existing.job_id
+            job = _Job(uuid.uuid4().hex[:12], name or getattr(fn, "__name__", "job"), key)
+            if owner is not None:
+                job.owners.add(owner)
+            self._jobs[job.job_id] = job
+            if key is not None:
+                self._keys[key] = job.job_id
+            self._evict()
+
+        runner = self._run_process if use_process else self._run
+        job.future = self._threads.submit(runner, job, fn, args, kwargs)
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        logger.info(f"Submitted job {job.job_id} ({job.name})")
+        return job.job_id
+
+    def _run(self, job: _Job, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Thread-pool entry point: mark the job running and call it with a context."""
+        with job.lock:
+            if job.cancel_event.is_set():
+                raise JobCancelled(job.job_id)
+            job.state = RUNNING
+            job.started = time.perf_counter()
+        return fn(JobContext(job), *args, **kwargs)
+
+    def _run_process(self, job: _Job, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Thread-pool entry point for process jobs: run ``fn`` in a child and wait for it."""
+        with job.lock:
+            if job.cancel_event.is_set():
+                raise JobCancelled(job.job_id)
+            job.state = RUNNING
+            job.started = time.perf_counter()
+        receiver, sender = self._mp_context.Pipe(duplex=False)
+        process = self._mp_context.Process(
+            target=_process_entry, args=(sender, fn, args, kwargs), name=f"strongties-job-{job.job_id}", daemon=True
+        )
+        process.start()
+        sender.close()
+        try:
+            while not receiver.poll(_POLL_INTERVAL):
+                if job.cancel_event.is_set():
+                    process.terminate()
+                    raise JobCancelled(job.job_id)
+                if not process.is_alive() and not receiver.poll():
+                    raise RuntimeError(f"Job process exited with code {process.exitcode}")
+            ok, value = receiver.recv()
+        finally:
+            receiver.close()
+            process.join()
+        if not ok:
+            raise RuntimeError(value)
+        return value
+
+    def _finish(self, job: _Job, future: Future) -> None:
+        """Record a job's outcome when its future completes."""
+        with job.lock:
+            job.ended = time.perf_counter()
+            if job.started is None:
+                job.started = job.ended
+            if future.cancelled():
+                job.state = CANCELLED
+            else:
+                error = future.exception()
+                if isinstance(error, JobCancelled):
+                    job.state = CANCELLED
+                elif error is not None:
+                    job.state = FAILED
+                    job.error = str(error) or type(error).__name__
+                else:
+                    job.state = DONE
+                    job.result = future.result()
+                    job.progress = 1.0
+        job.finished_event.set()
+        if job.state == FAILED:
+            logger.error(f"Job {job.job_id} ({job.name}) failed: {job.error}")
+
+    def _evict(self) -> None:
+        """Drop the oldest finished jobs beyond ``max_finished``; caller holds the lock."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in FINISHED_STATES]
+        for job_id in finished[:max(len(finished) - self.max_finished, 0)]:
+            job = self._jobs.pop(job_id)
+            if job.key is not None and self._keys.get(job.key) == job_id:
+                del self._keys[job.key]
+
+    def _get(self, job_id: str) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job: {job_id}")
+        return job
+
+    def status(self, job_id: str) -> JobStatus:
+        """Return a snapshot of a job."""
+        return self._get(job_id).snapshot()
+
+    def result(self, job_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a job and return its result.
+
+        Raises
+        ------
+        JobCancelled
+            If the job was cancelled.
+        RuntimeError
+            If the job failed.
+        TimeoutError
+            If the job did not finish within ``timeout`` seconds.
+        """
+        job = self._get(job_id)
+        if not job.finished_event.wait(timeout):
+            raise TimeoutError(f"Job {job_id} ({job.name}) did not finish within {timeout}s")
+        status = job.snapshot()
+        if status.state == CANCELLED:
+            raise JobCancelled(job_id)
+        if status.state == FAILED:
+            raise RuntimeError(f"Job {job_id} ({job.name}) failed: {status.error}")
+        return status.result
+
+    def cancel(self, job_id: str, owner: Optional[Hashable] = None) -> bool:
+        """
+        Request cancellation of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Job to cancel.
+        owner : Optional[Hashable]
+            Withdraw only this owner's interest; the job is cancelled once no
+            owner is left. Without an owner the job is cancelled outright.
+
+        Returns
+        -------
+        bool
+            True if cancellation was requested; False if the job had already
+            finished or other owners still use it.
+        """
+        job = self._get(job_id)
+        with job.lock:
+            if job.state in FINISHED_STATES:
+                return False
+            if owner is not None:
+                job.owners.discard(owner)
+                if job.owners:
+                    return False
+            job.cancel_event.set()
+            job.message = "Cancelling..."
+        if job.future is not None:
+            job.future.cancel()
+        return True
+
+    def find(self, key: Hashable) -> Optional[str]:
+        """Return the id of the job submitted under ``key``, if still tracked."""
+        with self._lock:
+            return self._keys.get(key)
+
+    def jobs(self) -> List[JobStatus]:
+        """Return snapshots of all tracked jobs, oldest first."""
+        with self._lock:
+            tracked = list(self._jobs.values())
+        return [job.snapshot() for job in tracked]
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """Cancel outstanding jobs (optionally) and stop the worker pool."""
+        if cancel:
+            for status in self.jobs():
+                if not status.finished:
+                    self.cancel(status.job_id)
+        self._threads.shutdown(wait=True, cancel_futures=cancel)
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder, network_metrics
+#     df = data_loader.load_all_connections("../data")
+#     G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     manager = JobManager()
+#     job_id = manager.submit(lambda ctx, G: network_metrics.detect_communities(G), G, key="communities")
+#     print(manager.status(job_id))
+#     print(manager.result(job_id))
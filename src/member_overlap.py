@@ -0,0 +1,305 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+member_overlap.py
+
+Finds group members whose networks overlap the most, without comparing
+every pair of contact lists.
+
+Each member's contact set is summarized by a MinHash signature: for each of
+``num_perm`` random hash functions, the smallest hash over the member's
+contacts. The fraction of equal positions in two signatures is an unbiased
+estimate of the Jaccard similarity of the two contact sets. Locality
+sensitive hashing then splits signatures into ``bands`` of ``rows`` values;
+members that agree on a whole band land in the same bucket and become a
+candidate pair, so only candidates are compared. A pair with Jaccard ``J``
+becomes a candidate with probability ``1 - (1 - J**rows) ** bands``.
+
+Signatures are built while connections are loaded (pass a
+``MemberOverlapIndex`` to ``load_all_connections``), because the combined
+frame keeps each shared contact under one member only.
+
+Functions:
+    contact_hashes(contacts: Iterable[str]) -> np.ndarray
+    candidate_probability(jaccard: float, bands: int, rows: int) -> float
+    choose_bands(num_perm: int, threshold: float, recall: float = 0.95) -> Tuple[int, int]
+    jaccard_error_bound(num_perm: int, confidence: float = 0.95) -> float
+
+Classes:
+    MinHasher
+    MemberOverlapIndex
+"""
+
+import itertools
+import logging
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("strongties")
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_EMPTY = np.iinfo(np.uint64).max
+
+def contact_hashes(contacts: Iterable[str]) -> np.ndarray:
+    """
+    Hash contact identifiers (e.g. normalized names) to sorted, unique 64-bit values.
+
+    Parameters
+    ----------
+    contacts : Iterable[str]
+        Contact identifiers; missing values are ignored.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique uint64 hashes.
+    """
+    values = pd.Series(contacts, dtype=object).dropna().astype(str).to_numpy(dtype=object)
+    return np.unique(pd.util.hash_array(values))
+
+def candidate_probability(jaccard: float, bands: int, rows: int) -> float:
+    """Probability that a pair with this Jaccard similarity shares at least one LSH bucket."""
+    return 1 - (1 - jaccard ** rows) ** bands
+
+def choose_bands(num_perm: int, threshold: float, recall: float = 0.95) -> Tuple[int, int]:
+    """
+    Pick the LSH (bands, rows) split with the most rows per band (fewest
+    false candidates) that still finds a pair at ``threshold`` with
+    probability ``recall``, using at most ``num_perm`` signature values.
+    """
+    if not 0 < threshold < 1:
+        raise ValueError(f"threshold must be between 0 and 1, got {threshold}")
+    best = (num_perm, 1)
+    for rows in range(2, num_perm + 1):
+        bands = num_perm // rows
+        if candidate_probability(threshold, bands, rows) < recall:
+            break
+        best = (bands, rows)
+    return best
+
+def jaccard_error_bound(num_perm: int, confidence: float = 0.95) -> float:
+    """
+    Half-width of a Hoeffding confidence interval for a MinHash Jaccard estimate:
+    with probability at least ``confidence`` the estimate from ``num_perm``
+    hash functions is within this distance of the true Jaccard similarity.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    return math.sqrt(math.log(2 / (1 - confidence)) / (2 * num_perm))
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: a bijective 64-bit mix (multiplications wrap mod 2**64)."""
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+class MinHasher:
+    """
+    MinHash signatures; hash function ``i`` mixes each contact hash with its
+    own random 64-bit seed.
+
+    Parameters
+    ----------
+    num_perm : int
+        Number of hash functions (signature length).
+    seed : int
+        Random seed; signatures are only comparable with the same seed.
+
+    Methods
+    -------
+    signature(hashes: np.ndarray) -> np.ndarray
+        Signature of a set of 64-bit contact hashes.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 0, block_rows: int = 4096):
+        if num_perm < 1:
+            raise ValueError(f"num_perm must be positive, got {num_perm}")
+        rng = np.random.default_rng(seed)
+        self.seeds = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True)
+        self.num_perm = num_perm
+        self.block_rows = block_rows
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        signature = np.full(self.num_perm, _EMPTY, dtype=np.uint64)
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        # Blocks of contacts bound the (contacts x num_perm) intermediate
+        for start in range(0, len(hashes), self.block_rows):
+            x = hashes[start:start + self.block_rows, None]
+            np.minimum(signature, _mix(x ^ self.seeds).min(axis=0), out=signature)
+        return signature
+
+class MemberOverlapIndex:
+    """
+    MinHash signatures per member, with LSH search for high-overlap pairs.
+
+    Parameters
+    ----------
+    num_perm : int
+        Signature length; estimates are within ``jaccard_error_bound(num_perm)``
+        of the true Jaccard similarity at 95% confidence.
+    seed : int
+        Hash seed.
+    keep_contacts : bool
+        Keep each member's contact hashes (8 bytes per contact) so estimates
+        can be checked exactly.
+
+    Methods
+    -------
+    add(user_id: str, contacts: Iterable[str])
+        Add contacts for a member (calls for the same member accumulate).
+    estimate(user_a: str, user_b: str) -> float
+        Estimated Jaccard similarity of two members' contact sets.
+    exact(user_a: str, user_b: str) -> Tuple[float, int]
+        Exact Jaccard similarity and shared contact count.
+    candidate_pairs(threshold: float, bands: int = None) -> Set[Tuple[str, str]]
+        Member pairs sharing an LSH bucket.
+    overlapping_pairs(threshold: float = 0.3, ...) -> pd.DataFrame
+        Pairs with estimated (or exact) Jaccard at or above ``threshold``.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 0, keep_contacts: bool = True):
+        self.hasher = MinHasher(num_perm, seed)
+        self.num_perm = num_perm
+        self.keep_contacts = keep_contacts
+        self.signatures: Dict[str, np.ndarray] = {}
+        self.sizes: Dict[str, int] = {}
+        self._contacts: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def members(self) -> List[str]:
+        return list(self.signatures)
+
+    def add(self, user_id: str, contacts: Iterable[str]) -> None:
+        hashes = contact_hashes(contacts)
+        signature = self.hasher.signature(hashes)
+        user_id = str(user_id)
+        with self._lock:
+            if user_id in self.signatures:
+                # MinHash of a union is the elementwise minimum
+                np.minimum(self.signatures[user_id], signature, out=self.signatures[user_id])
+                if self.keep_contacts:
+                    hashes = np.union1d(self._contacts[user_id], hashes)
+                    self._contacts[user_id] = hashes
+                    self.sizes[user_id] = len(hashes)
+                else:
+                    # Without the contact sets the size is an upper bound
+                    self.sizes[user_id] += len(hashes)
+            else:
+                self.signatures[user_id] = signature
+                self.sizes[user_id] = len(hashes)
+                if self.keep_contacts:
+                    self._contacts[user_id] = hashes
+
+    def estimate(self, user_a: str, user_b: str) -> float:
+        return float(np.mean(self.signatures[str(user_a)] == self.signatures[str(user_b)]))
+
+    def exact(self, user_a: str, user_b: str) -> Tuple[float, int]:
+        if not self.keep_contacts:
+            raise ValueError("Exact overlap needs keep_contacts=True")
+        a, b = self._contacts[str(user_a)], self._contacts[str(user_b)]
+        shared = len(np.intersect1d(a, b, assume_unique=True))
+        union = len(a) + len(b) - shared
+        return (shared / union if union else 0.0), shared
+
+    def candidate_pairs(self, threshold: float, bands: Optional[int] = None) -> Set[Tuple[str, str]]:
+        """
+        Members that agree on every value of at least one band.
+
+        Parameters
+        ----------
+        threshold : float
+            Jaccard similarity the banding is tuned for (see ``choose_bands``).
+        bands : Optional[int]
+            Number of bands (default: chosen from ``threshold``).
+
+        Returns
+        -------
+        Set[Tuple[str, str]]
+            Candidate pairs, each ordered by user id.
+        """
+        if bands is None:
+            bands, rows = choose_bands(self.num_perm, threshold)
+        else:
+            if not 1 <= bands <= self.num_perm:
+                raise ValueError(f"bands must be between 1 and {self.num_perm}, got {bands}")
+            rows = self.num_perm // bands
+        members = [user for user in self.signatures if self.sizes[user] > 0]
+        if len(members) < 2:
+            return set()
+        matrix = np.vstack([self.signatures[user] for user in members])
+        pairs = set()
+        for band in range(bands):
+            keys = pd.util.hash_pandas_object(pd.DataFrame(matrix[:, band * rows:(band + 1) * rows]), index=False).to_numpy()
+            order = np.argsort(keys, kind="stable")
+            boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+            for bucket in np.split(order, boundaries):
+                if len(bucket) > 1:
+                    pairs.update(itertools.combinations(sorted(members[i] for i in bucket), 2))
+        return pairs
+
+    def overlapping_pairs(
+        self,
+        threshold: float = 0.3,
+        bands: Optional[int] = None,
+        exact: bool = False,
+        confidence: float = 0.95
+    ) -> pd.DataFrame:
+        """
+        Member pairs with high contact overlap, most similar first.
+
+        Parameters
+        ----------
+        threshold : float
+            Minimum Jaccard similarity to report.
+        bands : Optional[int]
+            Number of LSH bands (default: chosen from ``threshold``).
+        exact : bool
+            Also compute exact Jaccard and shared contact counts for the
+            candidates, and filter on the exact value instead of the estimate.
+        confidence : float
+            Confidence level of the reported estimate intervals.
+
+        Returns
+        -------
+        pd.DataFrame
+            user_a, user_b, contacts_a, contacts_b, jaccard_estimate,
+            jaccard_low, jaccard_high (plus jaccard_exact and
+            shared_contacts with ``exact``).
+        """
+        if exact and not self.keep_contacts:
+            raise ValueError("Exact overlap needs keep_contacts=True")
+        bound = jaccard_error_bound(self.num_perm, confidence)
+        rows = []
+        for user_a, user_b in sorted(self.candidate_pairs(threshold, bands)):
+            estimate = self.estimate(user_a, user_b)
+            row = {
+                "user_a": user_a,
+                "user_b": user_b,
+                "contacts_a": self.sizes[user_a],
+                "contacts_b": self.sizes[user_b],
+                "jaccard_estimate": estimate,
+                "jaccard_low": max(0.0, estimate - bound),
+                "jaccard_high": min(1.0, estimate + bound)
+            }
+            if exact:
+                row["jaccard_exact"], row["shared_contacts"] = self.exact(user_a, user_b)
+            rows.append(row)
+        columns = ["user_a", "user_b", "contacts_a", "contacts_b", "jaccard_estimate", "jaccard_low", "jaccard_high"]
+        if exact:
+            columns += ["jaccard_exact", "shared_contacts"]
+        pairs = pd.DataFrame(rows, columns=columns)
+        score = "jaccard_exact" if exact else "jaccard_estimate"
+        pairs = pairs[pairs[score] >= threshold]
+        return pairs.sort_values([score, "user_a", "user_b"], ascending=[False, True, True]).reset_index(drop=True)
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     from src.data_loader import load_all_connections
+#     index = MemberOverlapIndex(num_perm=128)
+#     load_all_connections("../data", overlap=index)
+#     print(index.overlapping_pairs(threshold=0.2, exact=True))
@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+memory_budget.py
+
+Memory budgets for large group runs.
+
+A ``MemoryBudget`` compares the process's resident memory against a limit
+and records the peak of each tracked stage. ``SpillFrame`` collects the
+partitions of a large DataFrame in memory and spills them to Parquet files
+once they take up their share of the budget (or the process goes over it),
+so ingestion degrades to slower disk-backed work instead of running out of
+memory. psutil is imported when a budget is created, not at module import.
+
+Functions:
+    parse_memory_limit(limit: Union[str, int]) -> int
+
+Classes:
+    MemoryBudget
+    SpillFrame
+"""
+
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+import pandas as pd
+
+logger = logging.getLogger("strongties")
+
+_MB = 1024 * 1024
+_UNITS = {"": 1, "b": 1, "k": 1024, "kb": 1024, "m": _MB, "mb": _MB, "g": 1024 * _MB, "gb": 1024 * _MB}
+
+def parse_memory_limit(limit: Union[str, int]) -> int:
+    """
+    Convert a memory limit such as "512MB", "2g" or a byte count to bytes.
+
+    Parameters
+    ----------
+    limit : Union[str, int]
+        Limit with an optional unit (B, KB, MB, GB; binary multiples).
+
+    Returns
+    -------
+    int
+        Limit in bytes.
+    """
+    if isinstance(limit, int):
+        value, unit = limit, ""
+    else:
+        match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([a-zA-Z]*)\s*", str(limit))
+        if not match or match.group(2).lower() not in _UNITS:
+            raise ValueError(f"Invalid memory limit: {limit!r} (expected e.g. 512MB or 2GB)")
+        value, unit = float(match.group(1)), match.group(2).lower()
+    limit_bytes = int(value * _UNITS[unit])
+    if limit_bytes <= 0:
+        raise ValueError(f"Memory limit must be positive, got {limit!r}")
+    return limit_bytes
+
+class MemoryBudget:
+    """
+    A resident-memory limit for the current process, with per-stage peaks.
+
+    Parameters
+    ----------
+    limit : Union[str, int]
+        Memory limit, e.g. "2GB" (see ``parse_memory_limit``).
+    buffer_fraction : float
+        Share of the limit that in-memory partitions may take before they spill.
+    interval : float
+        Seconds between RSS samples while a stage is tracked.
+
+    Methods
+    -------
+    rss() -> int
+        Current resident memory in bytes.
+    exceeded() -> bool
+        Whether the process is at or over the limit.
+    chunk_rows(row_bytes: int = 512) -> int
+        Rows per partition that fit the buffer share of the budget.
+    track(name: str) -> ContextManager
+        Record the peak RSS of a block under ``name``.
+    peaks() -> Dict[str, float]
+        Peak RSS (MB) of every tracked stage.
+    """
+
+    def __init__(self, limit: Union[str, int], buffer_fraction: float = 0.25, interval: float = 0.02):
+        if not 0 < buffer_fraction <= 1:
+            raise ValueError(f"buffer_fraction must be in (0, 1], got {buffer_fraction}")
+        import psutil
+        self.limit = parse_memory_limit(limit)
+        self.buffer_bytes = int(self.limit * buffer_fraction)
+        self.interval = interval
+        self._process = psutil.Process(os.getpid())
+        self._peaks: Dict[str, float] = {}
+
+    def rss(self) -> int:
+        return self._process.memory_info().rss
+
+    def exceeded(self) -> bool:
+        return self.rss() >= self.limit
+
+    def chunk_rows(self, row_bytes: int = 512) -> int:
+        """Partition size, bounded to 10k–1M rows."""
+        return int(min(max(self.buffer_bytes // (4 * row_bytes), 10_000), 1_000_000))
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Sample RSS in the background while the block runs and keep its peak."""
+        peak = [self.rss()]
+        stop = threading.Event()
+
+        def sample():
+            while not stop.wait(self.interval):
+                peak[0] = max(peak[0], self.rss())
+        sampler = threading.Thread(target=sample, daemon=True, name="strongties-budget")
+        sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+            peak_mb = round(max(peak[0], self.rss()) / _MB, 2)
+            self._peaks[name] = max(self._peaks.get(name, 0.0), peak_mb)
+            if peak_mb * _MB > self.limit:
+                logger.warning(f"Stage {name} peaked at {peak_mb:.0f} MB, over the {self.limit / _MB:.0f} MB budget")
+
+    def peaks(self) -> Dict[str, float]:
+        return dict(self._peaks)
+
+class SpillFrame:
+    """
+    An append-only DataFrame stored as partitions, spilled to Parquet on demand.
+
+    Partitions stay in memory until their combined size reaches the budget's
+    buffer share or the process exceeds the limit; then all buffered
+    partitions are written to ``spill_dir`` and released.
+
+    Parameters
+    ----------
+    spill_dir : str
+        Directory for Parquet part files.
+    budget : Optional[MemoryBudget]
+        Budget to check after each append (never spills on its own if None).
+    prefix : str
+        File name prefix for part files.
+
+    Methods
+    -------
+    append(df: pd.DataFrame)
+        Add a partition.
+    spill()
+        Write all buffered partitions to Parquet.
+    chunks(columns: Sequence[str] = None) -> Iterator[pd.DataFrame]
+        Partitions in append order, spilled ones read back one at a time.
+    to_frame(columns: Sequence[str] = None) -> pd.DataFrame
+        All partitions concatenated.
+    """
+
+    def __init__(self, spill_dir: str, budget: Optional[MemoryBudget] = None, prefix: str = "part"):
+        self.spill_dir = spill_dir
+        self.budget = budget
+        self.prefix = prefix
+        self.rows = 0
+        self.columns: Optional[List[str]] = None
+        # Each part is either a buffered DataFrame or the path of a spilled one
+        self._parts: List[Union[pd.DataFrame, str]] = []
+        self._buffered_bytes = 0
+        self._spilled = 0
+
+    @property
+    def paths(self) -> List[str]:
+        """Part files written so far."""
+        return [part for part in self._parts if isinstance(part, str)]
+
+    def append(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        if self.columns is None:
+            self.columns = list(df.columns)
+        self._parts.append(df.reset_index(drop=True))
+        self.rows += len(df)
+        self._buffered_bytes += int(df.memory_usage(index=False, deep=True).sum())
+        if self.budget is not None and (
+            self._buffered_bytes >= self.budget.buffer_bytes or self.budget.exceeded()
+        ):
+            self.spill()
+
+    def spill(self) -> None:
+        """Write buffered partitions to Parquet and drop them from memory."""
+        os.makedirs(self.spill_dir, exist_ok=True)
+        written = 0
+        for i, part in enumerate(self._parts):
+            if isinstance(part, pd.DataFrame):
+                path = os.path.join(self.spill_dir, f"{self.prefix}-{self._spilled:05d}.parquet")
+                part.to_parquet(path, index=False)
+                self._parts[i] = path
+                self._spilled += 1
+                written += len(part)
+        if written:
+            logger.info(f"Spilled {written} rows ({self._buffered_bytes / _MB:.1f} MB) to {self.spill_dir}")
+        self._buffered_bytes = 0
+
+    def chunks(self, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        for part in self._parts:
+            if isinstance(part, str):
+                yield pd.read_parquet(part, columns=list(columns) if columns else None)
+            else:
+                yield part[list(columns)] if columns else part
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        frames = list(self.chunks(columns))
+        if not frames:
+            return pd.DataFrame(columns=list(columns or self.columns or []))
+        return pd.concat(frames, ignore_index=True)
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     budget = MemoryBudget("1GB")
+#     frame = SpillFrame("/tmp/strongties-spill", budget)
+#     with budget.track("ingest"):
+#         for start in range(0, 1_000_000, 100_000):
+#             frame.append(pd.DataFrame({"user_id": "alice", "name": [f"p{i}" for i in range(start, start + 100_000)]}))
+#     print(frame.rows, len(frame.paths), budget.peaks())
@@ -9,11 +9,24 @@ Functions:
     compute_basic_metrics(G: nx.Graph) -> dict
     get_top_connectors(G: nx.Graph, top_n: int = 10) -> list
     detect_communities(G: nx.Graph) -> dict
+    compute_harmonic_centrality(G: nx.Graph, sample_size: int = 256, workers: int = 1, seed: int = 42) -> dict
+    compute_closeness_centrality(G: nx.Graph, sample_size: int = 256, workers: int = 1, seed: int = 42) -> dict
+    compute_sampled_centrality(G: nx.Graph, sample_size: int = 256, workers: int = 1, seed: int = 42) -> tuple
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import networkx as nx
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+from src.graph_builder import build_adjacency
+from src.profiling import traced
+from src.shared_graph import SharedAdjacency, worker_matrix
 
+# Upper bound on distance-matrix cells held in memory per BFS batch (~128 MB of float64)
+_BFS_BATCH_CELLS = 1 << 24
+
+@traced()
 def compute_basic_metrics(G: nx.Graph) -> Dict[str, float]:
     """
     Compute basic network metrics.
@@ -39,6 +52,7 @@ def compute_basic_metrics(G: nx.Graph) -> Dict[str, float]:
         "density": density
     }
 
+@traced()
 def get_top_connectors(G: nx.Graph, top_n: int = 10) -> List[Tuple[str, int]]:
     """
     Get the top connectors by degree.
@@ -59,6 +73,7 @@ def get_top_connectors(G: nx.Graph, top_n: int = 10) -> List[Tuple[str, int]]:
     sorted_connectors = sorted(degree_dict.items(), key=lambda x: x[1], reverse=True)
     return sorted_connectors[:top_n]
 
+@traced()
 def detect_communities(G: nx.Graph) -> Dict[int, List[str]]:
     """
     Detect communities using the greedy modularity algorithm.
@@ -77,6 +92,176 @@ def detect_communities(G: nx.Graph) -> Dict[int, List[str]]:
     communities = list(greedy_modularity_communities(G))
     return {i: [str(node) for node in comm] for i, comm in enumerate(communities)}
 
+def _pivot_distance_sums(matrix: sp.csr_array, pivots: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run BFS from each pivot and accumulate, for every node, the sum of inverse
+    distances, the sum of distances and the number of pivots that reach it.
+    """
+    n = matrix.shape[0]
+    inverse = np.zeros(n)
+    total = np.zeros(n)
+    reached = np.zeros(n, dtype=np.int64)
+    batch = max(1, _BFS_BATCH_CELLS // max(n, 1))
+    for start in range(0, len(pivots), batch):
+        dist = csgraph.shortest_path(
+            matrix, method="D", directed=False, unweighted=True, indices=pivots[start:start + batch]
+        )
+        # Pivots themselves (distance 0) and unreachable nodes (inf) don't count
+        finite = np.isfinite(dist) & (dist > 0)
+        with np.errstate(divide="ignore"):
+            inverse += np.where(finite, 1.0 / dist, 0.0).sum(axis=0)
+        total += np.where(finite, dist, 0.0).sum(axis=0)
+        reached += finite.sum(axis=0)
+    return inverse, total, reached
+
+def _worker_distance_sums(pivots: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return _pivot_distance_sums(worker_matrix(), pivots)
+
+def _sampled_distance_sums(
+    G: nx.Graph,
+    sample_size: Optional[int],
+    workers: int,
+    seed: int,
+    exact_below: int
+) -> Tuple[List[str], int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Accumulate pivot distance sums for every node, splitting pivots across
+    worker processes when requested, and return the per-node scale factor
+    that extrapolates pivot sums to all n - 1 other nodes.
+    """
+    adjacency = build_adjacency(G)
+    n = len(adjacency.nodes)
+    if sample_size is None or n <= exact_below or sample_size >= n:
+        pivots = np.arange(n)
+    else:
+        pivots = np.sort(np.random.default_rng(seed).choice(n, size=sample_size, replace=False))
+
+    if workers > 1 and len(pivots) > 1:
+        chunks = [c for c in np.array_split(pivots, workers) if len(c)]
+        # Workers attach to one shared copy of the adjacency instead of each
+        # unpickling their own
+        with SharedAdjacency(adjacency) as shared, shared.pool(len(chunks)) as pool:
+            parts = list(pool.map(_worker_distance_sums, chunks))
+        inverse, total, reached = (np.sum(arrays, axis=0) for arrays in zip(*parts))
+    else:
+        inverse, total, reached = _pivot_distance_sums(adjacency.matrix, pivots)
+
+    # Each node is compared against the pivots other than itself
+    is_pivot = np.zeros(n, dtype=bool)
+    is_pivot[pivots] = True
+    others = len(pivots) - is_pivot
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(others > 0, (n - 1) / others, 0.0)
+    return adjacency.nodes, n, inverse, total, reached, scale
+
+def _closeness(n: int, total: np.ndarray, reached: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Closeness with the Wasserman-Faust correction from pivot distance sums."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, (reached / total) * (reached * scale) / max(n - 1, 1), 0.0)
+
+@traced()
+def compute_sampled_centrality(
+    G: nx.Graph,
+    sample_size: Optional[int] = 256,
+    workers: int = 1,
+    seed: int = 42,
+    exact_below: int = 2000
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Estimate closeness and harmonic centrality from one set of sampled BFS pivots.
+
+    Both measures come from the same per-pivot distance sums, so computing
+    them together runs the BFS sweep (and starts the worker pool) once.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    sample_size : Optional[int]
+        Number of BFS pivots; ``None`` computes the exact values.
+    workers : int
+        Number of worker processes sharing the pivots.
+    seed : int
+        Random seed for pivot selection.
+    exact_below : int
+        Graphs with at most this many nodes are computed exactly.
+
+    Returns
+    -------
+    Tuple[dict, dict]
+        Closeness and harmonic centrality by node, as returned by
+        ``compute_closeness_centrality`` and ``compute_harmonic_centrality``.
+    """
+    nodes, n, inverse, total, reached, scale = _sampled_distance_sums(G, sample_size, workers, seed, exact_below)
+    closeness = _closeness(n, total, reached, scale)
+    return dict(zip(nodes, closeness.tolist())), dict(zip(nodes, (inverse * scale).tolist()))
+
+@traced()
+def compute_harmonic_centrality(
+    G: nx.Graph,
+    sample_size: Optional[int] = 256,
+    workers: int = 1,
+    seed: int = 42,
+    exact_below: int = 2000
+) -> Dict[str, float]:
+    """
+    Estimate harmonic centrality (sum of inverse distances) from sampled BFS pivots.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    sample_size : Optional[int]
+        Number of BFS pivots; ``None`` computes the exact value.
+    workers : int
+        Number of worker processes sharing the pivots.
+    seed : int
+        Random seed for pivot selection.
+    exact_below : int
+        Graphs with at most this many nodes are computed exactly.
+
+    Returns
+    -------
+    dict
+        Mapping from node to harmonic centrality, on the same scale as
+        ``nx.harmonic_centrality``.
+    """
+    nodes, n, inverse, _, _, scale = _sampled_distance_sums(G, sample_size, workers, seed, exact_below)
+    return dict(zip(nodes, (inverse * scale).tolist()))
+
+@traced()
+def compute_closeness_centrality(
+    G: nx.Graph,
+    sample_size: Optional[int] = 256,
+    workers: int = 1,
+    seed: int = 42,
+    exact_below: int = 2000
+) -> Dict[str, float]:
+    """
+    Estimate closeness centrality from sampled BFS pivots.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    sample_size : Optional[int]
+        Number of BFS pivots; ``None`` computes the exact value.
+    workers : int
+        Number of worker processes sharing the pivots.
+    seed : int
+        Random seed for pivot selection.
+    exact_below : int
+        Graphs with at most this many nodes are computed exactly.
+
+    Returns
+    -------
+    dict
+        Mapping from node to closeness centrality, using the Wasserman-Faust
+        correction for disconnected graphs like ``nx.closeness_centrality``.
+    """
+    nodes, n, _, total, reached, scale = _sampled_distance_sums(G, sample_size, workers, seed, exact_below)
+    return dict(zip(nodes, _closeness(n, total, reached, scale).tolist()))
+
 # Example usage (uncomment for script use):
 # if __name__ == "__main__":
 #     import data_loader, graph_builder
@@ -0,0 +1,588 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+pipeline.py
+
+The StrongTies analysis pipeline as a DAG of cached stages:
+
+    ingest -> aliases -> sanitize -> graph -> metrics -> reports
+                                                    \\-> figures
+
+The aliases stage clusters company name variants ("Acme Corp", "ACME
+Inc.") into canonical names; sanitize (which also reads the ingested rows)
+applies the map and the graph stage matches target companies against it.
+
+Every stage output is content-addressed: its key is a hash of the stage
+name and version, its parameters, the keys of the stages it depends on and,
+for ingest, the bytes of the input CSVs. Outputs are stored under
+``<cache_dir>/<stage>/<key>/``; a stage whose key already exists is skipped
+and its output is only loaded if a downstream stage has to run. Changing a
+report option therefore reruns only the reports stage.
+
+With a memory limit, ingest and sanitize work partition by partition and
+keep their outputs as Parquet parts, the graph is built from those parts
+one at a time, and every stage that runs reports its peak memory.
+
+Functions:
+    source_digest(paths: list) -> str
+    strongties_stages(data_dir: str, targets: dict = None, ..., partitioned: bool = False, budget: MemoryBudget = None) -> list
+    run_strongties(data_dir: str, output_dir: str, cache_dir: str = None, ...) -> dict
+
+Classes:
+    Stage
+    StageResult
+    ArtifactStore
+    Pipeline
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import pandas as pd
+from src.memory_budget import MemoryBudget, SpillFrame
+from src.profiling import span
+
+logger = logging.getLogger("strongties")
+
+PIPELINE_VERSION = "1"
+
+class Stage(NamedTuple):
+    """
+    One pipeline stage.
+
+    Attributes
+    ----------
+    name : str
+        Stage name.
+    run : Callable
+        Called as ``run(inputs, params, workdir)``; ``inputs`` maps dependency
+        names to their outputs and ``workdir`` is the stage's artifact
+        directory (for stages that write files).
+    deps : Tuple[str, ...]
+        Names of upstream stages.
+    params : dict
+        JSON-serializable parameters; part of the cache key.
+    kind : str
+        Output format: "frame" (Parquet), "pickle", or "files" (whatever
+        ``run`` wrote to ``workdir``; ``run`` returns the file names and
+        dependents receive their absolute paths).
+    version : str
+        Bump to invalidate cached outputs when the stage's code changes.
+    source : Optional[Callable[[], str]]
+        Digest of external inputs (e.g. input files); part of the cache key.
+    """
+    name: str
+    run: Callable[[Dict[str, Any], Dict[str, Any], str], Any]
+    deps: Tuple[str, ...] = ()
+    params: Dict[str, Any] = {}
+    kind: str = "pickle"
+    version: str = "1"
+    source: Optional[Callable[[], str]] = None
+
+class StageResult(NamedTuple):
+    """
+    Outcome of one stage: its key, "cached" or "ran", seconds, artifact
+    directory and, for stages run under a memory budget, peak RSS in MB.
+    """
+    name: str
+    key: str
+    status: str
+    seconds: float
+    path: str
+    peak_mb: Optional[float] = None
+
+class ArtifactStore:
+    """
+    Content-addressed stage outputs on disk.
+
+    Parameters
+    ----------
+    root : str
+        Cache directory.
+    """
+
+    _FILES = {"frame": "artifact.parquet", "pickle": "artifact.pkl"}
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, stage: str, key: str) -> str:
+        return os.path.join(self.root, stage, key)
+
+    def has(self, stage: str, key: str) -> bool:
+        return os.path.exists(os.path.join(self.path(stage, key), "meta.json"))
+
+    def load(self, stage: Stage, key: str) -> Any:
+        path = self.path(stage.name, key)
+        if stage.kind == "frame":
+            return pd.read_parquet(os.path.join(path, self._FILES["frame"]))
+        if stage.kind == "pickle":
+            with open(os.path.join(path, self._FILES["pickle"]), "rb") as f:
+                return pickle.load(f)
+        with open(os.path.join(path, "meta.json")) as f:
+            return [os.path.join(path, name) for name in json.load(f)["files"]]
+
+    def save(self, stage: Stage, key: str, run: Callable[[str], Any]) -> Any:
+        """
+        Run ``run(workdir)`` in a scratch directory, store its output, then
+        move the directory into place so readers never see partial artifacts.
+        """
+        final = self.path(stage.name, key)
+        workdir = f"{final}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(workdir)
+        try:
+            output = run(workdir)
+            meta = {"stage": stage.name, "key": key, "params": stage.params, "created": time.time()}
+            if stage.kind == "frame":
+                output.to_parquet(os.path.join(workdir, self._FILES["frame"]), index=False)
+            elif stage.kind == "pickle":
+                with open(os.path.join(workdir, self._FILES["pickle"]), "wb") as f:
+                    pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                meta["files"] = list(output)
+            with open(os.path.join(workdir, "meta.json"), "w") as f:
+                json.dump(meta, f, indent=2, default=str)
+            if os.path.exists(final):
+                shutil.rmtree(final)
+            os.replace(workdir, final)
+        finally:
+            if os.path.exists(workdir):
+                shutil.rmtree(workdir, ignore_errors=True)
+        return self.load(stage, key) if stage.kind == "files" else output
+
+class Pipeline:
+    """
+    Runs stages in dependency order, skipping stages whose outputs are cached.
+
+    Parameters
+    ----------
+    stages : Sequence[Stage]
+        Stages; each must come after the stages it depends on.
+    cache_dir : str
+        Artifact store directory.
+    budget : Optional[MemoryBudget]
+        If given, the peak memory of every stage that runs is recorded.
+
+    Methods
+    -------
+    keys() -> Dict[str, str]
+        Cache key of every stage.
+    run(until: str = None, force: Sequence[str] = ()) -> Dict[str, StageResult]
+        Run the pipeline (up to and including ``until``).
+    load(name: str) -> Any
+        Output of a stage from the last run.
+    """
+
+    def __init__(self, stages: Sequence[Stage], cache_dir: str, budget: Optional[MemoryBudget] = None):
+        self.stages = {}
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown or later stages: {missing}")
+            self.stages[stage.name] = stage
+        self.store = ArtifactStore(cache_dir)
+        self.budget = budget
+        self._outputs: Dict[str, Any] = {}
+        self._keys: Optional[Dict[str, str]] = None
+
+    def keys(self) -> Dict[str, str]:
+        """Compute every stage's key from its parameters, sources and upstream keys."""
+        if self._keys is None:
+            keys = {}
+            for stage in self.stages.values():
+                spec = {
+                    "pipeline": PIPELINE_VERSION,
+                    "stage": stage.name,
+                    "version": stage.version,
+                    "params": stage.params,
+                    "deps": {dep: keys[dep] for dep in stage.deps},
+                    "source": stage.source() if stage.source else None
+                }
+                blob = json.dumps(spec, sort_keys=True, default=str).encode("utf-8")
+                keys[stage.name] = hashlib.sha256(blob).hexdigest()[:16]
+            self._keys = keys
+        return self._keys
+
+    def _required(self, until: Optional[str]) -> List[str]:
+        """Stages needed to produce ``until`` (all stages if None), in order."""
+        if until is None:
+            return list(self.stages)
+        if until not in self.stages:
+            raise ValueError(f"Unknown stage: {until}")
+        needed, pending = set(), [until]
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].deps)
+        return [name for name in self.stages if name in needed]
+
+    def load(self, name: str) -> Any:
+        """Return a stage's output, loading it from the store if needed."""
+        if name not in self._outputs:
+            self._outputs[name] = self.store.load(self.stages[name], self.keys()[name])
+        return self._outputs[name]
+
+    def run(self, until: Optional[str] = None, force: Sequence[str] = ()) -> Dict[str, StageResult]:
+        """
+        Run the pipeline.
+
+        Parameters
+        ----------
+        until : Optional[str]
+            Last stage to produce (default: all stages).
+        force : Sequence[str]
+            Stages to rerun even if cached; their dependents rerun as well
+            because their outputs are rewritten under the same keys.
+
+        Returns
+        -------
+        Dict[str, StageResult]
+            Result per stage, in run order.
+        """
+        unknown = set(force) - set(self.stages)
+        if unknown:
+            raise ValueError(f"Unknown stages: {sorted(unknown)}")
+        keys = self.keys()
+        rerun = set(force)
+        results = {}
+        for name in self._required(until):
+            stage = self.stages[name]
+            key = keys[name]
+            start = time.perf_counter()
+            peak_mb = None
+            if self.store.has(name, key) and name not in rerun and not rerun & set(stage.deps):
+                status = "cached"
+            else:
+                rerun.add(name)
+                with span(f"stage:{name}"), (self.budget.track(name) if self.budget else nullcontext()):
+                    inputs = {dep: self.load(dep) for dep in stage.deps}
+                    self._outputs[name] = self.store.save(
+                        stage, key, lambda workdir: stage.run(inputs, stage.params, workdir)
+                    )
+                status = "ran"
+                if self.budget:
+                    peak_mb = self.budget.peaks()[name]
+            results[name] = StageResult(
+                name, key, status, round(time.perf_counter() - start, 4), self.store.path(name, key), peak_mb
+            )
+            logger.info(f"Stage {name} [{key}]: {status} in {results[name].seconds:.2f}s"
+                        + (f", peak {peak_mb:.0f} MB" if peak_mb is not None else ""))
+        return results
+
+# StrongTies stages
+
+def source_digest(paths: Sequence[str]) -> str:
+    """Hash file names and contents (order-independent)."""
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(os.path.basename(path).encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _ingest(data_dir: str) -> Callable:
+    def run(inputs, params, workdir):
+        from src.data_loader import list_connection_files, read_connections
+        sources = list_connection_files(data_dir)
+        if not sources:
+            return pd.DataFrame(columns=["First Name", "Last Name", "Company", "Position", "user_id"])
+
+        def read(source):
+            path, user_id = source
+            return read_connections(path, data_dir).assign(user_id=user_id)
+        with ThreadPoolExecutor(max_workers=min(len(sources), 8)) as pool:
+            frames = list(pool.map(read, sources))
+        return pd.concat(frames, ignore_index=True)
+    return run
+
+def _company_aliases(inputs):
+    from src.company_aliases import CompanyAliases
+    return CompanyAliases.from_frame(inputs["aliases"]) if "aliases" in inputs else None
+
+def _aliases(inputs, params, workdir):
+    from src.company_aliases import CompanyAliases
+    raw = inputs["ingest"]
+    if isinstance(raw, list):
+        # Partitioned ingest: only the Company column of each part is read
+        companies = pd.concat([pd.read_parquet(path, columns=["Company"])["Company"] for path in raw] or [pd.Series(dtype=object)])
+    else:
+        companies = raw["Company"]
+    return CompanyAliases.fit(companies, threshold=params["threshold"]).to_frame()
+
+def _sanitize(inputs, params, workdir):
+    from src.data_loader import clean_connections, combine_connections
+    raw = inputs["ingest"]
+    aliases = _company_aliases(inputs)
+    frames = [
+        clean_connections(
+            group.drop(columns="user_id"), user_id,
+            hash_ids=params["hash_ids"], obfuscate_names=params["obfuscate_names"], aliases=aliases
+        )
+        for user_id, group in raw.groupby("user_id", sort=False)
+    ]
+    combined = combine_connections(frames)
+    return combined.reset_index(drop=True) if not combined.empty else pd.DataFrame(columns=["name", "company", "position", "user_id"])
+
+def _ingest_partitioned(data_dir: str, budget: Optional[MemoryBudget]) -> Callable:
+    def run(inputs, params, workdir):
+        from src.data_loader import read_partitions
+        chunk_rows = budget.chunk_rows() if budget else 100_000
+        files = []
+        for i, (raw, user_id) in enumerate(read_partitions(data_dir, chunk_rows)):
+            name = f"raw-{i:05d}.parquet"
+            # The index (row number within the file) is kept for name obfuscation
+            raw.assign(user_id=user_id).to_parquet(os.path.join(workdir, name))
+            files.append(name)
+        return files
+    return run
+
+def _sanitize_partitioned(budget: Optional[MemoryBudget]) -> Callable:
+    def run(inputs, params, workdir):
+        from src.data_loader import clean_partitions
+        partitions = (
+            (raw.drop(columns="user_id"), raw["user_id"].iat[0])
+            for raw in (pd.read_parquet(path) for path in inputs["ingest"])
+            if not raw.empty
+        )
+        frame = clean_partitions(
+            partitions, SpillFrame(workdir, budget, prefix="connections"),
+            hash_ids=params["hash_ids"], obfuscate_names=params["obfuscate_names"], aliases=_company_aliases(inputs)
+        )
+        frame.spill()
+        return [os.path.basename(path) for path in frame.paths]
+    return run
+
+def _target_matcher(params: Dict[str, Any], aliases=None):
+    from src.target_preferences import TargetPreferences
+    targets = params["targets"]
+    if targets["companies"] or targets["roles"]:
+        return TargetPreferences(targets["companies"], targets["roles"]).compile(aliases)
+    return None
+
+def _annotate(G, members, matcher, target_names) -> None:
+    """Flag group members and target matches, as graph_construction.py does."""
+    import networkx as nx
+    nx.set_node_attributes(G, {str(user): True for user in members}, "is_member")
+    if matcher is not None:
+        nx.set_node_attributes(
+            G,
+            {node: bool(hit) or node in target_names for node, hit in zip(G.nodes(), matcher.match_nodes(G))},
+            "is_target"
+        )
+
+def _graph(inputs, params, workdir):
+    from src.graph_builder import build_connection_graph
+    df = inputs["sanitize"]
+    G = build_connection_graph(df, source_col="user_id", target_col="name")
+    if df.empty:
+        return G
+    matcher = _target_matcher(params, _company_aliases(inputs))
+    target_names = set(df.loc[matcher.match_frame(df), "name"].astype(str)) if matcher else set()
+    _annotate(G, df["user_id"].unique(), matcher, target_names)
+    return G
+
+def _graph_partitioned(inputs, params, workdir):
+    from src.graph_builder import build_graph_from_chunks
+    matcher = _target_matcher(params, _company_aliases(inputs))
+    members, target_names = set(), set()
+
+    def chunks():
+        # One pass over the parts: edges, members and target rows together
+        for path in inputs["sanitize"]:
+            chunk = pd.read_parquet(path)
+            members.update(chunk["user_id"].unique())
+            if matcher:
+                target_names.update(chunk.loc[matcher.match_frame(chunk), "name"].astype(str))
+            yield chunk
+    G = build_graph_from_chunks(chunks(), source_col="user_id", target_col="name")
+    _annotate(G, members, matcher, target_names)
+    return G
+
+def _metrics(inputs, params, workdir):
+    from src.network_metrics import (
+        compute_basic_metrics, compute_sampled_centrality, detect_communities
+    )
+    G = inputs["graph"]
+    samples, workers = params["centrality_samples"], params.get("workers", 1)
+    communities = detect_communities(G) if G.number_of_nodes() <= params["max_community_nodes"] else {}
+    closeness, harmonic = compute_sampled_centrality(G, sample_size=samples, workers=workers)
+    return {
+        "basic": compute_basic_metrics(G),
+        "closeness": closeness,
+        "harmonic": harmonic,
+        "communities": communities
+    }
+
+def _reports(inputs, params, workdir):
+    from src.intro_scoring import IntroductionScorer
+    from src.reports import write_reports
+    G, metrics = inputs["graph"], inputs["metrics"]
+    closeness = metrics["closeness"]
+    paths = write_reports(
+        G, workdir, metrics["basic"],
+        communities=metrics["communities"],
+        centrality={"closeness": closeness, "harmonic": metrics["harmonic"]},
+        top_n=params["top_connectors"],
+        csv=params["node_csv"]
+    )
+    members = [node for node, data in G.nodes(data=True) if data.get("is_member", False)]
+    targets = [node for node, data in G.nodes(data=True) if data.get("is_target", False)]
+    scorer = IntroductionScorer(G, members=members, targets=targets, centrality=closeness)
+    scorer.rank(params["score_weights"], top_k=params["top_k"]).to_csv(
+        os.path.join(workdir, "introduction_scores.csv"), index=False
+    )
+    return list(paths) + ["introduction_scores.csv"]
+
+def _figures(inputs, params, workdir):
+    from src.visualization import LayoutStore, render_network
+    G, metrics = inputs["graph"], inputs["metrics"]
+    store = LayoutStore(cache_dir=params["layout_cache"]) if params.get("layout_cache") else None
+    files = []
+    if G.number_of_nodes() == 0:
+        return files
+    figures = [("network", None, "Professional Social Network")]
+    if metrics["communities"]:
+        figures.append(("communities", metrics["communities"], "Network Communities"))
+    for name, communities, title in figures:
+        fig = render_network(G, store=store, communities=communities, title=title, dpi=params["dpi"])
+        for fmt in params["formats"]:
+            filename = f"{name}.{fmt}"
+            fig.savefig(os.path.join(workdir, filename), dpi=params["dpi"])
+            files.append(filename)
+    return files
+
+def strongties_stages(
+    data_dir: str,
+    targets: Optional[Dict[str, List[str]]] = None,
+    hash_ids: bool = False,
+    obfuscate_names: bool = False,
+    centrality_samples: int = 256,
+    workers: int = 1,
+    max_community_nodes: int = 50_000,
+    score_weights: Optional[Dict[str, float]] = None,
+    top_k: int = 50,
+    top_connectors: int = 20,
+    node_csv: bool = False,
+    figure_formats: Sequence[str] = ("png",),
+    dpi: int = 150,
+    layout_cache: Optional[str] = None,
+    partitioned: bool = False,
+    budget: Optional[MemoryBudget] = None,
+    company_alias_threshold: Optional[float] = 0.75
+) -> List[Stage]:
+    """
+    Define the StrongTies stages for a data directory and configuration.
+
+    Parameters mirror ``scripts/graph_construction.py`` and
+    ``scripts/network_analysis.py``; each stage's cache key only includes the
+    parameters that stage uses. ``workers``, ``layout_cache`` and ``budget``
+    affect speed or memory, not results, and are left out of the keys.
+    With ``partitioned`` (implied by a budget), ingest and sanitize store
+    Parquet parts and the graph is built from them one part at a time.
+    ``company_alias_threshold`` is the n-gram similarity at which company
+    names are merged (see ``build_alias_map``); None skips the aliases stage.
+
+    Returns
+    -------
+    list of Stage
+    """
+    targets = targets or {}
+    from src.data_loader import list_connection_files
+    sources = lambda: source_digest([path for path, _ in list_connection_files(data_dir)])
+    # Speed-only settings are bound into the run functions instead of params
+    metrics_run = lambda inputs, params, workdir: _metrics(inputs, {**params, "workers": workers}, workdir)
+    figures_run = lambda inputs, params, workdir: _figures(inputs, {**params, "layout_cache": layout_cache}, workdir)
+    partitioned = partitioned or budget is not None
+    if partitioned:
+        ingest, sanitize, graph, kind = _ingest_partitioned(data_dir, budget), _sanitize_partitioned(budget), _graph_partitioned, "files"
+    else:
+        ingest, sanitize, graph, kind = _ingest(data_dir), _sanitize, _graph, "frame"
+    aliases = ("aliases",) if company_alias_threshold is not None else ()
+    stages = [
+        Stage("ingest", ingest, kind=kind, source=sources, params={"partitioned": partitioned}),
+        Stage("aliases", _aliases, deps=("ingest",), kind="frame", params={"threshold": company_alias_threshold}),
+        Stage("sanitize", sanitize, deps=("ingest",) + aliases, kind=kind,
+              params={"hash_ids": hash_ids, "obfuscate_names": obfuscate_names, "partitioned": partitioned}),
+        Stage("graph", graph, deps=("sanitize",) + aliases, params={"targets": {
+            "companies": list(targets.get("companies", [])), "roles": list(targets.get("roles", []))
+        }}),
+        Stage("metrics", metrics_run, deps=("graph",), params={
+            "centrality_samples": centrality_samples, "max_community_nodes": max_community_nodes
+        }),
+        Stage("reports", _reports, deps=("graph", "metrics"), kind="files", version="3", params={
+            "score_weights": score_weights, "top_k": top_k, "top_connectors": top_connectors, "node_csv": node_csv
+        }),
+        Stage("figures", figures_run, deps=("graph", "metrics"), kind="files", params={
+            "formats": list(figure_formats), "dpi": dpi
+        })
+    ]
+    return [stage for stage in stages if stage.name != "aliases" or aliases]
+
+def _publish(pipeline: Pipeline, stage: str, destination: str) -> List[str]:
+    """Copy a files stage's outputs into ``destination``."""
+    os.makedirs(destination, exist_ok=True)
+    copied = []
+    for path in pipeline.load(stage):
+        copied.append(shutil.copy2(path, os.path.join(destination, os.path.basename(path))))
+    return copied
+
+def run_strongties(
+    data_dir: str,
+    output_dir: str,
+    cache_dir: Optional[str] = None,
+    until: Optional[str] = None,
+    force: Sequence[str] = (),
+    memory_limit: Optional[str] = None,
+    **config
+) -> Dict[str, StageResult]:
+    """
+    Run the StrongTies pipeline and publish reports and figures.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory with the connection CSVs.
+    output_dir : str
+        Reports go to ``<output_dir>/reports`` and figures to ``<output_dir>/figures``.
+    cache_dir : Optional[str]
+        Artifact store (default: ``<output_dir>/.cache``).
+    until : Optional[str]
+        Last stage to run (default: all).
+    force : Sequence[str]
+        Stages to rerun even if cached.
+    memory_limit : Optional[str]
+        Memory budget such as "2GB": ingestion runs partitioned and spills to
+        Parquet, and each stage that runs reports its peak memory.
+    **config
+        Passed to ``strongties_stages``.
+
+    Returns
+    -------
+    Dict[str, StageResult]
+    """
+    cache_dir = cache_dir or os.path.join(output_dir, ".cache")
+    config.setdefault("layout_cache", os.path.join(cache_dir, "layouts"))
+    budget = MemoryBudget(memory_limit) if memory_limit else None
+    pipeline = Pipeline(strongties_stages(data_dir, budget=budget, **config), cache_dir, budget=budget)
+    results = pipeline.run(until=until, force=force)
+    for stage, folder in (("reports", "reports"), ("figures", "figures")):
+        if stage in results:
+            _publish(pipeline, stage, os.path.join(output_dir, folder))
+    return results
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     results = run_strongties("../data", "../results", targets={"companies": ["Globex"], "roles": ["engineer"]})
+#     for result in results.values():
+#         print(result.name, result.status, result.seconds)
@@ -14,9 +14,11 @@ import pandas as pd
 import unicodedata
 import hashlib
 from typing import List
+from src.profiling import span, traced
 
 ALLOWED_COLUMNS = ["First Name", "Last Name", "Company", "Position"]
 
+@traced()
 def sanitize_csv(
     df: pd.DataFrame,
     hash_ids: bool = False,
@@ -49,8 +51,9 @@ def sanitize_csv(
         df = df[ALLOWED_COLUMNS]
 
     # Normalize names
-    for col in ["First Name", "Last Name"]:
-        df[col] = df[col].astype(str).apply(_normalize_name)
+    with span("normalize_names", rows=len(df)):
+        for col in ["First Name", "Last Name"]:
+            df[col] = df[col].astype(str).apply(_normalize_name)
 
     # Hash identifiers if requested
     if hash_ids:
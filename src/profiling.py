@@ -0,0 +1,316 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+profiling.py
+
+Stage-level timing and memory instrumentation for StrongTies runs.
+
+Pipeline stages are wrapped in spans, either with the ``span`` context
+manager or the ``traced`` decorator. While profiling is enabled, each span
+records wall time, CPU time, resident memory at start/end and its peak
+(sampled by a background thread via psutil), plus row/node/edge counts.
+Spans nest per thread, so a trace shows which stage spent the time. While
+profiling is disabled (the default), spans cost a single flag check and
+psutil is never imported.
+
+Functions:
+    enable_profiling(interval: float = 0.01)
+    disable_profiling()
+    profiling_enabled() -> bool
+    span(name: str, **counts) -> ContextManager[Span]
+    traced(name: str = None) -> Callable
+    get_trace() -> list
+    summarize_trace(records: list = None) -> pd.DataFrame
+    write_trace(path: str, records: list = None) -> pd.DataFrame
+
+Classes:
+    Span
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("strongties")
+
+_MB = 1024 * 1024
+
+class _Tracer:
+    """Process-wide span collector with a background RSS sampler."""
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[Dict] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._active: Dict[int, "Span"] = {}
+        self._process = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def rss(self) -> int:
+        return self._process.memory_info().rss
+
+    def stack(self) -> List["Span"]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def start(self, interval: float) -> None:
+        import psutil
+        self._process = psutil.Process(os.getpid())
+        self.records = []
+        self.origin = time.perf_counter()
+        self._stop.clear()
+        self.enabled = True
+        self._sampler = threading.Thread(target=self._sample, args=(interval,), daemon=True, name="strongties-rss")
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self.enabled = False
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self, interval: float) -> None:
+        """Raise the peak of every open span to the current RSS, until stopped."""
+        while not self._stop.wait(interval):
+            rss = self.rss()
+            with self._lock:
+                for active in self._active.values():
+                    active.peak = max(active.peak, rss)
+
+    def open(self, span: "Span") -> None:
+        with self._lock:
+            self._active[id(span)] = span
+
+    def close(self, span: "Span", record: Dict) -> None:
+        with self._lock:
+            self._active.pop(id(span), None)
+            self.records.append(record)
+
+_tracer = _Tracer()
+
+class Span:
+    """
+    A running span; use ``set`` to attach counts known only inside the stage.
+
+    Methods
+    -------
+    set(**counts)
+        Record counts such as rows, nodes or edges.
+    """
+
+    def __init__(self, name: str, counts: Dict[str, Any]):
+        self.name = name
+        self.counts = dict(counts)
+        self.peak = 0
+
+    def set(self, **counts) -> None:
+        self.counts.update(counts)
+
+class _NullSpan(Span):
+    """Span yielded while profiling is disabled; ignores counts."""
+
+    def set(self, **counts) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan("", {})
+
+def enable_profiling(interval: float = 0.01) -> None:
+    """
+    Start collecting spans (clearing earlier records).
+
+    Parameters
+    ----------
+    interval : float
+        Seconds between RSS samples used for per-span peak memory.
+    """
+    if _tracer.enabled:
+        _tracer.stop()
+    _tracer.start(interval)
+
+def disable_profiling() -> None:
+    """Stop collecting spans; recorded spans stay available via ``get_trace``."""
+    _tracer.stop()
+
+def profiling_enabled() -> bool:
+    return _tracer.enabled
+
+@contextmanager
+def span(name: str, **counts) -> Iterator[Span]:
+    """
+    Time a block of code as a named stage.
+
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    **counts
+        Initial counts, e.g. ``rows=len(df)``.
+
+    Yields
+    ------
+    Span
+        The running span (a no-op span when profiling is disabled).
+    """
+    if not _tracer.enabled:
+        yield _NULL_SPAN
+        return
+    current = Span(name, counts)
+    stack = _tracer.stack()
+    parent = stack[-1].name if stack else None
+    rss_start = _tracer.rss()
+    current.peak = rss_start
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    stack.append(current)
+    _tracer.open(current)
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        wall, cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+        stack.pop()
+        rss_end = _tracer.rss()
+        record = {
+            "name": name,
+            "parent": parent,
+            "depth": len(stack),
+            "thread": threading.current_thread().name,
+            "start_s": round(start_wall - _tracer.origin, 6),
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "rss_start_mb": round(rss_start / _MB, 2),
+            "rss_end_mb": round(rss_end / _MB, 2),
+            "rss_peak_mb": round(max(current.peak, rss_end) / _MB, 2),
+            "counts": current.counts
+        }
+        if error:
+            record["error"] = error
+        _tracer.close(current, record)
+
+def _counts(obj: Any, prefix: str = "") -> Dict[str, int]:
+    """Rows of a frame or nodes/edges of a graph, detected by duck typing."""
+    if hasattr(obj, "number_of_nodes") and hasattr(obj, "number_of_edges"):
+        return {f"{prefix}nodes": obj.number_of_nodes(), f"{prefix}edges": obj.number_of_edges()}
+    if hasattr(obj, "columns") and hasattr(obj, "shape"):
+        return {f"{prefix}rows": int(obj.shape[0])}
+    return {}
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator that runs a function inside a span.
+
+    The span records counts for the first argument (prefixed ``in_``) and the
+    return value when they are data frames or graphs.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        Stage name (default: the function name).
+    """
+    def decorate(fn: Callable) -> Callable:
+        stage = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            with span(stage, **(_counts(args[0], "in_") if args else {})) as current:
+                result = fn(*args, **kwargs)
+                current.set(**_counts(result))
+                return result
+        return wrapper
+    return decorate
+
+def get_trace() -> List[Dict]:
+    """Return the recorded spans in completion order."""
+    with _tracer._lock:
+        return list(_tracer.records)
+
+def summarize_trace(records: Optional[List[Dict]] = None):
+    """
+    Aggregate spans by stage name.
+
+    Parameters
+    ----------
+    records : Optional[list]
+        Span records (default: the current trace).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per stage with calls, total/max wall time, total CPU time,
+        peak RSS and summed counts, sorted by total wall time.
+    """
+    import pandas as pd
+    records = get_trace() if records is None else records
+    rows = {}
+    for record in records:
+        row = rows.setdefault(record["name"], {
+            "stage": record["name"], "calls": 0, "wall_s": 0.0, "max_wall_s": 0.0,
+            "cpu_s": 0.0, "rss_peak_mb": 0.0
+        })
+        row["calls"] += 1
+        row["wall_s"] += record["wall_s"]
+        row["max_wall_s"] = max(row["max_wall_s"], record["wall_s"])
+        row["cpu_s"] += record["cpu_s"]
+        row["rss_peak_mb"] = max(row["rss_peak_mb"], record["rss_peak_mb"])
+        for key, value in record["counts"].items():
+            if isinstance(value, (int, float)):
+                row[key] = row.get(key, 0) + value
+    summary = pd.DataFrame(list(rows.values()))
+    if summary.empty:
+        return summary
+    base = ["stage", "calls", "wall_s", "max_wall_s", "cpu_s", "rss_peak_mb"]
+    for column in summary.columns.difference(base):
+        values = summary[column].dropna()
+        if (values == values.round()).all():
+            summary[column] = summary[column].astype("Int64")
+    return summary.sort_values("wall_s", ascending=False, kind="stable").reset_index(drop=True)
+
+def write_trace(path: str, records: Optional[List[Dict]] = None):
+    """
+    Write spans and their summary as JSON and return the summary table.
+
+    Parameters
+    ----------
+    path : str
+        Output JSON path; parent directories are created.
+    records : Optional[list]
+        Span records (default: the current trace).
+
+    Returns
+    -------
+    pd.DataFrame
+        The summary from ``summarize_trace``.
+    """
+    records = get_trace() if records is None else records
+    summary = summarize_trace(records)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"spans": records, "summary": summary.to_dict(orient="records")}, f, indent=2, default=str)
+    logger.info(f"Profile trace with {len(records)} spans saved to {path}")
+    return summary
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder
+#     enable_profiling()
+#     with span("pipeline"):
+#         df = data_loader.load_all_connections("../data")
+#         G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     disable_profiling()
+#     print(write_trace("../results/profile.json").to_string(index=False))
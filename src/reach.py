@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+reach.py
+
+Computes second-degree reach for group members with sparse adjacency products.
+
+A contact is in a member's second-degree reach when it can be reached through
+exactly one intermediary but is neither the member nor a direct contact. The
+rows of A² for all members are computed in a single sparse product and masked,
+so hub-heavy graphs never fall back to per-node neighbor loops.
+
+Functions:
+    compute_second_degree_reach(G: nx.Graph, members: list = None, adjacency: InternedAdjacency = None, workers: int = 1) -> pd.DataFrame
+    get_second_degree_contacts(G: nx.Graph, member: str, adjacency: InternedAdjacency = None) -> list
+    compute_company_reach(G: nx.Graph, members: list = None, companies: dict = None, adjacency: InternedAdjacency = None) -> pd.DataFrame
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import networkx as nx
+import scipy.sparse as sp
+from src.graph_builder import InternedAdjacency, build_adjacency
+from src.shared_graph import SharedAdjacency, worker_matrix
+
+def _resolve_members(adjacency: InternedAdjacency, members: Optional[List[str]]) -> np.ndarray:
+    """Map member labels to node ids, defaulting to every node in the graph."""
+    if members is None:
+        return np.arange(len(adjacency.nodes))
+    missing = [m for m in members if str(m) not in adjacency.index]
+    if missing:
+        raise ValueError(f"Members not found in graph: {missing}")
+    return np.asarray([adjacency.index[str(m)] for m in members], dtype=np.int64)
+
+def _second_degree_matrix(A: sp.csr_array, member_ids: np.ndarray) -> sp.csr_array:
+    """
+    Return a k x n sparse matrix whose row i holds, for member i, the number of
+    intermediaries leading to each second-degree node.
+    """
+    k, n = len(member_ids), A.shape[0]
+    first = A[member_ids]
+    two_hop = sp.csr_array(first @ A)
+    self_mask = sp.csr_array(
+        (np.ones(k, dtype=np.int32), (np.arange(k), member_ids)), shape=(k, n)
+    )
+    exclude = (first + self_mask) > 0
+    two_hop = sp.csr_array(two_hop - two_hop.multiply(exclude))
+    two_hop.eliminate_zeros()
+    return two_hop
+
+def _reach_counts(A: sp.csr_array, member_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """First- and second-degree contact counts for each member."""
+    first = A[member_ids]
+    self_loops = A.diagonal()[member_ids] > 0
+    two_hop = _second_degree_matrix(A, member_ids)
+    return np.diff(first.indptr) - self_loops, np.diff(two_hop.indptr)
+
+def _worker_reach_counts(member_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return _reach_counts(worker_matrix(), member_ids)
+
+def compute_second_degree_reach(
+    G: nx.Graph,
+    members: Optional[List[str]] = None,
+    adjacency: Optional[InternedAdjacency] = None,
+    workers: int = 1
+) -> pd.DataFrame:
+    """
+    Count first- and second-degree contacts for each member.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    members : Optional[List[str]]
+        Nodes to compute reach for (default: every node).
+    adjacency : Optional[InternedAdjacency]
+        Precomputed adjacency for ``G``; built on the fly if omitted.
+    workers : int
+        Number of worker processes sharing the members; they read the
+        adjacency from shared memory.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per member with columns user_id, first_degree, second_degree.
+    """
+    adjacency = adjacency or build_adjacency(G)
+    member_ids = _resolve_members(adjacency, members)
+    if len(member_ids) == 0:
+        return pd.DataFrame(columns=["user_id", "first_degree", "second_degree"])
+    if workers > 1 and len(member_ids) > 1:
+        chunks = [c for c in np.array_split(member_ids, workers) if len(c)]
+        with SharedAdjacency(adjacency) as shared, shared.pool(len(chunks)) as pool:
+            parts = list(pool.map(_worker_reach_counts, chunks))
+        first_degree, second_degree = (np.concatenate(arrays) for arrays in zip(*parts))
+    else:
+        first_degree, second_degree = _reach_counts(adjacency.matrix, member_ids)
+    nodes = np.asarray(adjacency.nodes, dtype=object)
+    return pd.DataFrame({
+        "user_id": nodes[member_ids],
+        "first_degree": first_degree,
+        "second_degree": second_degree
+    })
+
+def get_second_degree_contacts(
+    G: nx.Graph,
+    member: str,
+    adjacency: Optional[InternedAdjacency] = None
+) -> List[str]:
+    """
+    List the contacts a member can reach through exactly one intermediary.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    member : str
+        Node to compute reach for.
+    adjacency : Optional[InternedAdjacency]
+        Precomputed adjacency for ``G``; built on the fly if omitted.
+
+    Returns
+    -------
+    list of str
+        Second-degree contacts, sorted by number of intermediaries descending.
+    """
+    adjacency = adjacency or build_adjacency(G)
+    member_ids = _resolve_members(adjacency, [member])
+    two_hop = _second_degree_matrix(adjacency.matrix, member_ids)
+    order = np.argsort(-two_hop.data, kind="stable")
+    return [adjacency.nodes[i] for i in two_hop.indices[order]]
+
+def compute_company_reach(
+    G: nx.Graph,
+    members: Optional[List[str]] = None,
+    companies: Optional[Dict[str, str]] = None,
+    adjacency: Optional[InternedAdjacency] = None
+) -> pd.DataFrame:
+    """
+    Count each member's second-degree contacts per company.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph.
+    members : Optional[List[str]]
+        Nodes to compute reach for (default: every node).
+    companies : Optional[Dict[str, str]]
+        Mapping from node to company (default: the ``company`` node attribute),
+        e.g. ``dict(zip(df["name"], df["company"]))``.
+    adjacency : Optional[InternedAdjacency]
+        Precomputed adjacency for ``G``; built on the fly if omitted.
+
+    Returns
+    -------
+    pd.DataFrame
+        Long-format table with columns user_id, company, reach, sorted by
+        member and reach descending. Nodes without a company are skipped.
+    """
+    columns = ["user_id", "company", "reach"]
+    adjacency = adjacency or build_adjacency(G)
+    if companies is None:
+        companies = nx.get_node_attributes(G, "company")
+    member_ids = _resolve_members(adjacency, members)
+
+    # One-hot node -> company matrix (n x c)
+    labels = pd.Series([companies.get(node) or None for node in adjacency.nodes], dtype=object)
+    codes, uniques = pd.factorize(labels)
+    has_company = codes >= 0
+    if len(member_ids) == 0 or not has_company.any():
+        return pd.DataFrame(columns=columns)
+    membership = sp.csr_array(
+        (
+            np.ones(int(has_company.sum()), dtype=np.int32),
+            (np.flatnonzero(has_company), codes[has_company])
+        ),
+        shape=(len(adjacency.nodes), len(uniques))
+    )
+
+    reached = _second_degree_matrix(adjacency.matrix, member_ids)
+    reached.data[:] = 1
+    counts = sp.coo_array(reached @ membership)
+    nodes = np.asarray(adjacency.nodes, dtype=object)
+    table = pd.DataFrame({
+        "user_id": nodes[member_ids][counts.row],
+        "company": np.asarray(uniques, dtype=object)[counts.col],
+        "reach": counts.data
+    })
+    table = table[table["reach"] > 0]
+    return table.sort_values(["user_id", "reach", "company"], ascending=[True, False, True]).reset_index(drop=True)
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder
+#     df = data_loader.load_all_connections("../data")
+#     G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     users = df["user_id"].unique().tolist()
+#     print(compute_second_degree_reach(G, users))
+#     print(compute_company_reach(G, users, dict(zip(df["name"], df["company"]))))
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+reports.py
+
+Writes network analysis reports from a single per-node table.
+
+All per-node outputs (degree, community id, centralities, member and target
+flags) are assembled column by column into one node table and written once
+as Parquet, optionally with a CSV copy streamed in chunks. The small summary
+CSVs meant for people stay alongside it:
+
+    nodes.parquet           one row per node: name, degree, community, centralities, flags
+    nodes.csv               the same table, only if requested
+    network_metrics.csv     node/edge counts, average degree, density
+    top_connectors.csv      top nodes by degree
+    community_sizes.csv     size and best-connected member of each community
+    target_connectors.csv   top connectors with their target match (if targets are set)
+
+Functions:
+    build_node_table(G: nx.Graph, communities: dict = None, centrality: dict = None) -> pd.DataFrame
+    write_node_table(table: pd.DataFrame, output_dir: str, csv: bool = False, chunk_rows: int = 100000) -> list
+    write_reports(G: nx.Graph, output_dir: str, metrics: dict, communities: dict = None, ...) -> dict
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import networkx as nx
+from src.profiling import traced
+from src.utils import ensure_dir
+
+logger = logging.getLogger("strongties")
+
+_ROW_GROUP_SIZE = 65536
+
+@traced()
+def build_node_table(
+    G: nx.Graph,
+    communities: Optional[Dict[int, list]] = None,
+    centrality: Optional[Dict[str, Dict]] = None
+) -> pd.DataFrame:
+    """
+    Assemble every per-node output into one columnar table.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph; ``is_member`` and ``is_target`` node attributes become flag columns.
+    communities : Optional[dict]
+        Community index to node list mapping.
+    centrality : Optional[Dict[str, dict]]
+        Per-node metrics by name, e.g. ``{"closeness": {...}, "harmonic": {...}}``.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns name, degree, community (-1 if none), one float column per
+        centrality metric, is_member and is_target, in graph node order.
+    """
+    nodes = pd.Index([str(node) for node in G.nodes()], dtype=object)
+    table = {
+        "name": nodes.to_numpy(),
+        "degree": np.fromiter((degree for _, degree in G.degree()), dtype=np.int32, count=len(nodes))
+    }
+
+    community = np.full(len(nodes), -1, dtype=np.int32)
+    if communities:
+        members = [str(member) for group in communities.values() for member in group]
+        labels = np.repeat(
+            np.fromiter(communities.keys(), dtype=np.int32, count=len(communities)),
+            [len(group) for group in communities.values()]
+        )
+        positions = nodes.get_indexer(members)
+        found = positions >= 0
+        community[positions[found]] = labels[found]
+    table["community"] = community
+
+    for metric, values in (centrality or {}).items():
+        series = pd.Series(values, dtype=float)
+        series.index = series.index.astype(str)
+        table[metric] = series.reindex(nodes).to_numpy()
+
+    for flag in ("is_member", "is_target"):
+        flags = nx.get_node_attributes(G, flag)
+        table[flag] = np.fromiter((bool(flags.get(node, False)) for node in G.nodes()), dtype=bool, count=len(nodes))
+    return pd.DataFrame(table)
+
+def write_node_table(
+    table: pd.DataFrame,
+    output_dir: str,
+    csv: bool = False,
+    chunk_rows: int = 100_000
+) -> List[str]:
+    """
+    Write the node table as Parquet and optionally as CSV.
+
+    Parameters
+    ----------
+    table : pd.DataFrame
+        Table from ``build_node_table``.
+    output_dir : str
+        Directory for ``nodes.parquet`` (and ``nodes.csv``).
+    csv : bool
+        Also write ``nodes.csv``, streamed ``chunk_rows`` rows at a time so
+        formatting never holds the whole file as text.
+    chunk_rows : int
+        Rows per CSV chunk.
+
+    Returns
+    -------
+    list of str
+        Paths written.
+    """
+    ensure_dir(output_dir)
+    parquet_path = os.path.join(output_dir, "nodes.parquet")
+    table.to_parquet(parquet_path, index=False, row_group_size=_ROW_GROUP_SIZE)
+    paths = [parquet_path]
+    if csv:
+        csv_path = os.path.join(output_dir, "nodes.csv")
+        with open(csv_path, "w", newline="") as f:
+            for start in range(0, max(len(table), 1), chunk_rows):
+                table.iloc[start:start + chunk_rows].to_csv(f, index=False, header=start == 0)
+        paths.append(csv_path)
+    logger.info(f"Node table with {len(table)} rows saved to {output_dir}")
+    return paths
+
+def _summary_tables(G: nx.Graph, table: pd.DataFrame, metrics: Dict, top_n: int) -> Dict[str, pd.DataFrame]:
+    """The human-readable summary reports, all derived from the node table."""
+    # Stable sort keeps graph order among equal degrees, like get_top_connectors
+    top = table.iloc[np.argsort(-table["degree"].to_numpy(), kind="stable")[:top_n]]
+    summaries = {
+        "network_metrics.csv": pd.DataFrame([metrics]),
+        "top_connectors.csv": top[["name", "degree"]]
+    }
+    in_community = table[table["community"] >= 0]
+    if not in_community.empty:
+        leaders = in_community.sort_values("degree", ascending=False, kind="stable").drop_duplicates("community")
+        sizes = in_community.groupby("community").size().rename("size")
+        summaries["community_sizes.csv"] = (
+            pd.concat([sizes, leaders.set_index("community")["name"].rename("top_member")], axis=1)
+            .rename_axis("community_id").reset_index()
+            .sort_values(["size", "community_id"], ascending=[False, True])
+        )
+    if table["is_target"].any():
+        summaries["target_connectors.csv"] = pd.DataFrame({
+            "name": top["name"],
+            "degree": top["degree"],
+            "matches_target": top["is_target"],
+            "company": [G.nodes[name].get("company", "") for name in top["name"]],
+            "role": [G.nodes[name].get("role", "") for name in top["name"]]
+        })
+    return summaries
+
+@traced()
+def write_reports(
+    G: nx.Graph,
+    output_dir: str,
+    metrics: Dict,
+    communities: Optional[Dict[int, list]] = None,
+    centrality: Optional[Dict[str, Dict]] = None,
+    top_n: int = 20,
+    csv: bool = False,
+    chunk_rows: int = 100_000
+) -> Dict[str, str]:
+    """
+    Write the node table and the summary CSVs for an analyzed graph.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph (with ``is_member``/``is_target`` attributes if known).
+    output_dir : str
+        Directory for the reports.
+    metrics : dict
+        Output of ``compute_basic_metrics``.
+    communities : Optional[dict]
+        Community index to node list mapping.
+    centrality : Optional[Dict[str, dict]]
+        Per-node metrics by name.
+    top_n : int
+        Number of top connectors to report.
+    csv : bool
+        Also write the node table as ``nodes.csv``.
+    chunk_rows : int
+        Rows per chunk when streaming ``nodes.csv``.
+
+    Returns
+    -------
+    Dict[str, str]
+        Report file name to path.
+    """
+    table = build_node_table(G, communities, centrality)
+    paths = {os.path.basename(path): path for path in write_node_table(table, output_dir, csv=csv, chunk_rows=chunk_rows)}
+    for name, summary in _summary_tables(G, table, metrics, top_n).items():
+        paths[name] = os.path.join(output_dir, name)
+        summary.to_csv(paths[name], index=False)
+    return paths
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     from src.network_metrics import compute_basic_metrics, detect_communities
+#     G = nx.karate_club_graph()
+#     G = nx.relabel_nodes(G, str)
+#     print(write_reports(G, "../results/reports", compute_basic_metrics(G), detect_communities(G)))
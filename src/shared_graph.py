@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+shared_graph.py
+
+Shares a graph's interned CSR adjacency with worker processes without
+copying it.
+
+``SharedAdjacency`` copies the three CSR arrays of an ``InternedAdjacency``
+(indptr, indices, data) once into a single ``multiprocessing.shared_memory``
+block. Workers receive only a small picklable ``SharedAdjacencyHandle`` and
+attach to the block in their pool initializer; their adjacency matrix is a
+view of the shared pages, whatever the process start method. Node labels
+stay in the parent: workers take and return node ids.
+
+The owner unlinks the block when it is closed, when its ``with`` block
+exits (also on errors), or at the latest when it is garbage collected or
+the interpreter exits. Workers never unlink; their mappings go away with
+the pool.
+
+    with SharedAdjacency(build_adjacency(G)) as shared, shared.pool(4) as pool:
+        results = list(pool.map(task, chunks))   # task calls worker_matrix()
+
+Functions:
+    attach_adjacency(handle: SharedAdjacencyHandle) -> Tuple[SharedMemory, sp.csr_array]
+    worker_matrix() -> sp.csr_array
+
+Classes:
+    SharedAdjacencyHandle
+    SharedAdjacency
+"""
+
+import logging
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, List, NamedTuple, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+from src.graph_builder import InternedAdjacency
+
+logger = logging.getLogger("strongties")
+
+_ALIGN = 64
+
+class SharedAdjacencyHandle(NamedTuple):
+    """
+    Everything a worker needs to attach to a shared adjacency.
+
+    Attributes
+    ----------
+    name : str
+        Shared memory block name.
+    shape : Tuple[int, int]
+        Matrix shape.
+    fields : Tuple[Tuple[str, str, int, int], ...]
+        (array, dtype, byte offset, length) for indptr, indices and data.
+    fingerprint : str
+        Fingerprint of the graph the adjacency was built from.
+    """
+    name: str
+    shape: Tuple[int, int]
+    fields: Tuple[Tuple[str, str, int, int], ...]
+    fingerprint: str
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without registering it for cleanup (the owner unlinks it)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block too; pool workers
+        # share the owner's resource tracker, so this does not unlink it early
+        return shared_memory.SharedMemory(name=name)
+
+def _matrix(buffer: memoryview, handle: SharedAdjacencyHandle) -> sp.csr_array:
+    """CSR matrix whose arrays are views of ``buffer``."""
+    arrays = {
+        field: np.ndarray((length,), dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+        for field, dtype, offset, length in handle.fields
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    matrix = sp.csr_array((arrays["data"], arrays["indices"], arrays["indptr"]), shape=handle.shape, copy=False)
+    # The arrays are already canonical; skip scipy's checks that might copy them
+    matrix.has_sorted_indices = True
+    return matrix
+
+def attach_adjacency(handle: SharedAdjacencyHandle) -> Tuple[shared_memory.SharedMemory, sp.csr_array]:
+    """
+    Attach to a shared adjacency in another process.
+
+    Parameters
+    ----------
+    handle : SharedAdjacencyHandle
+        From ``SharedAdjacency.handle``.
+
+    Returns
+    -------
+    Tuple[SharedMemory, sp.csr_array]
+        The attached block (keep it referenced while the matrix is in use)
+        and a read-only matrix backed by it.
+    """
+    block = _open(handle.name)
+    return block, _matrix(block.buf, handle)
+
+_worker_block: Optional[shared_memory.SharedMemory] = None
+_worker_matrix: Optional[sp.csr_array] = None
+
+def _init_worker(handle: SharedAdjacencyHandle) -> None:
+    global _worker_block, _worker_matrix
+    _worker_block, _worker_matrix = attach_adjacency(handle)
+
+def worker_matrix() -> sp.csr_array:
+    """The shared adjacency matrix of the current pool worker."""
+    if _worker_matrix is None:
+        raise ValueError("No shared adjacency attached; run inside SharedAdjacency.pool()")
+    return _worker_matrix
+
+def _release(block: shared_memory.SharedMemory) -> None:
+    try:
+        block.close()
+    except BufferError:
+        # Views of the block are still alive; the mapping goes when they do
+        logger.debug(f"Shared adjacency {block.name} unlinked with views still open")
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+class SharedAdjacency:
+    """
+    An ``InternedAdjacency`` exported to shared memory.
+
+    Parameters
+    ----------
+    adjacency : InternedAdjacency
+        Adjacency to share (its arrays are copied once).
+
+    Attributes
+    ----------
+    nodes : List[str]
+        Node labels by id (not shared; workers use ids).
+    handle : SharedAdjacencyHandle
+        Picklable handle for ``attach_adjacency``.
+    matrix : sp.csr_array
+        The owner's view of the shared matrix.
+
+    Methods
+    -------
+    pool(workers: int, mp_context=None) -> ProcessPoolExecutor
+        A process pool whose workers are attached to the adjacency.
+    close()
+        Unlink the shared memory block (idempotent).
+    """
+
+    def __init__(self, adjacency: InternedAdjacency):
+        source = adjacency.matrix
+        arrays = (("indptr", source.indptr), ("indices", source.indices), ("data", source.data))
+        fields, size = [], 0
+        for field, array in arrays:
+            fields.append((field, array.dtype.str, size, len(array)))
+            size += -(-array.nbytes // _ALIGN) * _ALIGN
+        self._block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._finalizer = weakref.finalize(self, _release, self._block)
+        self.handle = SharedAdjacencyHandle(self._block.name, source.shape, tuple(fields), adjacency.fingerprint)
+        for (field, array), (_, _, offset, length) in zip(arrays, fields):
+            np.ndarray((length,), dtype=array.dtype, buffer=self._block.buf, offset=offset)[:] = array
+        self.nodes: List[str] = adjacency.nodes
+        self.matrix: Optional[sp.csr_array] = _matrix(self._block.buf, self.handle)
+        logger.info(f"Shared adjacency {self.handle.name}: {source.shape[0]} nodes, {size / 2**20:.1f} MB")
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def pool(self, workers: int, mp_context: Any = None) -> ProcessPoolExecutor:
+        """
+        Start a process pool attached to this adjacency.
+
+        Parameters
+        ----------
+        workers : int
+            Number of worker processes.
+        mp_context : optional
+            ``multiprocessing`` context (default: the platform default).
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            Pool whose tasks can call ``worker_matrix()``; shut it down (e.g.
+            with ``with``) before closing the adjacency.
+        """
+        if self.closed:
+            raise ValueError("Shared adjacency is closed")
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context, initializer=_init_worker, initargs=(self.handle,)
+        )
+
+    def close(self) -> None:
+        self.matrix = None
+        self._finalizer()
+
+    def __enter__(self) -> "SharedAdjacency":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import networkx as nx
+#     from src.graph_builder import build_adjacency
+#     G = nx.relabel_nodes(nx.karate_club_graph(), str)
+#     with SharedAdjacency(build_adjacency(G)) as shared, shared.pool(2) as pool:
+#         print(list(pool.map(len, [[1], [2, 3]])))
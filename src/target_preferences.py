@@ -7,9 +7,15 @@ Stores and manages user-specified target companies and roles for StrongTies.
 
 Classes:
     TargetPreferences
+    TargetMatcher
 """
 
-from typing import List, Dict
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+import networkx as nx
+from src.company_aliases import CompanyAliases, strip_company_suffixes
+from src.utils import standardize_position_title
 
 class TargetPreferences:
     """
@@ -30,28 +36,49 @@ class TargetPreferences:
         Adds a role to the target list if not already present.
     to_dict() -> Dict[str, List[str]]
         Returns the preferences as a dictionary.
+    compile(aliases: CompanyAliases = None) -> TargetMatcher
+        Returns a normalized, indexed matcher for the current targets.
     matches(connection: Dict) -> bool
         Checks if a connection matches any target company or role.
     """
 
     def __init__(self, companies: List[str] = None, roles: List[str] = None):
-        self.companies = companies or []
-        self.roles = roles or []
+        self.companies = list(dict.fromkeys(companies or []))
+        self.roles = list(dict.fromkeys(roles or []))
+        self._company_set = set(self.companies)
+        self._role_set = set(self.roles)
+        self._matcher = None
 
     def add_company(self, company: str) -> None:
         """Add a company to the target list if not already present."""
-        if company not in self.companies:
+        if company not in self._company_set:
+            self._company_set.add(company)
             self.companies.append(company)
+            self._matcher = None
 
     def add_role(self, role: str) -> None:
         """Add a role to the target list if not already present."""
-        if role not in self.roles:
+        if role not in self._role_set:
+            self._role_set.add(role)
             self.roles.append(role)
+            self._matcher = None
 
     def to_dict(self) -> Dict[str, List[str]]:
         """Return the preferences as a dictionary."""
         return {"companies": self.companies, "roles": self.roles}
 
+    def compile(self, aliases: Optional[CompanyAliases] = None) -> "TargetMatcher":
+        """
+        Return a TargetMatcher for the current targets, reusing it until
+        targets change. With ``aliases``, companies are compared by their
+        canonical names (a new matcher is built for each alias map).
+        """
+        if aliases is not None:
+            return TargetMatcher(self.companies, self.roles, aliases=aliases)
+        if self._matcher is None:
+            self._matcher = TargetMatcher(self.companies, self.roles)
+        return self._matcher
+
     def matches(self, connection: Dict) -> bool:
         """
         Checks if a connection matches any target company or role.
@@ -59,14 +86,138 @@ class TargetPreferences:
         Parameters
         ----------
         connection : Dict
-            Dictionary representing a connection, with keys 'company' and 'role'.
+            Dictionary representing a connection, with keys 'company' and
+            'position' (or 'role').
 
         Returns
         -------
         bool
             True if the connection matches a target company or role, False otherwise.
         """
-        return (
-            connection.get("company") in self.companies or
-            connection.get("role") in self.roles
-        )
\ No newline at end of file
+        return self.compile().matches(connection)
+
+class TargetMatcher:
+    """
+    Normalized, indexed matcher for target companies and roles.
+
+    Companies are compared by canonical name: ``aliases.canonicalize`` if an
+    alias map is given, otherwise ``strip_company_suffixes``, so the target
+    "Globex" matches "Globex Inc". Positions are normalized with
+    ``standardize_position_title``. A company matches when its canonical name
+    is a target company. A position matches when its normalized title equals a
+    target role or contains every keyword of one, e.g. "product manager growth"
+    matches the role "Product Manager". Role keywords are kept in an inverted
+    token index so only roles sharing a token with the title are checked.
+
+    Attributes
+    ----------
+    companies : set
+        Canonical target company names.
+    roles : set
+        Normalized target role titles.
+
+    Methods
+    -------
+    matches_company(company: str) -> bool
+        Checks a single company name.
+    matches_position(position: str) -> bool
+        Checks a single position title.
+    matches(connection: Dict) -> bool
+        Checks a single connection record.
+    match_frame(df: pd.DataFrame, company_col: str = "company", position_col: str = "position") -> np.ndarray
+        Boolean match mask for every row of a DataFrame.
+    match_nodes(G: nx.Graph) -> np.ndarray
+        Boolean match mask for every node of a graph, in ``G.nodes()`` order.
+    """
+
+    def __init__(
+        self,
+        companies: Iterable[str] = (),
+        roles: Iterable[str] = (),
+        aliases: Optional[CompanyAliases] = None
+    ):
+        self._canonical = aliases.canonicalize if aliases is not None else strip_company_suffixes
+        self.companies = {c for c in map(self._canonical, companies) if c}
+        self.roles = {r for r in map(standardize_position_title, roles) if r}
+        self._role_tokens = [frozenset(role.split()) for role in sorted(self.roles)]
+        self._token_index: Dict[str, List[int]] = {}
+        for i, tokens in enumerate(self._role_tokens):
+            for token in tokens:
+                self._token_index.setdefault(token, []).append(i)
+
+    def matches_company(self, company: str) -> bool:
+        """Return True if the company is a target company."""
+        return self._canonical(company) in self.companies
+
+    def matches_position(self, position: str) -> bool:
+        """Return True if the position equals or contains a target role."""
+        title = standardize_position_title(position)
+        if title in self.roles:
+            return True
+        tokens = set(title.split())
+        candidates = {i for token in tokens for i in self._token_index.get(token, ())}
+        return any(self._role_tokens[i] <= tokens for i in candidates)
+
+    def matches(self, connection: Dict) -> bool:
+        """Return True if a connection record matches a target company or role."""
+        position = connection.get("position", connection.get("role"))
+        return self.matches_company(connection.get("company")) or self.matches_position(position)
+
+    @staticmethod
+    def _match_values(values: Iterable, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Evaluate a predicate once per distinct value and broadcast it back."""
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        hits = np.fromiter((predicate(value) for value in uniques), dtype=bool, count=len(uniques))
+        # Missing values get code -1, which picks the trailing False
+        return np.append(hits, False)[codes]
+
+    def match_frame(
+        self,
+        df: pd.DataFrame,
+        company_col: str = "company",
+        position_col: str = "position"
+    ) -> np.ndarray:
+        """
+        Match every row of a connections DataFrame in one pass.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Connections data.
+        company_col : str
+            Column holding company names.
+        position_col : str
+            Column holding position titles.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True where the row matches a target company or role.
+        """
+        mask = np.zeros(len(df), dtype=bool)
+        if self.companies and company_col in df.columns:
+            mask |= self._match_values(df[company_col], self.matches_company)
+        if self.roles and position_col in df.columns:
+            mask |= self._match_values(df[position_col], self.matches_position)
+        return mask
+
+    def match_nodes(self, G: nx.Graph) -> np.ndarray:
+        """
+        Match every node of a graph by its 'company' and 'position' (or 'role') attributes.
+
+        Parameters
+        ----------
+        G : nx.Graph
+            NetworkX graph.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array aligned with ``list(G.nodes())``.
+        """
+        records = [data for _, data in G.nodes(data=True)]
+        frame = pd.DataFrame({
+            "company": [data.get("company") for data in records],
+            "position": [data.get("position", data.get("role")) for data in records]
+        })
+        return self.match_frame(frame)
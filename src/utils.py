@@ -6,6 +6,7 @@ utils.py
 Utility functions for StrongTies, including file/path helpers, CSV helpers, and generic data transformations.
 
 Functions:
+    configure_logging(level: int = logging.INFO)
     ensure_dir(path: str)
     save_dataframe(df: pd.DataFrame, path: str)
     clean_company_name(name: str) -> str
@@ -20,9 +21,12 @@ import re
 import uuid
 
 # Logging setup
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("strongties")
 
+def configure_logging(level: int = logging.INFO):
+    """Configure root logging for command-line entry points (not done at import time)."""
+    logging.basicConfig(level=level)
+
 # File/path helpers
 def ensure_dir(path: str):
     """Create directory if it doesn't exist."""
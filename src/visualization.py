@@ -6,15 +6,370 @@ visualization.py
 Visualizes professional social graphs and network analysis results.
 
 Functions:
-    plot_network(G: nx.Graph, filename: str = None) -> None
-    plot_communities(G: nx.Graph, communities: dict, filename: str = None) -> None
+    compute_layout(G: nx.Graph, method: str = "spring", store: LayoutStore = None, **params) -> dict
+    multilevel_layout(G: nx.Graph, seed: int = 42, iterations: int = 30, coarse_size: int = 50, communities: dict = None) -> dict
+    plot_network(G: nx.Graph, filename: str = None, pos: dict = None) -> Figure
+    plot_communities(G: nx.Graph, communities: dict, filename: str = None, pos: dict = None) -> Figure
+    render_network(G: nx.Graph, filename: str = None, pos: dict = None, communities: dict = None, ...) -> Figure
+
+Classes:
+    LayoutStore
 """
 
-from typing import Optional, Dict
+import hashlib
+import json
+import os
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+import itertools
+import numpy as np
 import matplotlib.pyplot as plt
+import scipy.sparse as sp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import networkx as nx
+from src.graph_builder import build_adjacency, graph_fingerprint
+from src.profiling import traced
+from src.utils import ensure_dir
+
+Positions = Dict[Any, np.ndarray]
+
+# Graphs larger than this are drawn with render_network instead of nx.draw
+LARGE_GRAPH_NODES = 2000
+# Edge count above which render_network rasterizes its collections by default
+RASTERIZE_EDGES = 50000
+
+class LayoutStore:
+    """
+    Caches node layouts by graph fingerprint and layout parameters.
+
+    Layouts are kept in an in-memory LRU and, if ``cache_dir`` is set, written
+    to ``<cache_dir>/<key>.npz`` so later runs on the same graph skip layout.
+    Positions are stored keyed by ``str(node)``.
+
+    Attributes
+    ----------
+    cache_dir : Optional[str]
+        Directory for on-disk ``.npz`` layouts; memory-only if None.
+    max_entries : int
+        Number of layouts held in memory.
+
+    Methods
+    -------
+    key(G: nx.Graph, method: str, params: dict) -> str
+        Cache key for a graph and layout configuration.
+    get(key: str) -> Optional[dict]
+        Cached positions, or None.
+    put(key: str, pos: dict) -> None
+        Store positions in memory and on disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 16):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Positions]" = OrderedDict()
+
+    @staticmethod
+    def key(G: nx.Graph, method: str, params: Dict[str, Any]) -> str:
+        """Return a cache key combining the graph fingerprint and layout parameters."""
+        config = json.dumps({"method": method, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{graph_fingerprint(G)}:{config}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def get(self, key: str) -> Optional[Positions]:
+        """Return cached positions for a key from memory or disk, or None."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.cache_dir and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as data:
+                pos = dict(zip(data["nodes"].tolist(), data["coords"]))
+            self._remember(key, pos)
+            return pos
+        return None
+
+    def put(self, key: str, pos: Positions) -> None:
+        """Store positions in memory and, if configured, on disk."""
+        pos = {str(node): coords for node, coords in pos.items()}
+        self._remember(key, pos)
+        if self.cache_dir:
+            ensure_dir(self.cache_dir)
+            nodes = np.asarray([str(node) for node in pos], dtype=str)
+            coords = np.asarray(list(pos.values()), dtype=float).reshape(-1, 2)
+            # Write under a unique temporary name so readers never see a partial
+            # file and concurrent writers of the same key don't collide
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{uuid.uuid4().hex}.tmp.npz"
+            np.savez(tmp_path, nodes=nodes, coords=coords)
+            os.replace(tmp_path, self._path(key))
+
+    def _remember(self, key: str, pos: Positions) -> None:
+        self._memory[key] = pos
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+# Layouts computed without an explicit store are cached here, relative to the
+# working directory like the scripts' results/ defaults; set
+# STRONGTIES_LAYOUT_CACHE to move the cache, or to "" to keep it in memory
+LAYOUT_CACHE_DIR = os.environ.get("STRONGTIES_LAYOUT_CACHE", os.path.join("results", ".cache", "layouts"))
+
+_default_store = LayoutStore(cache_dir=LAYOUT_CACHE_DIR or None)
+
+def _spring_layout(G: nx.Graph, seed: int = 42, **params) -> Positions:
+    return nx.spring_layout(G, seed=seed, **params)
+
+# Multilevel layout: coarsen by collapsing nodes onto their highest-degree
+# neighbor (or onto communities), lay out the coarsest graph exactly, then
+# interpolate and refine level by level with grid-approximated repulsion.
+
+# Levels with at most this many nodes use exact all-pairs repulsion
+_EXACT_REPULSION_NODES = 1500
+
+def _coarsen(A: sp.csr_array, rng: np.random.Generator) -> np.ndarray:
+    """
+    Assign each node to a cluster: nodes join their highest-scoring neighbor
+    when that neighbor is a local maximum of degree (random tie-break).
+    Returns cluster labels 0..k-1.
+    """
+    n = A.shape[0]
+    deg = np.diff(A.indptr)
+    score = deg + rng.random(n)
+    best = np.arange(n)
+    has_neighbors = deg > 0
+    if has_neighbors.any():
+        rows = np.repeat(np.arange(n), deg)
+        order = np.lexsort((score[A.indices], rows))
+        best[has_neighbors] = A.indices[order[A.indptr[1:][has_neighbors] - 1]]
+    best = np.where(score[best] > score, best, np.arange(n))
+    is_root = best == np.arange(n)
+    parent = np.where(is_root[best], best, np.arange(n))
+    return np.unique(parent, return_inverse=True)[1]
+
+def _contract(A: sp.csr_array, weights: np.ndarray, labels: np.ndarray) -> Tuple[sp.csr_array, np.ndarray]:
+    """Collapse clusters into single nodes, summing edge multiplicities and node weights."""
+    k = int(labels.max()) + 1 if len(labels) else 0
+    P = sp.csr_array((np.ones(len(labels)), (np.arange(len(labels)), labels)), shape=(len(labels), k))
+    coarse = sp.csr_array(P.T @ A @ P)
+    coarse.setdiag(0)
+    coarse.eliminate_zeros()
+    return coarse, np.bincount(labels, weights=weights, minlength=k)
+
+def _exact_repulsion(xy: np.ndarray, mass: np.ndarray, k: float) -> np.ndarray:
+    delta = xy[:, None, :] - xy[None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=-1), 1e-12)
+    np.fill_diagonal(dist2, np.inf)
+    return (delta * (k * k * mass[None, :] / dist2)[:, :, None]).sum(axis=1)
+
+def _grid_repulsion(xy: np.ndarray, mass: np.ndarray, k: float, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Repulsion from nodes within the 3x3 block of grid cells (cell size 2k)
+    around each node, estimated from ``samples`` random partners per node and
+    scaled by the block population.
+    """
+    n = len(xy)
+    cell = np.floor((xy - xy.min(axis=0)) / (2 * k)).astype(np.int64) + 1
+    stride = int(cell[:, 1].max()) + 2
+    cid = cell[:, 0] * stride + cell[:, 1]
+    order = np.argsort(cid, kind="stable")
+    uniq, start, counts = np.unique(cid[order], return_index=True, return_counts=True)
+
+    block = np.stack([cid + dx * stride + dy for dx in (-1, 0, 1) for dy in (-1, 0, 1)], axis=1)
+    slot = np.minimum(np.searchsorted(uniq, block), len(uniq) - 1)
+    valid = uniq[slot] == block
+    cnt = np.where(valid, counts[slot], 0)
+    first = np.where(valid, start[slot], 0)
+    cum = np.cumsum(cnt, axis=1)
+    total = cum[:, -1]
+
+    draw = np.minimum((rng.random((n, samples)) * total[:, None]).astype(np.int64), total[:, None] - 1)
+    which = (draw[:, :, None] >= cum[:, None, :]).sum(axis=-1)
+    rows = np.arange(n)[:, None]
+    partner = order[first[rows, which] + draw - (cum - cnt)[rows, which]]
+
+    delta = xy[:, None, :] - xy[partner]
+    dist2 = (delta ** 2).sum(axis=-1)
+    keep = (partner != rows) & (dist2 > 1e-12) & (dist2 < 4 * k * k)
+    strength = np.where(keep, k * k * mass[partner] / np.where(keep, dist2, 1.0), 0.0)
+    return (delta * strength[:, :, None]).sum(axis=1) * (total / samples)[:, None]
+
+def _force_layout(
+    A: sp.csr_array,
+    weights: np.ndarray,
+    xy: np.ndarray,
+    k: float,
+    iterations: int,
+    rng: np.random.Generator,
+    samples: int = 16
+) -> np.ndarray:
+    """Fruchterman-Reingold iterations with mass-weighted repulsion and linear cooling."""
+    n = len(xy)
+    if n < 2:
+        return xy
+    mass = weights / weights.mean()
+    upper = sp.triu(A, k=1).tocoo()
+    src, dst, mult = upper.row, upper.col, upper.data.astype(float)
+    extent = np.ptp(xy, axis=0).max()
+    temperature = max(extent, k) * 0.1
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        if n <= _EXACT_REPULSION_NODES:
+            disp = _exact_repulsion(xy, mass, k)
+        else:
+            disp = _grid_repulsion(xy, mass, k, samples, rng)
+        delta = xy[dst] - xy[src]
+        pull = delta * (mult * np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None]
+        for axis in range(2):
+            disp[:, axis] += (
+                np.bincount(src, weights=pull[:, axis], minlength=n)
+                - np.bincount(dst, weights=pull[:, axis], minlength=n)
+            ) / mass
+        # Weak gravity keeps disconnected pieces from drifting apart
+        disp -= 0.01 * (xy - xy.mean(axis=0)) / k
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-12)
+        xy = xy + disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    return xy
+
+def multilevel_layout(
+    G: nx.Graph,
+    seed: int = 42,
+    iterations: int = 30,
+    coarse_size: int = 50,
+    communities: Optional[Dict[int, list]] = None
+) -> Positions:
+    """
+    Compute a force-directed layout by coarsening, laying out and refining.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph to lay out.
+    seed : int
+        Random seed.
+    iterations : int
+        Force iterations per refinement level (the coarsest level gets four times as many).
+    coarse_size : int
+        Stop coarsening once a level has at most this many nodes.
+    communities : Optional[dict]
+        Community index to node list mapping (e.g. from ``detect_communities``)
+        used as the first coarsening level instead of neighbor collapsing.
+
+    Returns
+    -------
+    dict
+        Mapping from node to an (x, y) position array, scaled to [-1, 1].
+    """
+    rng = np.random.default_rng(seed)
+    adjacency = build_adjacency(G)
+    n = len(adjacency.nodes)
+    if n == 0:
+        return {}
+    A = sp.csr_array(adjacency.matrix, dtype=float)
+    A.setdiag(0)
+    A.eliminate_zeros()
 
-def plot_network(G: nx.Graph, filename: Optional[str] = None) -> None:
+    # Coarsen until small enough or no longer shrinking
+    levels = [(A, np.ones(n))]
+    assignments = []
+    if communities:
+        labels = np.arange(n) + n
+        for idx, (_, members) in enumerate(communities.items()):
+            ids = [adjacency.index[str(m)] for m in members if str(m) in adjacency.index]
+            labels[ids] = idx
+        labels = np.unique(labels, return_inverse=True)[1]
+        if labels.max() + 1 < n:
+            assignments.append(labels)
+            levels.append(_contract(A, levels[0][1], labels))
+    while levels[-1][0].shape[0] > coarse_size:
+        A_level, w_level = levels[-1]
+        labels = _coarsen(A_level, rng)
+        k_next = int(labels.max()) + 1
+        if k_next > 0.95 * A_level.shape[0]:
+            break
+        assignments.append(labels)
+        levels.append(_contract(A_level, w_level, labels))
+
+    # Lay out the coarsest level from a random start; ideal edge length grows
+    # with the mean node weight so heavy clusters get room for their members
+    A_level, w_level = levels[-1]
+    k = np.sqrt(w_level.mean())
+    xy = (rng.random((len(w_level), 2)) - 0.5) * k * np.sqrt(len(w_level))
+    xy = _force_layout(A_level, w_level, xy, k, 4 * iterations, rng)
+
+    # Interpolate to each finer level: members scatter in a disk sized to the
+    # cluster around the cluster's position, then refine
+    for depth in range(len(assignments) - 1, -1, -1):
+        labels = assignments[depth]
+        A_level, w_level = levels[depth]
+        coarse_weights = levels[depth + 1][1]
+        k = np.sqrt(w_level.mean())
+        radius = 0.5 * k * np.sqrt(coarse_weights[labels])
+        angle = rng.random(len(labels)) * 2 * np.pi
+        spread = radius * np.sqrt(rng.random(len(labels)))
+        xy = xy[labels] + np.column_stack([np.cos(angle), np.sin(angle)]) * spread[:, None]
+        xy = _force_layout(A_level, w_level, xy, k, iterations, rng)
+
+    xy = xy - xy.mean(axis=0)
+    scale = np.abs(xy).max()
+    if scale > 0:
+        xy = xy / scale
+    return dict(zip(G.nodes(), xy))
+
+_LAYOUTS: Dict[str, Callable[..., Positions]] = {
+    "spring": _spring_layout,
+    "multilevel": multilevel_layout
+}
+
+@traced()
+def compute_layout(
+    G: nx.Graph,
+    method: str = "spring",
+    store: Optional[LayoutStore] = None,
+    **params
+) -> Positions:
+    """
+    Compute node positions, reusing a cached layout for the same graph and parameters.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph to lay out.
+    method : str
+        Layout algorithm name.
+    store : Optional[LayoutStore]
+        Layout cache (default: a shared store on disk under ``LAYOUT_CACHE_DIR``).
+    **params
+        Parameters for the layout algorithm (e.g. seed, iterations).
+
+    Returns
+    -------
+    dict
+        Mapping from node to an (x, y) position array.
+    """
+    if method not in _LAYOUTS:
+        raise ValueError(f"Unknown layout method: {method}")
+    store = store or _default_store
+    params.setdefault("seed", 42)
+    key = store.key(G, method, params)
+    pos = store.get(key)
+    if pos is None:
+        pos = _LAYOUTS[method](G, **params)
+        store.put(key, pos)
+        return pos
+    # Cached layouts are keyed by node label
+    return {node: pos[str(node)] for node in G.nodes()}
+
+@traced()
+def plot_network(
+    G: nx.Graph,
+    filename: Optional[str] = None,
+    pos: Optional[Positions] = None,
+    store: Optional[LayoutStore] = None
+) -> Figure:
     """
     Plot the entire network graph.
 
@@ -24,17 +379,40 @@ def plot_network(G: nx.Graph, filename: Optional[str] = None) -> None:
         NetworkX graph to visualize.
     filename : Optional[str]
         If provided, save the plot to this file.
+    pos : Optional[dict]
+        Precomputed node positions; computed via ``compute_layout`` if omitted.
+    store : Optional[LayoutStore]
+        Layout cache used when ``pos`` is omitted.
+
+    Returns
+    -------
+    Figure
+        The plotted figure; it is never shown, so display it from the
+        caller if needed. It is closed after saving when ``filename`` is
+        given. Graphs with more than ``LARGE_GRAPH_NODES`` nodes are drawn
+        headless with ``render_network``.
     """
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(G, seed=42)
+    if G.number_of_nodes() > LARGE_GRAPH_NODES:
+        return render_network(G, filename, pos=pos, store=store)
+    fig = plt.figure(figsize=(10, 8))
+    pos = pos if pos is not None else compute_layout(G, store=store)
     nx.draw(G, pos, with_labels=True, node_size=300, node_color='skyblue', edge_color='gray', font_size=8)
     plt.title("Professional Social Network")
     plt.tight_layout()
     if filename:
         plt.savefig(filename, dpi=300)
-    plt.show()
+        # Saved figures are closed so batch loops don't accumulate open figures
+        plt.close(fig)
+    return fig
 
-def plot_communities(G: nx.Graph, communities: Dict[int, list], filename: Optional[str] = None) -> None:
+@traced()
+def plot_communities(
+    G: nx.Graph,
+    communities: Dict[int, list],
+    filename: Optional[str] = None,
+    pos: Optional[Positions] = None,
+    store: Optional[LayoutStore] = None
+) -> Figure:
     """
     Plot the network graph with nodes colored by community.
 
@@ -46,30 +424,159 @@ def plot_communities(G: nx.Graph, communities: Dict[int, list], filename: Option
         Dictionary mapping community index to list of node names.
     filename : Optional[str]
         If provided, save the plot to this file.
+    pos : Optional[dict]
+        Precomputed node positions; computed via ``compute_layout`` if omitted,
+        so it shares the cached layout with ``plot_network``.
+    store : Optional[LayoutStore]
+        Layout cache used when ``pos`` is omitted.
+
+    Returns
+    -------
+    Figure
+        The plotted figure; it is never shown, so display it from the
+        caller if needed. It is closed after saving when ``filename`` is
+        given. Graphs with more than ``LARGE_GRAPH_NODES`` nodes are drawn
+        headless with ``render_network``.
     """
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(G, seed=42)
-    # Assign a color to each community
-    import itertools
+    if G.number_of_nodes() > LARGE_GRAPH_NODES:
+        return render_network(G, filename, pos=pos, store=store, communities=communities, title="Network Communities")
+    fig = plt.figure(figsize=(10, 8))
+    pos = pos if pos is not None else compute_layout(G, store=store)
+    node_colors = _community_colors(G, communities)
+    nx.draw(G, pos, with_labels=True, node_size=300, node_color=node_colors, edge_color='gray', font_size=8)
+    plt.title("Network Communities")
+    plt.tight_layout()
+    if filename:
+        plt.savefig(filename, dpi=300)
+        # Saved figures are closed so batch loops don't accumulate open figures
+        plt.close(fig)
+    return fig
+
+def _community_colors(G: nx.Graph, communities: Dict[int, list]) -> list:
+    """Assign a tab10 color to each community; nodes outside any community are gray."""
     colors = itertools.cycle(plt.cm.tab10.colors)
     node_color_map = {}
     for idx, nodes in communities.items():
         color = next(colors)
         for node in nodes:
             node_color_map[node] = color
-    node_colors = [node_color_map.get(node, (0.5, 0.5, 0.5)) for node in G.nodes()]
-    nx.draw(G, pos, with_labels=True, node_size=300, node_color=node_colors, edge_color='gray', font_size=8)
-    plt.title("Network Communities")
-    plt.tight_layout()
+    return [node_color_map.get(node, (0.5, 0.5, 0.5)) for node in G.nodes()]
+
+@traced()
+def render_network(
+    G: nx.Graph,
+    filename: Optional[str] = None,
+    pos: Optional[Positions] = None,
+    store: Optional[LayoutStore] = None,
+    layout: Optional[str] = None,
+    communities: Optional[Dict[int, list]] = None,
+    label_metric: Optional[Dict[Any, float]] = None,
+    label_top_k: int = 20,
+    rasterized: Optional[bool] = None,
+    title: str = "Professional Social Network",
+    figsize: tuple = (10, 8),
+    dpi: int = 300
+) -> Figure:
+    """
+    Render a large network headless, with batched edges and nodes.
+
+    Edges are drawn as a single LineCollection and nodes as one scatter, and
+    only the top-k nodes by ``label_metric`` are labeled. The figure uses the
+    Agg canvas directly, so it never opens a window or blocks batch jobs.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph to visualize.
+    filename : Optional[str]
+        If provided, save the figure to this file (format from the extension).
+    pos : Optional[dict]
+        Precomputed node positions; computed via ``compute_layout`` if omitted.
+    store : Optional[LayoutStore]
+        Layout cache used when ``pos`` is omitted.
+    layout : Optional[str]
+        Layout method used when ``pos`` is omitted (default: "multilevel"
+        above ``LARGE_GRAPH_NODES`` nodes, "spring" otherwise).
+    communities : Optional[dict]
+        Community index to node list mapping; colors nodes by community.
+    label_metric : Optional[dict]
+        Score per node used to choose labels (default: degree).
+    label_top_k : int
+        Number of nodes to label.
+    rasterized : Optional[bool]
+        Rasterize edges and nodes inside vector output; defaults to True
+        above ``RASTERIZE_EDGES`` edges.
+    title : str
+        Figure title.
+    figsize : tuple
+        Figure size in inches.
+    dpi : int
+        Resolution for raster output and rasterized layers.
+
+    Returns
+    -------
+    Figure
+        The rendered matplotlib figure.
+    """
+    if pos is None:
+        if layout is None:
+            layout = "multilevel" if G.number_of_nodes() > LARGE_GRAPH_NODES else "spring"
+        pos = compute_layout(G, method=layout, store=store)
+    nodes = list(G.nodes())
+    n, m = len(nodes), G.number_of_edges()
+    if rasterized is None:
+        rasterized = m > RASTERIZE_EDGES
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_axis_off()
+    ax.set_title(title)
+    if n == 0:
+        if filename:
+            fig.savefig(filename, dpi=dpi)
+        return fig
+
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.asarray([pos[node] for node in nodes], dtype=float).reshape(n, 2)
+    pairs = np.fromiter(
+        (index[node] for edge in G.edges() for node in edge), dtype=np.int64, count=2 * m
+    ).reshape(m, 2)
+
+    # Thinner, fainter marks as the graph grows
+    scale = min(1.0, 200.0 / n)
+    edges = LineCollection(
+        xy[pairs], colors="gray", linewidths=max(0.1, scale), alpha=max(0.05, min(0.6, 2000.0 / max(m, 1))),
+        rasterized=rasterized, zorder=1
+    )
+    ax.add_collection(edges)
+    colors = _community_colors(G, communities) if communities else "skyblue"
+    ax.scatter(
+        xy[:, 0], xy[:, 1], s=max(1.0, 300 * scale), c=colors, linewidths=0,
+        rasterized=rasterized, zorder=2
+    )
+
+    if label_top_k > 0:
+        if label_metric is None:
+            label_metric = dict(G.degree())
+        values = np.asarray([label_metric.get(node, 0.0) for node in nodes], dtype=float)
+        k = min(label_top_k, n)
+        for i in np.argpartition(-values, k - 1)[:k]:
+            ax.annotate(str(nodes[i]), xy[i], fontsize=8, zorder=3)
+
+    ax.autoscale_view()
+    ax.set_aspect("equal", adjustable="datalim")
+    fig.tight_layout()
     if filename:
-        plt.savefig(filename, dpi=300)
-    plt.show()
+        fig.savefig(filename, dpi=dpi)
+    return fig
 
 # Example usage (uncomment for script use):
 # if __name__ == "__main__":
 #     import data_loader, graph_builder, network_metrics
 #     df = data_loader.load_all_connections("../data")
 #     G = graph_builder.build_connection_graph(df)
-#     plot_network(G, filename="../results/figures/network_overview.png")
+#     store = LayoutStore(cache_dir="../results/cache/layouts")
+#     plot_network(G, filename="../results/figures/network_overview.png", store=store)
 #     communities = network_metrics.detect_communities(G)
-#     plot_communities(G, communities, filename="../results/figures/cluster_analysis.png")
\ No newline at end of file
+#     plot_communities(G, communities, filename="../results/figures/cluster_analysis.png", store=store)
\ No newline at end of file
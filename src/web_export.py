@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: Polyform-Noncommercial-1.0.0
+
+"""
+web_export.py
+
+Exports precomputed, level-of-detail network views for interactive front ends.
+
+Everything an interactive view needs is computed once and written as compact
+Parquet tables, so the app only filters rows instead of laying out the graph
+or shipping it whole to the browser:
+
+    nodes.parquet             id, name, x, y, community (if known), lod and metric columns
+    edges.parquet             source, target (node ids) and lod
+    communities.parquet       community super-nodes: centroid, size, label
+    community_edges.parquet   edge counts between communities
+    meta.json                 tiers, row counts and graph fingerprint
+
+A node's ``lod`` is the first zoom level at which it is shown: the top
+``tiers[0]`` nodes by the ranking metric appear at level 0, the next ones up
+to ``tiers[1]`` at level 1, and so on; the rest appear at the last level. An
+edge appears once both of its endpoints do.
+
+Functions:
+    export_web_view(G: nx.Graph, output_dir: str, pos: dict = None, communities: dict = None, metrics: dict = None, ...) -> dict
+    load_web_view(output_dir: str, level: int) -> Tuple[pd.DataFrame, pd.DataFrame]
+    load_community_view(output_dir: str) -> Tuple[pd.DataFrame, pd.DataFrame]
+"""
+
+import json
+import os
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import networkx as nx
+from src.graph_builder import build_adjacency
+from src.network_metrics import detect_communities
+from src.utils import ensure_dir
+from src.visualization import compute_layout, LARGE_GRAPH_NODES
+
+DEFAULT_TIERS = (500, 5000, 50000)
+_ROW_GROUP_SIZE = 65536
+
+def export_web_view(
+    G: nx.Graph,
+    output_dir: str,
+    pos: Optional[Dict] = None,
+    communities: Optional[Dict[int, list]] = None,
+    metrics: Optional[Dict[str, Dict]] = None,
+    rank_by: str = "degree",
+    tiers: Sequence[int] = DEFAULT_TIERS,
+    max_community_nodes: int = 50_000
+) -> Dict:
+    """
+    Write positions, communities, metrics and level-of-detail tiers as Parquet.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        NetworkX graph to export.
+    output_dir : str
+        Directory for the exported files.
+    pos : Optional[dict]
+        Node positions (default: ``compute_layout``, multilevel for large graphs).
+    communities : Optional[dict]
+        Community index to node list mapping (default: ``detect_communities``
+        for graphs of at most ``max_community_nodes`` nodes).
+    metrics : Optional[Dict[str, dict]]
+        Extra per-node metrics, e.g. ``{"closeness": {...}}``; degree is always included.
+    rank_by : str
+        Metric that decides which nodes appear at coarser zoom levels.
+    tiers : Sequence[int]
+        Cumulative node counts visible at each zoom level.
+    max_community_nodes : int
+        Above this many nodes, communities are not detected when omitted (the
+        greedy modularity pass would dominate the export); the nodes get no
+        community column and the community tables are empty.
+
+    Returns
+    -------
+    dict
+        The metadata written to ``meta.json``.
+    """
+    ensure_dir(output_dir)
+    adjacency = build_adjacency(G)
+    nodes = adjacency.nodes
+    n = len(nodes)
+    if pos is None:
+        pos = compute_layout(G, method="multilevel" if n > LARGE_GRAPH_NODES else "spring")
+    if communities is None and n <= max_community_nodes:
+        communities = detect_communities(G)
+
+    columns = {"degree": np.diff(adjacency.matrix.indptr).astype(np.int32)}
+    for name, values in (metrics or {}).items():
+        columns[name] = np.asarray([values.get(node, np.nan) for node in G.nodes()], dtype=np.float32)
+    if rank_by not in columns:
+        raise ValueError(f"Unknown ranking metric: {rank_by}")
+
+    # Level of detail: rank nodes by the metric and bucket the ranks by tier
+    order = np.argsort(-np.nan_to_num(columns[rank_by].astype(float), nan=-np.inf), kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    node_lod = np.searchsorted(np.asarray(tiers), rank, side="right").astype(np.int8)
+
+    community = np.full(n, -1, dtype=np.int32)
+    for comm_id, members in (communities or {}).items():
+        ids = [adjacency.index[str(m)] for m in members if str(m) in adjacency.index]
+        community[ids] = comm_id
+    xy = np.asarray([pos[node] for node in G.nodes()], dtype=np.float32).reshape(n, 2)
+
+    node_table = pd.DataFrame({
+        "id": np.arange(n, dtype=np.int32),
+        "name": nodes,
+        "x": xy[:, 0],
+        "y": xy[:, 1],
+        "community": community,
+        "lod": node_lod,
+        **columns
+    })
+
+    upper = adjacency.matrix.tocoo()
+    keep = upper.row < upper.col
+    src, dst = upper.row[keep].astype(np.int32), upper.col[keep].astype(np.int32)
+    edge_table = pd.DataFrame({
+        "source": src,
+        "target": dst,
+        "lod": np.maximum(node_lod[src], node_lod[dst])
+    }).sort_values("lod", kind="stable")
+
+    # Community super-nodes and the edges between them
+    grouped = node_table[node_table["community"] >= 0].groupby("community")
+    community_table = grouped.agg(x=("x", "mean"), y=("y", "mean"), size=("id", "size")).reset_index()
+    top_nodes = node_table.sort_values(rank_by, ascending=False, kind="stable").drop_duplicates("community")
+    community_table["label"] = community_table["community"].map(top_nodes.set_index("community")["name"])
+    pairs = pd.DataFrame({"a": community[src], "b": community[dst]})
+    pairs = pairs[(pairs["a"] >= 0) & (pairs["b"] >= 0) & (pairs["a"] != pairs["b"])]
+    lo, hi = np.minimum(pairs["a"], pairs["b"]), np.maximum(pairs["a"], pairs["b"])
+    community_edges = (
+        pd.DataFrame({"source": lo, "target": hi})
+        .groupby(["source", "target"]).size().rename("weight").reset_index()
+    )
+
+    files = {
+        "nodes": "nodes.parquet",
+        "edges": "edges.parquet",
+        "communities": "communities.parquet",
+        "community_edges": "community_edges.parquet"
+    }
+    # Rows sorted by lod in small row groups let readers skip finer levels
+    if communities is None:
+        node_table = node_table.drop(columns="community")
+    node_table.sort_values("lod", kind="stable").to_parquet(
+        os.path.join(output_dir, files["nodes"]), index=False, row_group_size=_ROW_GROUP_SIZE
+    )
+    edge_table.to_parquet(os.path.join(output_dir, files["edges"]), index=False, row_group_size=_ROW_GROUP_SIZE)
+    community_table.to_parquet(os.path.join(output_dir, files["communities"]), index=False)
+    community_edges.to_parquet(os.path.join(output_dir, files["community_edges"]), index=False)
+
+    meta = {
+        "fingerprint": adjacency.fingerprint,
+        "tiers": [int(t) for t in tiers],
+        "levels": int(len(tiers) + 1),
+        "rank_by": rank_by,
+        "metrics": list(columns),
+        "num_nodes": int(n),
+        "num_edges": int(len(edge_table)),
+        "num_communities": int(len(community_table)),
+        "files": files
+    }
+    with open(os.path.join(output_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+def load_web_view(output_dir: str, level: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load the nodes and edges visible at a zoom level.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory written by ``export_web_view``.
+    level : int
+        Zoom level; 0 is the most zoomed-out.
+
+    Returns
+    -------
+    tuple of pd.DataFrame
+        (nodes, edges) with ``lod <= level``; only matching row groups are read.
+    """
+    nodes = pd.read_parquet(os.path.join(output_dir, "nodes.parquet"), filters=[("lod", "<=", level)])
+    edges = pd.read_parquet(os.path.join(output_dir, "edges.parquet"), filters=[("lod", "<=", level)])
+    return nodes, edges
+
+def load_community_view(output_dir: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load the aggregated community super-nodes and the edges between them.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory written by ``export_web_view``.
+
+    Returns
+    -------
+    tuple of pd.DataFrame
+        (communities, community_edges).
+    """
+    return (
+        pd.read_parquet(os.path.join(output_dir, "communities.parquet")),
+        pd.read_parquet(os.path.join(output_dir, "community_edges.parquet"))
+    )
+
+# Example usage (uncomment for script use):
+# if __name__ == "__main__":
+#     import data_loader, graph_builder
+#     df = data_loader.load_all_connections("../data")
+#     G = graph_builder.build_connection_graph(df, source_col="user_id", target_col="name")
+#     print(export_web_view(G, "../results/web"))
+#     nodes, edges = load_web_view("../results/web", level=0)
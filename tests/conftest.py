@@ -0,0 +1,25 @@
+# conftest.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import pytest
+
+# Keep the default layout cache in memory so tests never write to results/
+os.environ["STRONGTIES_LAYOUT_CACHE"] = ""
+
+@pytest.fixture
+def write_group():
+    """
+    Return a function that writes one ``<member>_connections.csv`` per member
+    into a directory (created if missing), from a mapping of member to rows
+    (a DataFrame or a dict of columns).
+    """
+    def write(data_dir, members):
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for member, rows in members.items():
+            pd.DataFrame(rows).to_csv(data_dir / f"{member}_connections.csv", index=False)
+        return data_dir
+    return write
@@ -0,0 +1,31 @@
+# test_benchmarks.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from benchmarks.datasets import ensure_dataset, parse_scale
+from benchmarks.run_benchmarks import benchmark_scale, compare_runs
+
+def test_dataset_is_reproducible(tmp_path):
+    assert parse_scale("10k") == 10_000 and parse_scale("1m") == 1_000_000 and parse_scale("250") == 250
+    first = ensure_dataset("300", str(tmp_path / "a"), seed=3)
+    second = ensure_dataset("300", str(tmp_path / "b"), seed=3)
+    for name in ("user000_connections.csv", "user001_connections.csv"):
+        a, b = pd.read_csv(os.path.join(first, name)), pd.read_csv(os.path.join(second, name))
+        assert len(a) == 150 and a.equals(b)
+
+def test_benchmark_scale_and_compare(tmp_path):
+    result = benchmark_scale("200", str(tmp_path), centrality_samples=8, max_layout_nodes=0)
+    assert result["rows"] == 200 and result["nodes"] > 0
+    assert result["stages"]["build_connection_graph"]["wall_s"] >= 0
+    assert "skipped" in result["stages"]["compute_layout"]
+
+    current = {"scales": {"1k": {"stages": {"a": {"wall_s": 2.0}, "b": {"wall_s": 0.5}, "c": {"wall_s": 1.01}}}}}
+    baseline = {"scales": {"1k": {"stages": {"a": {"wall_s": 1.0}, "b": {"wall_s": 1.0}, "c": {"wall_s": 1.0}}}}}
+    report = compare_runs(current, baseline).set_index("stage")
+    assert report.loc["a", "status"] == "regression"
+    assert report.loc["b", "status"] == "improved"
+    assert report.loc["c", "status"] == "ok"
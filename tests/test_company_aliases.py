@@ -0,0 +1,94 @@
+# test_company_aliases.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import itertools
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.company_aliases
+from src.company_aliases import CompanyAliases, build_alias_map, company_ngrams, load_company_aliases, strip_company_suffixes
+from src.data_loader import load_all_connections
+from src.target_preferences import TargetPreferences
+
+def test_suffixes_are_stripped_and_variants_share_a_canonical_name():
+    assert strip_company_suffixes("The Acme Co., Inc.") == "acme"
+    assert strip_company_suffixes("The Company") == "company"
+    aliases = CompanyAliases.fit([
+        "Acme Corp", "Acme Corp", "Acme Corporation", "ACME Inc.", "Globex Inc", "Globex",
+        "Bank of America", "Bank of Americas", "General Electric", "General Dynamics",
+        "Acosta and Sons", "Costa and Sons"
+    ])
+    assert {name: aliases.canonicalize(name) for name in ["Acme Corporation", "acme", "Globex Inc", "Bank of Americas"]} == {
+        "Acme Corporation": "acme", "acme": "acme", "Globex Inc": "globex", "Bank of Americas": "bank of america"
+    }
+    assert aliases.canonicalize("General Dynamics") != aliases.canonicalize("General Electric")
+    assert aliases.canonicalize("Costa and Sons") == "costa and sons"
+    # Names never seen while fitting are still suffix-stripped
+    assert aliases.canonicalize("Hooli LLC") == "hooli"
+
+    column = pd.Series(["acme corp", None, "globex inc", "acme corp"], index=[3, 5, 7, 9], name="company")
+    result = aliases.apply(column)
+    assert result.index.tolist() == [3, 5, 7, 9] and result.name == "company"
+    assert result.tolist()[::2] == ["acme", "globex"] and pd.isna(result[5]) and result[9] == "acme"
+    with pytest.raises(ValueError):
+        build_alias_map(["Acme"], threshold=0)
+
+def test_ngram_index_finds_the_same_clusters_as_all_pairs():
+    rng = np.random.default_rng(3)
+    words = ["acme", "globex", "initech", "hooli", "umbrella", "stark", "wayne", "wonka", "cyberdyne", "tyrell"]
+    names = []
+    for first, second in itertools.product(words, ["labs", "systems", "health", "capital", "industries"]):
+        name = f"{first} {second}"
+        names.append(name)
+        for _ in range(2):
+            # Typos: drop or repeat one character
+            i = int(rng.integers(1, len(name) - 1))
+            names.append(name[:i] + name[i + 1:] if rng.random() < 0.5 else name[:i] + name[i] + name[i:])
+    threshold = 0.7
+    aliases = build_alias_map(names, threshold=threshold)
+
+    keys = sorted({strip_company_suffixes(name) for name in names})
+    parent = {key: key for key in keys}
+    def find(key):
+        while parent[key] != key:
+            key = parent[key]
+        return key
+    for a, b in itertools.combinations(keys, 2):
+        A, B = company_ngrams(a), company_ngrams(b)
+        if a[:2] == b[:2] and len(A & B) / len(A | B) >= threshold:
+            parent[find(a)] = find(b)
+    expected = {frozenset(k for k in keys if find(k) == root) for root in {find(k) for k in keys}}
+    found = {}
+    for key in keys:
+        found.setdefault(aliases.get(key, key), set()).add(key)
+    assert {frozenset(group) for group in found.values()} == expected
+    assert len(expected) < len(keys)
+
+def test_aliases_are_cached_and_applied_during_ingestion(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    pd.DataFrame({
+        "First Name": ["Ann", "Bo"], "Last Name": ["Lee", "Park"],
+        "Company": ["Acme Corp", "Globex Inc"], "Position": ["Engineer", "Manager"]
+    }).to_csv(data_dir / "alice_connections.csv", index=False)
+    pd.DataFrame({
+        "First Name": ["Ann", "Cy"], "Last Name": ["Lee", "Diaz"],
+        "Company": ["ACME Inc.", "Acme Corporation"], "Position": ["Engineer", "Analyst"]
+    }).to_csv(data_dir / "bob_connections.csv", index=False)
+    cache_path = str(tmp_path / "cache" / "company_aliases.json")
+
+    aliases = load_company_aliases(str(data_dir), cache_path)
+    df = load_all_connections(str(data_dir), aliases=aliases)
+    # Ann Lee at Acme is listed by both members under different spellings
+    assert sorted(df["company"]) == ["acme", "acme", "globex"]
+    matcher = TargetPreferences(["Acme Corporation", "Globex"]).compile(aliases)
+    assert matcher.match_frame(df).all()
+
+    monkeypatch.setattr(src.company_aliases, "build_alias_map", lambda *args, **kwargs: pytest.fail("cache not used"))
+    assert load_company_aliases(str(data_dir), cache_path).aliases == aliases.aliases
+    monkeypatch.undo()
+    assert load_company_aliases(str(data_dir), cache_path, threshold=1.0).meta["threshold"] == 1.0
@@ -0,0 +1,39 @@
+# test_connection_query.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import pytest
+
+from src.connection_query import ConnectionIndex
+
+def _frame():
+    return pd.DataFrame({
+        "name": ["dana", "ben", "carl", "amy", "eve"],
+        "company": ["Globex", "Initech", "Globex Inc", "Acme", None],
+        "position": ["Engineer", "Manager", "Senior Engineer", "Engineer", "Analyst"],
+        "user_id": ["alice", "alice", "bob", "bob", "bob"]
+    })
+
+def test_filters_and_sorting():
+    index = ConnectionIndex(_frame())
+    result = index.query(contains={"company": "globex"}, sort_by="name")
+    assert result.total == 2
+    assert list(result.rows["name"]) == ["carl", "dana"]
+    result = index.query(filters={"user_id": ["bob"]}, contains={"position": "engineer"}, sort_by="name", descending=True)
+    assert list(result.rows["name"]) == ["carl", "amy"]
+    assert index.values("company") == ["Acme", "Globex", "Globex Inc", "Initech"]
+
+def test_paging_only_returns_requested_rows():
+    index = ConnectionIndex(_frame())
+    result = index.query(sort_by="name", page=2, page_size=2)
+    assert (result.total, result.page, result.pages) == (5, 2, 3)
+    assert list(result.rows["name"]) == ["carl", "dana"]
+    # Out-of-range pages clamp to the last page
+    assert list(index.query(sort_by="name", page=9, page_size=2).rows["name"]) == ["eve"]
+    empty = index.query(filters={"user_id": ["nobody"]})
+    assert (empty.total, empty.pages, len(empty.rows)) == (0, 1, 0)
+    with pytest.raises(ValueError):
+        index.query(sort_by="missing")
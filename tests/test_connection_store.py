@@ -0,0 +1,114 @@
+# test_connection_store.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import pytest
+
+from src.connection_store import ConnectionStore, build_connection_store
+from src.data_loader import load_all_connections
+
+GROUP = {
+    "alice": {
+        "First Name": ["Ann", "Bo", "Cy"],
+        "Last Name": ["Lee", "Park", "Diaz"],
+        "Company": ["Globex Inc.", "Initech", "globex inc"],
+        "Position": ["Senior Product Manager", "Engineer", "Marketing Manager"]
+    },
+    "bob": {
+        "First Name": ["Di"],
+        "Last Name": ["Fox"],
+        "Company": ["Hooli"],
+        "Position": ["Product Designer"]
+    }
+}
+
+def test_queries_match_pandas_filters(tmp_path, write_group):
+    write_group(tmp_path, GROUP)
+    df = load_all_connections(str(tmp_path))
+    with ConnectionStore(str(tmp_path / "store.db")) as store:
+        assert store.load(df) == len(df)
+        # Query values are normalized like the stored columns
+        globex = store.query(company="Globex, Inc")
+        assert globex["name"].tolist() == df.loc[df["company"] == "globex inc", "name"].tolist()
+        assert store.query(position="Product Manager")["name"].tolist() == ["ann lee"]
+        assert store.query(title="manager")["name"].tolist() == ["ann lee", "cy diaz"]
+        assert store.query(title="prod")["name"].tolist() == ["ann lee", "di fox"]
+        assert store.query(title="product", company="hooli", user_id="bob")["name"].tolist() == ["di fox"]
+        assert store.query(user_id=["alice", "bob"], limit=2, offset=1)["name"].tolist() == ["bo park", "cy diaz"]
+        assert store.count(title="manager") == 2 and store.count() == len(df)
+        assert store.query(title="!!!").equals(store.query())
+        # Reloading replaces the rows and keeps the full-text index in step
+        store.load(df[df["user_id"] == "bob"])
+        assert store.count() == 1 and store.query(title="manager").empty
+
+def test_load_rejects_missing_columns_and_rolls_back(tmp_path):
+    with ConnectionStore(str(tmp_path / "store.db")) as store:
+        store.load(pd.DataFrame({"user_id": ["a"], "name": ["x"], "company": ["c"], "position": ["p"]}))
+        with pytest.raises(ValueError):
+            store.load(pd.DataFrame({"name": ["y"]}))
+        with pytest.raises(Exception):
+            store.load(pd.DataFrame({"user_id": [None], "name": ["y"], "company": ["c"], "position": ["p"]}))
+        assert store.query()["name"].tolist() == ["x"]
+
+def test_build_skips_unchanged_sources(tmp_path, write_group, monkeypatch):
+    data_dir = tmp_path / "data"
+    write_group(data_dir, GROUP)
+    db_path = str(tmp_path / "store.db")
+    build_connection_store(str(data_dir), db_path).close()
+
+    import src.data_loader
+    calls = []
+    monkeypatch.setattr(src.data_loader, "load_all_connections", lambda *args, **kwargs: calls.append(args))
+    with build_connection_store(str(data_dir), db_path) as store:
+        assert calls == [] and store.count() == 4
+    monkeypatch.undo()
+
+    pd.DataFrame({"First Name": ["Ed"], "Last Name": ["Ng"], "Company": ["Hooli"], "Position": ["CTO"]}).to_csv(
+        data_dir / "bob_connections.csv", index=False
+    )
+    with build_connection_store(str(data_dir), db_path) as store:
+        assert store.query(company="Hooli")["name"].tolist() == ["ed ng"]
+
+def test_name_filter_matches_wildcards_literally(tmp_path):
+    rows = pd.DataFrame({
+        "user_id": ["a"] * 4,
+        "name": ["ann 100% lee", "ann 1000 lee", "bo_park", "bo\\park"],
+        "company": ["c"] * 4,
+        "position": ["p"] * 4
+    })
+    with ConnectionStore(str(tmp_path / "store.db")) as store:
+        store.load(rows)
+        assert store.query(name="100%")["name"].tolist() == ["ann 100% lee"]
+        assert store.query(name="bo_")["name"].tolist() == ["bo_park"]
+        assert store.query(name="bo\\p")["name"].tolist() == ["bo\\park"]
+        assert store.count(name="ann") == 2
+
+def test_build_rebuilds_on_schema_change(tmp_path, write_group, monkeypatch):
+    data_dir = tmp_path / "data"
+    write_group(data_dir, GROUP)
+    db_path = str(tmp_path / "store.db")
+    build_connection_store(str(data_dir), db_path).close()
+
+    import src.connection_store
+    monkeypatch.setattr(src.connection_store, "SCHEMA_VERSION", "next")
+    with build_connection_store(str(data_dir), db_path) as store:
+        assert store.get_meta("schema_version") == "next" and store.count() == 4
+
+def test_build_respects_alias_threshold(tmp_path, write_group):
+    data_dir = tmp_path / "data"
+    write_group(data_dir, {"alice": {
+        "First Name": ["Ann", "Bo"], "Last Name": ["Lee", "Park"],
+        "Company": ["Globex Inc.", "Globex Corporation"], "Position": ["Engineer", "Engineer"]
+    }})
+    db_path = str(tmp_path / "store.db")
+    with build_connection_store(str(data_dir), db_path, alias_threshold=None) as store:
+        assert store.aliases is None and store.get_meta("alias_threshold") == ""
+        assert store.query()["company"].tolist() == ["globex inc", "globex corporation"]
+    # A different threshold rebuilds the store even though the CSVs are unchanged
+    with build_connection_store(str(data_dir), db_path) as store:
+        assert store.get_meta("alias_threshold") == "0.75" and store.aliases is not None
+        assert store.query()["company"].tolist() == ["globex", "globex"]
+    assert (tmp_path / ".cache" / "company_aliases.json").exists()
@@ -5,9 +5,10 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import os
+import numpy as np
 import pandas as pd
 import pytest
-from src.data_loader import is_safe_path, load_connections, load_all_connections
+from src.data_loader import _KeyRuns, is_safe_path, load_connections, load_all_connections
 
 def test_is_safe_path(tmp_path):
     base_dir = tmp_path
@@ -126,4 +127,36 @@ def test_load_connections_logging(tmp_path, caplog):
     with caplog.at_level("ERROR"):
         with pytest.raises(ValueError):
             load_connections(str(csv_file), "testuser", str(tmp_path))
-        assert any("CSV missing required columns" in m for m in caplog.messages)
\ No newline at end of file
+        assert any("CSV missing required columns" in m for m in caplog.messages)
+def test_load_connections_from_buffer():
+    import io
+    buffer = io.BytesIO(
+        b"First Name,Last Name,Company,Position\n"
+        b"Alice,Smith,Acme Inc,Engineer\n"
+    )
+    df = load_connections(buffer, "testuser", base_dir="/nonexistent")
+    assert df["name"].tolist() == ["alice smith"]
+    assert all(df["user_id"] == "testuser")
+
+def test_load_connection_sources_concurrent():
+    import io
+    from src.data_loader import load_connection_sources
+    sources = [
+        (io.BytesIO(b"First Name,Last Name,Company,Position\nAlice,Smith,Acme Inc,Engineer\n"), "alice"),
+        (io.BytesIO(b"First Name,Last Name,Company,Position\nAlice,Smith,Acme Inc,Engineer\nCarol,White,Globex,Designer\n"), "bob")
+    ]
+    df = load_connection_sources(sources, max_workers=2)
+    assert df["name"].tolist() == ["alice smith", "carol white"]
+    assert df["user_id"].tolist() == ["alice", "bob"]
+
+def test_key_runs_match_a_set():
+    rng = np.random.default_rng(0)
+    runs, expected = _KeyRuns(), set()
+    for size in [5, 0, 40, 3, 3, 100, 1, 17]:
+        keys = rng.integers(0, 200, size).astype(np.uint64)
+        found = runs.contains(keys)
+        assert found.tolist() == [int(k) in expected for k in keys]
+        runs.add(keys[~found])
+        expected.update(int(k) for k in keys)
+    assert len(runs.runs) <= 4
+    assert sorted(np.concatenate(runs.runs).tolist()) == sorted(expected)
@@ -0,0 +1,39 @@
+# test_figure_batch.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import networkx as nx
+
+from src.figure_batch import FigureJob, member_figure_jobs, render_figures
+
+def _group_graph():
+    G = nx.Graph()
+    G.add_edges_from([("alice", "x"), ("alice", "y"), ("bob", "x"), ("bob", "z"), ("z", "w")])
+    return G
+
+def test_member_figure_jobs():
+    jobs = member_figure_jobs(_group_graph(), ["alice", "bob", "nobody"])
+    assert [(j.name, j.kind) for j in jobs] == [
+        ("alice", "network"), ("alice", "communities"), ("bob", "network"), ("bob", "communities")
+    ]
+    assert set(jobs[0].graph.nodes()) == {"alice", "x", "y"}
+
+def test_render_figures_parallel_with_manifest(tmp_path):
+    jobs = member_figure_jobs(_group_graph(), ["alice", "bob"], formats=("png", "svg"))
+    manifest = render_figures(jobs, str(tmp_path), workers=2)
+    assert [e["status"] for e in manifest] == ["ok"] * 4
+    assert (tmp_path / "alice_network.png").exists()
+    assert (tmp_path / "bob_communities.svg").exists()
+    # Network and community figures of the same ego-graph share one cached layout
+    assert len(list((tmp_path / ".layouts").glob("*.npz"))) == 2
+    written = json.loads((tmp_path / "manifest.json").read_text())
+    assert len(written["figures"]) == 4
+
+def test_render_figures_records_errors(tmp_path):
+    jobs = [FigureJob(name="bad", graph=_group_graph(), kind="heatmap")]
+    manifest = render_figures(jobs, str(tmp_path), workers=1)
+    assert manifest[0]["status"] == "error"
+    assert "Unknown figure kind" in manifest[0]["error"]
@@ -0,0 +1,44 @@
+# test_generate_sample_connections.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import pytest
+
+from src.generate_sample_connections import build_pools, generate_group_dataset, generate_synthetic_connections, write_demo_dataset
+
+def _rows(path):
+    return set(map(tuple, pd.read_csv(path).values))
+
+def test_group_dataset_is_reproducible_across_workers(tmp_path):
+    pools = build_pools(seed=1, num_first_names=100, num_last_names=100, num_companies=50)
+    serial = generate_group_dataset(str(tmp_path / "serial"), ["alice", "bob", "carol"], 300, pools=pools, chunk_rows=64, workers=1, seed=7)
+    parallel = generate_group_dataset(str(tmp_path / "parallel"), ["alice", "bob", "carol"], 300, pools=pools, chunk_rows=64, workers=2, seed=7)
+    for a, b in zip(serial["files"], parallel["files"]):
+        assert pd.read_csv(a).equals(pd.read_csv(b))
+    df = pd.read_csv(serial["files"][0])
+    assert list(df.columns) == ["First Name", "Last Name", "Company", "Position"] and len(df) == 300
+
+def test_overlap_controls_shared_contacts(tmp_path):
+    pools = build_pools(seed=1)
+    none = generate_group_dataset(str(tmp_path / "none"), ["alice", "bob"], 500, overlap=0.0, pools=pools, workers=1)
+    full = generate_group_dataset(str(tmp_path / "full"), ["alice", "bob"], 500, overlap=1.0, shared_people=500, pools=pools, workers=1)
+    assert len(_rows(none["files"][0]) & _rows(none["files"][1])) < 10
+    assert len(_rows(full["files"][0]) & _rows(full["files"][1])) > 400
+    with pytest.raises(ValueError):
+        generate_group_dataset(str(tmp_path / "bad"), ["alice_smith"], 10, pools=pools)
+
+def test_synthetic_connections_keeps_shared_names_first():
+    df = generate_synthetic_connections(20, [("Alex", "Morgan")], ["Acme Corp"], ["Consultant"], unique_seed=42)
+    assert len(df) == 20
+    assert tuple(df.iloc[0]) == ("Alex", "Morgan", "Acme Corp", "Consultant")
+
+def test_demo_dataset_shares_the_curated_people_and_companies(tmp_path):
+    alice, bob = (pd.read_csv(path) for path in write_demo_dataset(str(tmp_path)))
+    assert len(alice) == len(bob) == 50
+    names = [set(zip(df["First Name"], df["Last Name"])) for df in (alice, bob)]
+    assert {("Alex", "Morgan"), ("Jordan", "Lee")} <= names[0] & names[1]
+    companies = set(alice["Company"]) | set(bob["Company"])
+    assert {"Acme Corp", "Globex Inc", "Initech"} & companies
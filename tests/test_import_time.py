@@ -0,0 +1,44 @@
+# test_import_time.py
+
+import sys
+import os
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import subprocess
+
+HEAVY = ("matplotlib", "networkx", "scipy")
+
+def _importtime(code: str) -> dict:
+    """Run ``code`` under ``python -X importtime``; return top-level package -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            package = name.strip().split(".")[0]
+            modules[package] = max(modules.get(package, 0), int(cumulative))
+    return modules
+
+def test_package_import_is_lazy():
+    modules = _importtime("import src")
+    assert "src" in modules
+    assert not set(HEAVY + ("pandas",)) & set(modules)
+
+def test_sanitizer_and_loader_skip_heavy_dependencies():
+    modules = _importtime("import src.privacy_sanitizer, src.data_loader")
+    assert not set(HEAVY) & set(modules)
+
+def test_graph_construction_skips_matplotlib():
+    modules = _importtime("from src.data_loader import load_all_connections; from src.graph_builder import build_connection_graph; from src.target_preferences import TargetPreferences")
+    assert "networkx" in modules
+    assert "matplotlib" not in modules
+
+def test_lazy_attribute_loads_on_first_use():
+    modules = _importtime("import src; src.render_network")
+    assert "matplotlib" in modules
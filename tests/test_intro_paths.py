@@ -0,0 +1,85 @@
+# test_intro_paths.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+import networkx as nx
+
+from src.graph_builder import build_adjacency
+from src.intro_paths import find_k_shortest_paths, find_disjoint_paths, find_disjoint_paths_many, IntroPathFinder
+
+def _ladder():
+    # Two routes through x, one longer route through y -> z
+    G = nx.Graph()
+    G.add_edges_from([
+        ("alice", "x"), ("x", "bob"),
+        ("alice", "w"), ("w", "x"),
+        ("alice", "y"), ("y", "z"), ("z", "bob")
+    ])
+    return G
+
+def test_k_shortest_paths_order_and_hop_limit():
+    paths = find_k_shortest_paths(_ladder(), "alice", "bob", k=5, max_hops=3)
+    assert paths[0] == ["alice", "x", "bob"]
+    assert all(len(p) - 1 <= 3 for p in paths)
+    assert len(paths) == 3
+    assert find_k_shortest_paths(_ladder(), "alice", "bob", k=5, max_hops=1) == []
+
+def test_disjoint_paths_use_different_people():
+    paths = find_disjoint_paths(_ladder(), "alice", "bob", k=3)
+    assert paths == [["alice", "x", "bob"], ["alice", "y", "z", "bob"]]
+
+def test_disjoint_paths_direct_edge_once():
+    G = nx.Graph([("a", "b"), ("a", "c"), ("c", "b")])
+    assert find_disjoint_paths(G, "a", "b", k=3) == [["a", "b"], ["a", "c", "b"]]
+
+def test_single_and_batched_disjoint_paths_agree():
+    G = nx.relabel_nodes(nx.gnm_random_graph(300, 900, seed=3), lambda i: f"n{i}")
+    pairs = [(f"n{i}", f"n{(i * 37 + 11) % 300}") for i in range(40)]
+    batched = find_disjoint_paths_many(G, pairs, k=4, max_hops=5)
+    adjacency = build_adjacency(G)
+    for source, target in pairs:
+        paths = find_disjoint_paths(G, source, target, k=4, max_hops=5)
+        assert paths == batched[(source, target)]
+        assert paths == find_disjoint_paths(G, source, target, k=4, max_hops=5, adjacency=adjacency)
+        if paths:
+            assert len(paths[0]) == nx.shortest_path_length(G, source, target) + 1
+            inner = [node for path in paths for node in path[1:-1]]
+            assert len(inner) == len(set(inner))
+
+def test_paths_no_route_and_unknown_node():
+    G = _ladder()
+    G.add_node("carol")
+    assert find_k_shortest_paths(G, "alice", "carol") == []
+    assert find_disjoint_paths(G, "alice", "carol") == []
+    with pytest.raises(ValueError):
+        find_k_shortest_paths(G, "alice", "nobody")
+
+def test_finder_caches_and_invalidates(monkeypatch):
+    G = _ladder()
+    finder = IntroPathFinder(G)
+    calls = []
+    original = find_k_shortest_paths
+    monkeypatch.setattr(
+        "src.intro_paths.find_k_shortest_paths",
+        lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs)
+    )
+    first = finder.k_shortest_paths("alice", "bob", k=3)
+    assert finder.k_shortest_paths("alice", "bob", k=2) == first[:2]
+    assert len(calls) == 1
+    G.add_edge("alice", "bob")
+    assert finder.k_shortest_paths("alice", "bob", k=2)[0] == ["alice", "bob"]
+    assert len(calls) == 2
+
+def test_finder_sees_edits_that_keep_counts_equal():
+    G = nx.Graph([("a", "b"), ("b", "c"), ("a", "d"), ("d", "e")])
+    finder = IntroPathFinder(G)
+    assert finder.k_shortest_paths("a", "c", k=1) == [["a", "b", "c"]]
+    assert finder.disjoint_paths("a", "c") == [["a", "b", "c"]]
+    G.remove_edge("b", "c")
+    G.add_edge("e", "c")
+    finder.invalidate()
+    assert finder.k_shortest_paths("a", "c", k=1) == [["a", "d", "e", "c"]]
+    assert finder.disjoint_paths("a", "c") == [["a", "d", "e", "c"]]
@@ -0,0 +1,69 @@
+# test_intro_scoring.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+import networkx as nx
+
+from src.graph_builder import build_adjacency
+from src.intro_scoring import IntroductionScorer
+
+def _scorer():
+    G = nx.Graph()
+    G.add_edges_from([
+        ("alice", "x"), ("bob", "x"), ("x", "t1"), ("x", "t2"),
+        ("alice", "y"), ("y", "t3"), ("y", "a"), ("y", "b"), ("y", "c")
+    ])
+    centrality = {node: 0.0 for node in G}
+    return IntroductionScorer(G, members=["alice", "bob"], targets=["t1", "t2", "t3"], centrality=centrality)
+
+def test_features():
+    scorer = _scorer()
+    row = scorer.explain("x").set_index("feature")["value"]
+    assert row["degree"] == 4
+    assert row["target_reach"] == 2
+    assert row["member_ties"] == 2
+
+def test_rank_reweighting():
+    scorer = _scorer()
+    assert scorer.rank({"degree": 1.0}, top_k=1)["name"].tolist() == ["y"]
+    top = scorer.rank({"target_reach": 1.0, "member_ties": 1.0}, top_k=2)
+    assert top["name"].tolist()[0] == "x"
+    contributions = top[[c for c in top.columns if c.endswith("_contribution")]].sum(axis=1)
+    assert contributions.tolist() == pytest.approx(top["score"].tolist())
+
+def test_contacts_reach_targets_through_shared_members():
+    # Members only link to their contacts: c1 reaches all three targets
+    # through both members, c2 reaches two through alice and c3 one through bob
+    G = nx.Graph()
+    G.add_edges_from([
+        ("alice", "t1"), ("alice", "t2"), ("alice", "c1"), ("alice", "c2"),
+        ("bob", "t3"), ("bob", "c1"), ("bob", "c3"), ("bob", "c4"), ("bob", "c5")
+    ])
+    scorer = IntroductionScorer(G, members=["alice", "bob"], targets=["t1", "t2", "t3"], centrality={})
+    reach = dict(zip(scorer.nodes, scorer.features[:, 1]))
+    assert (reach["c1"], reach["c2"], reach["c3"], reach["t1"]) == (3, 2, 1, 1)
+    ranked = scorer.rank(top_k=10)["name"].tolist()
+    assert ranked[0] == "c1" and ranked[1] == "c2"
+    assert not {"alice", "bob", "t1", "t2", "t3"} & set(ranked)
+    assert "bob" in scorer.rank(top_k=10, candidates_only=False)["name"].tolist()
+
+def test_target_reach_is_the_same_in_blocks():
+    G = nx.relabel_nodes(nx.barabasi_albert_graph(400, 3, seed=5), str)
+    targets = [str(i) for i in range(0, 400, 3)]
+    scorer = IntroductionScorer(G, targets=targets, centrality={})
+    ids = np.asarray(sorted(scorer._positions[t] for t in targets))
+    A = build_adjacency(G).matrix
+    assert np.array_equal(IntroductionScorer._target_reach(A, ids, block=7), scorer.features[:, 1])
+    assert np.array_equal(IntroductionScorer._target_reach(A, ids, block=1), scorer.features[:, 1])
+
+def test_rank_unknown_feature():
+    with pytest.raises(ValueError):
+        _scorer().rank({"charisma": 1.0})
+
+def test_empty_graph():
+    scorer = IntroductionScorer(nx.Graph(), centrality={})
+    assert scorer.rank().empty
@@ -0,0 +1,122 @@
+# test_jobs.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import pytest
+
+from src.jobs import JobManager, JobCancelled
+
+def _square(ctx, x):
+    ctx.update(0.5, "halfway")
+    return x * x
+
+def test_submit_progress_and_reuse_by_key():
+    manager = JobManager(max_workers=1)
+    job_id = manager.submit(_square, 7, key=("square", 7))
+    assert manager.result(job_id, timeout=5) == 49
+    status = manager.status(job_id)
+    assert status.state == "done" and status.progress == 1.0 and status.message == "halfway"
+    # Same key returns the finished job instead of recomputing
+    assert manager.submit(_square, 7, key=("square", 7)) == job_id
+    assert manager.find(("square", 7)) == job_id
+    manager.shutdown()
+
+def test_cancel_running_job():
+    manager = JobManager(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def slow(ctx):
+        started.set()
+        release.wait(5)
+        ctx.update(0.9)
+        return "finished"
+
+    job_id = manager.submit(slow, key="slow")
+    started.wait(5)
+    assert manager.cancel(job_id)
+    release.set()
+    with pytest.raises(JobCancelled):
+        manager.result(job_id, timeout=5)
+    assert manager.status(job_id).state == "cancelled"
+    # A cancelled job is not reused: resubmitting the key starts a new job
+    assert manager.submit(lambda ctx: "again", key="slow") != job_id
+    manager.shutdown()
+
+def test_failed_job_reports_error():
+    manager = JobManager(max_workers=1)
+
+    def broken(ctx):
+        raise ValueError("bad input")
+
+    job_id = manager.submit(broken)
+    with pytest.raises(RuntimeError, match="bad input"):
+        manager.result(job_id, timeout=5)
+    assert manager.status(job_id).error == "bad input"
+    with pytest.raises(ValueError):
+        manager.status("missing")
+    manager.shutdown()
+
+def _sleep_forever():
+    import time
+    while True:
+        time.sleep(0.05)
+
+def test_process_jobs_are_terminated_on_cancel():
+    manager = JobManager(max_workers=1)
+    assert manager.result(manager.submit(sorted, [3, 1, 2], use_process=True), timeout=30) == [1, 2, 3]
+    with pytest.raises(RuntimeError, match="ValueError"):
+        manager.result(manager.submit(int, "x", use_process=True), timeout=30)
+
+    job_id = manager.submit(_sleep_forever, key="forever", use_process=True)
+    while manager.status(job_id).state != "running":
+        pass
+    assert manager.cancel(job_id)
+    with pytest.raises(JobCancelled):
+        manager.result(job_id, timeout=10)
+    # The pool's only worker is free again
+    assert manager.result(manager.submit(lambda ctx: "next"), timeout=10) == "next"
+    manager.shutdown()
+
+def test_running_key_is_not_resubmitted_while_cancelling():
+    manager = JobManager(max_workers=2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow(ctx):
+        started.set()
+        release.wait(5)
+        ctx.check()
+
+    job_id = manager.submit(slow, key="slow")
+    started.wait(5)
+    manager.cancel(job_id)
+    # Still stopping: the same job is returned instead of a duplicate
+    assert manager.submit(slow, key="slow") == job_id
+    release.set()
+    with pytest.raises(JobCancelled):
+        manager.result(job_id, timeout=5)
+    manager.shutdown()
+
+def test_owner_cancel_only_stops_unshared_jobs():
+    manager = JobManager(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def slow(ctx):
+        started.set()
+        release.wait(5)
+        ctx.check()
+        return "shared"
+
+    job_id = manager.submit(slow, key="shared", owner="session-a")
+    assert manager.submit(slow, key="shared", owner="session-b") == job_id
+    started.wait(5)
+    # session-b still waits for the job, so session-a's cancel leaves it running
+    assert not manager.cancel(job_id, owner="session-a")
+    assert manager.status(job_id).state == "running"
+    assert manager.cancel(job_id, owner="session-b")
+    release.set()
+    with pytest.raises(JobCancelled):
+        manager.result(job_id, timeout=5)
+    manager.shutdown()
@@ -0,0 +1,67 @@
+# test_member_overlap.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import itertools
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import load_all_connections
+from src.member_overlap import MemberOverlapIndex, candidate_probability, choose_bands, jaccard_error_bound
+
+def make_index(seed=1, **kwargs):
+    rng = np.random.default_rng(seed)
+    index = MemberOverlapIndex(**kwargs)
+    # Members in groups of three draw from the same window of contacts
+    for user in range(30):
+        base = (user // 3) * 3000
+        index.add(f"u{user:02d}", [f"p{i}" for i in rng.choice(np.arange(base, base + 8000), 4000, replace=False)])
+    return index
+
+def test_lsh_finds_every_high_overlap_pair_within_error_bounds():
+    index = make_index()
+    truth = {pair for pair in itertools.combinations(index.members, 2) if index.exact(*pair)[0] >= 0.3}
+    pairs = index.overlapping_pairs(threshold=0.3, exact=True)
+    assert truth and set(zip(pairs["user_a"], pairs["user_b"])) == truth
+    assert (pairs["jaccard_exact"] >= pairs["jaccard_low"]).mean() >= 0.9
+    assert (pairs["jaccard_exact"] <= pairs["jaccard_high"]).mean() >= 0.9
+    assert (pairs["shared_contacts"] > 0).all()
+    assert pairs["jaccard_exact"].is_monotonic_decreasing
+
+def test_banding_and_bounds():
+    bands, rows = choose_bands(128, 0.5)
+    assert bands * rows <= 128
+    assert candidate_probability(0.5, bands, rows) >= 0.95
+    assert candidate_probability(0.1, bands, rows) < candidate_probability(0.5, bands, rows)
+    assert jaccard_error_bound(512) < jaccard_error_bound(128) < 0.13
+    with pytest.raises(ValueError):
+        choose_bands(128, 1.5)
+
+def test_signatures_accumulate_and_exact_needs_contacts():
+    whole, parts = MemberOverlapIndex(64), MemberOverlapIndex(64, keep_contacts=False)
+    whole.add("a", ["x", "y", "z"])
+    parts.add("a", ["x", "y"])
+    parts.add("a", ["z"])
+    assert np.array_equal(whole.signatures["a"], parts.signatures["a"])
+    with pytest.raises(ValueError):
+        parts.exact("a", "a")
+
+def test_signatures_are_collected_before_cross_user_duplicates_are_dropped(tmp_path):
+    shared = pd.DataFrame({
+        "First Name": ["Ann", "Bo", "Cy"],
+        "Last Name": ["Lee", "Park", "Diaz"],
+        "Company": ["Globex", "Initech", "Hooli"],
+        "Position": ["Engineer", "Manager", "Analyst"]
+    })
+    shared.to_csv(tmp_path / "alice_connections.csv", index=False)
+    shared.to_csv(tmp_path / "bob_connections.csv", index=False)
+    index = MemberOverlapIndex(64)
+    df = load_all_connections(str(tmp_path), overlap=index)
+    # The combined frame keeps the shared contacts under one member only
+    assert len(df) == 3
+    assert index.sizes == {"alice": 3, "bob": 3}
+    assert index.estimate("alice", "bob") == 1.0
+    assert index.exact("alice", "bob") == (1.0, 3)
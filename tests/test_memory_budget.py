@@ -0,0 +1,63 @@
+# test_memory_budget.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from src.data_loader import load_all_connections, load_connections_partitioned
+from src.graph_builder import build_connection_graph, build_graph_from_chunks
+from src.memory_budget import MemoryBudget, SpillFrame, parse_memory_limit
+
+PEOPLE = pd.DataFrame({
+    "First Name": [f"First{i}" for i in range(25)],
+    "Last Name": [f"Last{i % 7}" for i in range(25)],
+    "Company": [["Globex Inc.", "Initech", "Hooli"][i % 3] for i in range(25)],
+    "Position": [["Senior Engineer", "Manager", "Analyst", "Designer"][i % 4] for i in range(25)]
+})
+# Overlapping contacts across members plus a repeated row within one file
+GROUP = {"alice": pd.concat([PEOPLE.iloc[:15], PEOPLE.iloc[[3]]]), "bob": PEOPLE.iloc[10:]}
+
+def test_parse_memory_limit():
+    assert parse_memory_limit("512MB") == 512 * 2**20
+    assert parse_memory_limit("1.5g") == int(1.5 * 2**30)
+    assert parse_memory_limit(4096) == 4096
+    for bad in ("lots", "-1GB", "0"):
+        with pytest.raises(ValueError):
+            parse_memory_limit(bad)
+
+def test_spill_frame_spills_over_budget(tmp_path):
+    budget = MemoryBudget("1KB")
+    frame = SpillFrame(str(tmp_path), budget)
+    for start in range(0, 300, 100):
+        frame.append(pd.DataFrame({"x": range(start, start + 100)}))
+    assert frame.rows == 300 and len(frame.paths) == 3
+    assert frame.to_frame()["x"].tolist() == list(range(300))
+
+    unbounded = SpillFrame(str(tmp_path / "none"))
+    unbounded.append(pd.DataFrame({"x": [1, 2]}))
+    assert unbounded.paths == [] and not os.path.exists(tmp_path / "none")
+
+    with budget.track("stage"):
+        pass
+    assert budget.peaks()["stage"] > 0
+
+@pytest.mark.parametrize("obfuscate_names", [False, True])
+def test_partitioned_load_matches_full_load(tmp_path, write_group, obfuscate_names):
+    data_dir = tmp_path / "data"
+    write_group(data_dir, GROUP)
+    expected = load_all_connections(str(data_dir), obfuscate_names=obfuscate_names).reset_index(drop=True)
+
+    frame = load_connections_partitioned(
+        str(data_dir), str(tmp_path / "spill"), MemoryBudget("1KB"), chunk_rows=4, obfuscate_names=obfuscate_names
+    )
+    assert frame.paths
+    pd.testing.assert_frame_equal(frame.to_frame(), expected)
+
+    G = build_graph_from_chunks(frame.chunks(["user_id", "name"]))
+    expected_graph = build_connection_graph(expected, source_col="user_id", target_col="name")
+    assert list(G.nodes()) == list(expected_graph.nodes())
+    assert nx.utils.edges_equal(G.edges(), expected_graph.edges())
@@ -2,12 +2,17 @@
 
 import sys
 import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 import pytest
 import networkx as nx
 
-from network_metrics import compute_basic_metrics, get_top_connectors, detect_communities
+import network_metrics
+from network_metrics import (
+    compute_basic_metrics, get_top_connectors, detect_communities,
+    compute_harmonic_centrality, compute_closeness_centrality, compute_sampled_centrality
+)
 
 def test_compute_basic_metrics_simple():
     G = nx.Graph()
@@ -75,4 +80,42 @@ def test_metrics_with_self_loops():
     metrics = compute_basic_metrics(G)
     assert metrics["num_nodes"] == 1
     assert metrics["num_edges"] == 1
-    assert metrics["avg_degree"] == 2.0  # self-loop counts as degree 2
\ No newline at end of file
+    assert metrics["avg_degree"] == 2.0  # self-loop counts as degree 2
+
+def test_centrality_exact_matches_networkx():
+    G = nx.Graph()
+    G.add_edges_from([("A", "B"), ("B", "C"), ("C", "D"), ("B", "D"), ("E", "F")])
+    harmonic = compute_harmonic_centrality(G)
+    closeness = compute_closeness_centrality(G)
+    expected_h = nx.harmonic_centrality(G)
+    expected_c = nx.closeness_centrality(G)
+    for node in G:
+        assert harmonic[node] == pytest.approx(expected_h[node])
+        assert closeness[node] == pytest.approx(expected_c[node])
+
+def test_centrality_sampled_estimate():
+    G = nx.relabel_nodes(nx.connected_watts_strogatz_graph(300, 6, 0.1, seed=1), str)
+    estimate = compute_closeness_centrality(G, sample_size=60, exact_below=0)
+    exact = nx.closeness_centrality(G)
+    errors = [abs(estimate[n] - exact[n]) / exact[n] for n in G]
+    assert sum(errors) / len(errors) < 0.1
+
+def test_sampled_centrality_runs_one_sweep_for_both_measures(monkeypatch):
+    G = nx.relabel_nodes(nx.connected_watts_strogatz_graph(300, 6, 0.1, seed=1), str)
+    expected = (
+        compute_closeness_centrality(G, sample_size=60, exact_below=0),
+        compute_harmonic_centrality(G, sample_size=60, exact_below=0)
+    )
+    calls = []
+    original = network_metrics._pivot_distance_sums
+    monkeypatch.setattr(
+        network_metrics, "_pivot_distance_sums", lambda *args: calls.append(1) or original(*args)
+    )
+    closeness, harmonic = compute_sampled_centrality(G, sample_size=60, exact_below=0)
+    assert closeness == pytest.approx(expected[0]) and harmonic == pytest.approx(expected[1])
+    assert len(calls) == 1
+
+def test_centrality_empty():
+    assert compute_harmonic_centrality(nx.Graph()) == {}
+    assert compute_closeness_centrality(nx.Graph()) == {}
+    assert compute_sampled_centrality(nx.Graph()) == ({}, {})
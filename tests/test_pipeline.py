@@ -0,0 +1,97 @@
+# test_pipeline.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import pytest
+
+from src.pipeline import Pipeline, Stage, run_strongties
+
+GROUP = {
+    "alice": {
+        "First Name": ["Ann", "Bo", "Cy"],
+        "Last Name": ["Lee", "Park", "Diaz"],
+        "Company": ["Globex", "Initech", "Globex"],
+        "Position": ["Engineer", "Manager", "Analyst"]
+    },
+    "bob": {
+        "First Name": ["Ann", "Dee"],
+        "Last Name": ["Lee", "Ng"],
+        "Company": ["Globex", "Hooli"],
+        "Position": ["Engineer", "Designer"]
+    }
+}
+
+def test_unchanged_stages_are_skipped(tmp_path, write_group):
+    data_dir, output_dir = tmp_path / "data", tmp_path / "results"
+    write_group(data_dir, GROUP)
+    config = {"targets": {"companies": ["Globex"]}, "centrality_samples": 8, "figure_formats": ["png"], "dpi": 40}
+
+    first = run_strongties(str(data_dir), str(output_dir), **config)
+    assert [r.status for r in first.values()] == ["ran"] * 7
+    assert (output_dir / "reports" / "introduction_scores.csv").exists()
+    assert (output_dir / "reports" / "target_connectors.csv").exists()
+    assert (output_dir / "figures" / "network.png").exists()
+
+    second = run_strongties(str(data_dir), str(output_dir), **config)
+    assert all(r.status == "cached" for r in second.values())
+
+    # Only the reports depend on top_k
+    third = run_strongties(str(data_dir), str(output_dir), top_k=1, **config)
+    assert {name for name, r in third.items() if r.status == "ran"} == {"reports"}
+    assert len(pd.read_csv(output_dir / "reports" / "introduction_scores.csv")) == 1
+
+    # New input data invalidates everything downstream of ingest
+    pd.DataFrame({"First Name": ["Eve"], "Last Name": ["Ray"], "Company": ["Hooli"], "Position": ["CTO"]}).to_csv(
+        data_dir / "carol_connections.csv", index=False
+    )
+    fourth = run_strongties(str(data_dir), str(output_dir), until="graph", **config)
+    assert list(fourth) == ["ingest", "aliases", "sanitize", "graph"]
+    assert all(r.status == "ran" for r in fourth.values())
+
+def test_force_reruns_dependents_and_bad_stages_raise(tmp_path):
+    calls = []
+
+    def make(name):
+        def run(inputs, params, workdir):
+            calls.append(name)
+            return sum(inputs.values()) + params["n"]
+        return run
+
+    stages = [
+        Stage("a", make("a"), params={"n": 1}),
+        Stage("b", make("b"), deps=("a",), params={"n": 2}),
+        Stage("c", make("c"), params={"n": 3})
+    ]
+    pipeline = Pipeline(stages, str(tmp_path))
+    pipeline.run()
+    assert pipeline.load("b") == 3
+
+    calls.clear()
+    Pipeline(stages, str(tmp_path)).run(force=["a"])
+    assert calls == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        Pipeline(stages, str(tmp_path)).run(until="missing")
+    with pytest.raises(ValueError):
+        Pipeline([Stage("x", make("x"), deps=("y",))], str(tmp_path))
+
+def test_memory_limit_runs_partitioned_with_same_reports(tmp_path, write_group):
+    data_dir = tmp_path / "data"
+    write_group(data_dir, GROUP)
+    config = {"targets": {"companies": ["Globex"]}, "centrality_samples": 8, "until": "reports"}
+    run_strongties(str(data_dir), str(tmp_path / "full"), **config)
+    results = run_strongties(str(data_dir), str(tmp_path / "bounded"), memory_limit="1KB", **config)
+
+    assert all(r.status == "ran" and r.peak_mb > 0 for r in results.values())
+    for name in ("network_metrics.csv", "top_connectors.csv", "introduction_scores.csv", "target_connectors.csv"):
+        pd.testing.assert_frame_equal(
+            pd.read_csv(tmp_path / "bounded" / "reports" / name), pd.read_csv(tmp_path / "full" / "reports" / name)
+        )
+    columns = ["name", "degree", "closeness", "harmonic", "is_member", "is_target"]
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "bounded" / "reports" / "nodes.parquet", columns=columns),
+        pd.read_parquet(tmp_path / "full" / "reports" / "nodes.parquet", columns=columns)
+    )
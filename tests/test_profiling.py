@@ -0,0 +1,46 @@
+# test_profiling.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import pandas as pd
+
+from src.graph_builder import build_connection_graph
+from src.profiling import disable_profiling, enable_profiling, get_trace, span, traced, write_trace
+
+def test_spans_record_nesting_counts_and_resources(tmp_path):
+    df = pd.DataFrame({"user_id": ["alice", "alice", "bob"], "name": ["x", "y", "x"]})
+    enable_profiling()
+    try:
+        with span("pipeline") as stage:
+            G = build_connection_graph(df, source_col="user_id", target_col="name")
+            stage.set(rows=len(df))
+    finally:
+        disable_profiling()
+    records = {r["name"]: r for r in get_trace()}
+    build = records["build_connection_graph"]
+    assert build["parent"] == "pipeline" and build["depth"] == 1
+    assert build["counts"] == {"in_rows": 3, "nodes": 4, "edges": 3}
+    assert records["pipeline"]["counts"] == {"rows": 3}
+    assert build["wall_s"] >= 0 and build["cpu_s"] >= 0
+    assert build["rss_peak_mb"] >= build["rss_start_mb"] > 0
+
+    summary = write_trace(str(tmp_path / "trace.json"))
+    assert set(summary["stage"]) == {"pipeline", "build_connection_graph"}
+    with open(tmp_path / "trace.json") as f:
+        assert len(json.load(f)["spans"]) == 2
+
+def test_disabled_profiling_records_nothing():
+    @traced("noop")
+    def double(x):
+        return 2 * x
+
+    enable_profiling()
+    disable_profiling()
+    with span("ignored") as stage:
+        stage.set(rows=1)
+        assert double(3) == 6
+    assert get_trace() == []
+    assert double.__name__ == "double"
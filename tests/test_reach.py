@@ -0,0 +1,56 @@
+# test_reach.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+import networkx as nx
+
+from src.graph_builder import build_adjacency, graph_fingerprint
+from src.reach import compute_second_degree_reach, get_second_degree_contacts, compute_company_reach
+
+def _group_graph():
+    G = nx.Graph()
+    G.add_edges_from([
+        ("alice", "x"), ("alice", "y"),
+        ("bob", "x"), ("bob", "z"),
+        ("x", "w"), ("y", "w"), ("z", "v")
+    ])
+    return G
+
+def test_graph_fingerprint_order_independent():
+    G1 = nx.Graph([("A", "B"), ("B", "C")])
+    G2 = nx.Graph([("C", "B"), ("B", "A")])
+    assert graph_fingerprint(G1) == graph_fingerprint(G2)
+    G2.add_edge("C", "D")
+    assert graph_fingerprint(G1) != graph_fingerprint(G2)
+
+def test_build_adjacency_symmetric():
+    adj = build_adjacency(_group_graph())
+    assert adj.matrix.shape == (7, 7)
+    assert (adj.matrix != adj.matrix.T).nnz == 0
+    assert adj.matrix[adj.index["alice"], adj.index["x"]] == 1
+
+def test_second_degree_reach_counts():
+    reach = compute_second_degree_reach(_group_graph(), ["alice", "bob"]).set_index("user_id")
+    assert reach.loc["alice", "first_degree"] == 2
+    # alice -> x -> {bob, w}, alice -> y -> {w}
+    assert reach.loc["alice", "second_degree"] == 2
+    # bob -> x -> {alice, w}, bob -> z -> {v}
+    assert reach.loc["bob", "second_degree"] == 3
+
+def test_second_degree_contacts_excludes_first_degree_and_self():
+    contacts = get_second_degree_contacts(_group_graph(), "alice")
+    assert contacts[0] == "w"  # reachable through both x and y
+    assert set(contacts) == {"w", "bob"}
+
+def test_company_reach_table():
+    companies = {"w": "globex", "v": "globex", "bob": "initech"}
+    table = compute_company_reach(_group_graph(), ["alice", "bob"], companies)
+    rows = {(r.user_id, r.company): r.reach for r in table.itertuples()}
+    assert rows == {("alice", "globex"): 1, ("alice", "initech"): 1, ("bob", "globex"): 2}
+
+def test_reach_unknown_member():
+    with pytest.raises(ValueError):
+        compute_second_degree_reach(_group_graph(), ["nobody"])
@@ -0,0 +1,57 @@
+# test_reports.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import networkx as nx
+import pandas as pd
+
+from src.network_metrics import compute_basic_metrics, get_top_connectors
+from src.reports import build_node_table, write_reports
+
+def make_graph():
+    G = nx.Graph()
+    G.add_edges_from([("alice", "x"), ("alice", "y"), ("alice", "z"), ("bob", "z"), ("bob", "w")])
+    G.add_node("loner")
+    nx.set_node_attributes(G, {"alice": True, "bob": True}, "is_member")
+    nx.set_node_attributes(G, {"z": True}, "is_target")
+    return G
+
+def test_node_table_has_one_row_per_node():
+    G = make_graph()
+    communities = {0: ["alice", "x", "y"], 1: ["bob", "z", "w"]}
+    table = build_node_table(G, communities, {"closeness": {"alice": 0.5, "z": 0.25}})
+    assert table["name"].tolist() == list(G.nodes())
+    assert table["degree"].tolist() == [d for _, d in G.degree()]
+    assert dict(zip(table["name"], table["community"])) == {
+        "alice": 0, "x": 0, "y": 0, "z": 1, "bob": 1, "w": 1, "loner": -1
+    }
+    closeness = dict(zip(table["name"], table["closeness"]))
+    assert closeness["alice"] == 0.5 and pd.isna(closeness["loner"])
+    assert table.loc[table["is_member"], "name"].tolist() == ["alice", "bob"]
+    assert table.loc[table["is_target"], "name"].tolist() == ["z"]
+
+def test_write_reports_parquet_streamed_csv_and_summaries(tmp_path):
+    G = make_graph()
+    communities = {0: ["alice", "x", "y"], 1: ["bob", "z", "w"]}
+    paths = write_reports(
+        G, str(tmp_path), compute_basic_metrics(G), communities, {"harmonic": {"alice": 2.0}},
+        top_n=3, csv=True, chunk_rows=2
+    )
+    assert set(paths) == {
+        "nodes.parquet", "nodes.csv", "network_metrics.csv", "top_connectors.csv",
+        "community_sizes.csv", "target_connectors.csv"
+    }
+    nodes = pd.read_parquet(paths["nodes.parquet"])
+    pd.testing.assert_frame_equal(pd.read_csv(paths["nodes.csv"], keep_default_na=False, na_values=[""]), nodes,
+                                  check_dtype=False)
+
+    top = pd.read_csv(paths["top_connectors.csv"])
+    assert list(top.itertuples(index=False, name=None)) == get_top_connectors(G, top_n=3)
+    sizes = pd.read_csv(paths["community_sizes.csv"])
+    assert sizes.to_dict("records") == [
+        {"community_id": 0, "size": 3, "top_member": "alice"},
+        {"community_id": 1, "size": 3, "top_member": "z"}
+    ]
+    assert pd.read_csv(paths["target_connectors.csv"])["matches_target"].tolist() == [False, True, False]
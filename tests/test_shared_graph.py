@@ -0,0 +1,76 @@
+# test_shared_graph.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import pytest
+import networkx as nx
+
+from src.graph_builder import build_adjacency
+from src.intro_paths import find_disjoint_paths, find_disjoint_paths_many
+from src.network_metrics import compute_harmonic_centrality
+from src.reach import compute_second_degree_reach
+from src.shared_graph import SharedAdjacency, worker_matrix
+
+def _graph():
+    return nx.relabel_nodes(nx.connected_watts_strogatz_graph(300, 6, 0.1, seed=4), lambda n: f"n{n}")
+
+def _probe(_):
+    A = worker_matrix()
+    # Attached arrays are views of the shared block, not private copies
+    return [array.flags.owndata or array.flags.writeable for array in (A.indptr, A.indices, A.data)], int(A.sum())
+
+def test_workers_attach_without_copying_and_block_is_unlinked():
+    adjacency = build_adjacency(_graph())
+    with pytest.raises(ValueError):
+        worker_matrix()
+    with SharedAdjacency(adjacency) as shared:
+        assert (shared.matrix != adjacency.matrix).nnz == 0
+        assert not np.shares_memory(shared.matrix.indices, adjacency.matrix.indices)
+        with shared.pool(2, multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(_probe, range(2)))
+        assert results == [([False, False, False], int(adjacency.matrix.sum()))] * 2
+        name = shared.handle.name
+    assert shared.closed and shared.matrix is None
+    shared.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+    with pytest.raises(ValueError):
+        shared.pool(2)
+
+    with pytest.raises(RuntimeError):
+        with SharedAdjacency(adjacency) as shared:
+            name = shared.handle.name
+            raise RuntimeError("query failed")
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+def test_parallel_queries_match_single_process():
+    G = _graph()
+    adjacency = build_adjacency(G)
+    members = list(G.nodes())[:40]
+    reach_single = compute_second_degree_reach(G, members, adjacency=adjacency)
+    reach_parallel = compute_second_degree_reach(G, members, adjacency=adjacency, workers=2)
+    assert reach_parallel.equals(reach_single)
+
+    single = compute_harmonic_centrality(G, sample_size=50, exact_below=0)
+    parallel = compute_harmonic_centrality(G, sample_size=50, exact_below=0, workers=2)
+    assert parallel == pytest.approx(single)
+
+    pairs = [("n0", "n150"), ("n10", "n11"), ("n5", "n5"), ("n42", "n250")]
+    paths = find_disjoint_paths_many(G, pairs, k=3, max_hops=6, workers=2, adjacency=adjacency)
+    assert paths == find_disjoint_paths_many(G, pairs, k=3, max_hops=6, adjacency=adjacency)
+    for (source, target), found in paths.items():
+        expected = find_disjoint_paths(G, source, target, k=3, max_hops=6)
+        assert [len(path) for path in found] == [len(path) for path in expected]
+        intermediaries = [node for path in found for node in path[1:-1]]
+        assert len(intermediaries) == len(set(intermediaries))
+        for path in found:
+            assert path[0] == source and path[-1] == target
+            assert all(G.has_edge(u, v) for u, v in zip(path, path[1:]))
+    with pytest.raises(ValueError):
+        find_disjoint_paths_many(G, [("n0", "nobody")])
@@ -0,0 +1,48 @@
+# test_target_preferences.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import networkx as nx
+
+from src.target_preferences import TargetPreferences, TargetMatcher
+
+def test_add_company_and_role_deduplicate():
+    prefs = TargetPreferences(["Acme Corp"], ["Data Scientist"])
+    prefs.add_company("Acme Corp")
+    prefs.add_company("Globex")
+    prefs.add_role("Data Scientist")
+    assert prefs.to_dict() == {"companies": ["Acme Corp", "Globex"], "roles": ["Data Scientist"]}
+
+def test_matches_is_normalized():
+    prefs = TargetPreferences(["Acme Corp"], ["Product Manager"])
+    assert prefs.matches({"company": "  ACME, Corp. "})
+    assert prefs.matches({"role": "Senior Product Manager"})
+    assert prefs.matches({"position": "Product Manager, Growth"})
+    assert not prefs.matches({"company": "Initech", "position": "Product Designer"})
+
+def test_compile_refreshes_after_add():
+    prefs = TargetPreferences(["Acme Corp"])
+    assert not prefs.matches({"company": "Globex"})
+    prefs.add_company("Globex")
+    assert prefs.matches({"company": "Globex"})
+
+def test_match_frame():
+    matcher = TargetMatcher(["Globex"], ["Data Scientist"])
+    df = pd.DataFrame({
+        "name": ["a", "b", "c", "d"],
+        "company": ["globex", "initech", None, "acme corp"],
+        "position": ["analyst", "lead data scientist", "data scientist", None]
+    })
+    assert matcher.match_frame(df).tolist() == [True, True, True, False]
+
+def test_match_nodes():
+    G = nx.Graph()
+    G.add_node("alice")
+    G.add_node("x", company="Globex Inc", role="Engineer")
+    G.add_node("y", company="globex", role="Engineer")
+    matcher = TargetPreferences(["Globex"]).compile()
+    # Legal-form suffixes are ignored, so "Globex Inc" is the target "Globex"
+    assert matcher.match_nodes(G).tolist() == [False, True, True]
@@ -0,0 +1,109 @@
+# test_visualization.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+import networkx as nx
+
+import src.visualization as visualization
+from src.visualization import LayoutStore, compute_layout
+
+def _graph():
+    return nx.Graph([("alice", "x"), ("x", "bob"), ("bob", "y")])
+
+def test_compute_layout_memory_cache(monkeypatch):
+    store = LayoutStore()
+    calls = []
+    original = visualization._LAYOUTS["spring"]
+    monkeypatch.setitem(visualization._LAYOUTS, "spring", lambda G, **p: calls.append(1) or original(G, **p))
+    first = compute_layout(_graph(), store=store)
+    second = compute_layout(_graph(), store=store)
+    assert len(calls) == 1
+    assert all(np.allclose(first[n], second[n]) for n in first)
+    compute_layout(_graph(), store=store, seed=7)
+    assert len(calls) == 2
+
+def test_layout_store_disk_roundtrip(tmp_path):
+    pos = compute_layout(_graph(), store=LayoutStore(cache_dir=str(tmp_path)))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    fresh = LayoutStore(cache_dir=str(tmp_path))
+    key = LayoutStore.key(_graph(), "spring", {"seed": 42})
+    cached = fresh.get(key)
+    assert set(cached) == set(pos)
+    assert all(np.allclose(cached[n], pos[n]) for n in pos)
+
+def test_default_store_caches_on_disk(tmp_path):
+    import subprocess
+    cache_dir = tmp_path / "layouts"
+    code = (
+        "import networkx as nx, src.visualization as v; "
+        "v.compute_layout(nx.path_graph(4)); print(v._default_store.cache_dir)"
+    )
+    env = {**os.environ, "STRONGTIES_LAYOUT_CACHE": str(cache_dir), "MPLBACKEND": "Agg"}
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == str(cache_dir)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+def test_layout_store_lru_eviction():
+    store = LayoutStore(max_entries=1)
+    store.put("a", {"n": np.zeros(2)})
+    store.put("b", {"n": np.ones(2)})
+    assert store.get("a") is None
+    assert store.get("b") is not None
+
+def test_render_network_batched_and_labels(tmp_path):
+    G = nx.star_graph(50)
+    G = nx.relabel_nodes(G, str)
+    out = tmp_path / "network.svg"
+    fig = visualization.render_network(G, str(out), label_top_k=1, rasterized=True)
+    ax = fig.axes[0]
+    assert len(ax.collections) == 2  # one LineCollection, one scatter
+    assert [t.get_text() for t in ax.texts] == ["0"]
+    assert out.exists()
+
+def test_plots_return_the_figure_above_the_large_graph_threshold(monkeypatch):
+    monkeypatch.setattr(visualization, "LARGE_GRAPH_NODES", 2)
+    fig = visualization.plot_network(_graph())
+    assert fig is not None and len(fig.axes[0].collections) == 2
+    fig = visualization.plot_communities(_graph(), {0: ["alice", "x"], 1: ["bob", "y"]})
+    assert fig.axes[0].get_title() == "Network Communities"
+
+def test_plots_never_show_and_close_saved_figures(tmp_path, monkeypatch):
+    import matplotlib.pyplot as plt
+    monkeypatch.setattr(plt, "show", lambda *args, **kwargs: pytest.fail("plt.show called"))
+    plt.close("all")
+    fig = visualization.plot_network(_graph(), store=LayoutStore())
+    assert plt.fignum_exists(fig.number)
+    plt.close(fig)
+    out = tmp_path / "communities.png"
+    visualization.plot_communities(_graph(), {0: ["alice", "x"], 1: ["bob", "y"]}, str(out), store=LayoutStore())
+    assert out.exists() and plt.get_fignums() == []
+
+def test_render_network_empty(tmp_path):
+    out = tmp_path / "empty.png"
+    visualization.render_network(nx.Graph(), str(out))
+    assert out.exists()
+
+def test_multilevel_layout_places_neighbors_close():
+    G = nx.relabel_nodes(nx.grid_2d_graph(20, 20), str)
+    pos = compute_layout(G, method="multilevel", store=LayoutStore())
+    xy = np.asarray([pos[n] for n in G])
+    assert np.isfinite(xy).all()
+    assert np.abs(xy).max() == pytest.approx(1.0)
+    edge_length = np.mean([np.linalg.norm(pos[u] - pos[v]) for u, v in G.edges()])
+    spread = np.mean(np.linalg.norm(xy - xy.mean(axis=0), axis=1))
+    assert edge_length < 0.25 * spread
+
+def test_multilevel_layout_with_communities_and_isolates():
+    G = nx.Graph([("a", "b"), ("b", "c"), ("d", "e")])
+    G.add_node("z")
+    pos = visualization.multilevel_layout(G, communities={0: ["a", "b", "c"], 1: ["d", "e"]})
+    assert set(pos) == set(G.nodes())
+    assert visualization.multilevel_layout(nx.Graph()) == {}
@@ -0,0 +1,51 @@
+# test_web_export.py
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import pytest
+import networkx as nx
+
+from src.web_export import export_web_view, load_web_view, load_community_view
+
+def _graph():
+    G = nx.Graph()
+    G.add_edges_from([("alice", f"a{i}") for i in range(6)])
+    G.add_edges_from([("bob", f"b{i}") for i in range(3)])
+    G.add_edge("alice", "bob")
+    return G
+
+def test_export_and_load_levels(tmp_path):
+    G = _graph()
+    communities = {0: ["alice"] + [f"a{i}" for i in range(6)], 1: ["bob", "b0", "b1", "b2"]}
+    closeness = nx.closeness_centrality(G)
+    meta = export_web_view(G, str(tmp_path), communities=communities, metrics={"closeness": closeness}, tiers=(2, 5))
+    assert meta["levels"] == 3
+    assert json.loads((tmp_path / "meta.json").read_text())["num_nodes"] == 11
+
+    nodes, edges = load_web_view(str(tmp_path), level=0)
+    assert set(nodes["name"]) == {"alice", "bob"}
+    assert len(edges) == 1
+    assert "closeness" in nodes.columns
+    nodes, edges = load_web_view(str(tmp_path), level=2)
+    assert len(nodes) == 11 and len(edges) == 10
+
+def test_community_super_nodes(tmp_path):
+    G = _graph()
+    communities = {0: ["alice"] + [f"a{i}" for i in range(6)], 1: ["bob", "b0", "b1", "b2"]}
+    export_web_view(G, str(tmp_path), communities=communities)
+    supers, super_edges = load_community_view(str(tmp_path))
+    assert dict(zip(supers["community"], supers["size"])) == {0: 7, 1: 4}
+    assert dict(zip(supers["community"], supers["label"])) == {0: "alice", 1: "bob"}
+    assert super_edges[["source", "target", "weight"]].values.tolist() == [[0, 1, 1]]
+
+def test_large_graphs_skip_community_detection(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.web_export.detect_communities", lambda G: pytest.fail("communities detected"))
+    meta = export_web_view(_graph(), str(tmp_path), max_community_nodes=5)
+    assert meta["num_communities"] == 0
+    nodes, _ = load_web_view(str(tmp_path), level=3)
+    assert len(nodes) == 11 and "community" not in nodes.columns
+    supers, super_edges = load_community_view(str(tmp_path))
+    assert supers.empty and super_edges.empty